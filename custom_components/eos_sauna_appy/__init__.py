@@ -7,12 +7,35 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .anomaly import EosSaunaAnomalyDetector
 from .api import EosSaunaApiClient
+from .capture import EosSaunaBurstCapture
+from .commands import EosSaunaCommandQueue
+from .energy import EosSaunaEnergyEstimator
+from .entity import DATA_DEVICE_INFO, build_device_info
+from .events import EosSaunaEventEmitter
+from .metrics import async_get_metrics_view
+from .preheat import EosSaunaPreheatPlanner
+from .relocate import EosSaunaRelocator, async_forget_search, async_relocate, controller_fingerprint
+from .services import async_setup_services, async_unload_services
+from .session import EosSaunaSessionTracker
+from .statistics import EosSaunaStatisticsAggregator
 from .const import (
     DOMAIN,
+    CONF_SAUNA_IP,
+    CONF_FINGERPRINT,
+    CONF_AUTO_CAPTURE,
+    CONF_HEDGE_READS,
+    CONF_HEATER_POWER,
+    CONF_COMMAND_EXPIRY,
+    DEFAULT_AUTO_CAPTURE,
+    DEFAULT_HEDGE_READS,
+    DEFAULT_HEATER_POWER,
+    DEFAULT_COMMAND_EXPIRY,
     PLATFORMS,
     STARTUP_MESSAGE,
     SCAN_INTERVAL_STATUS,
@@ -27,11 +50,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if hass.data.get(DOMAIN) is None:
         hass.data.setdefault(DOMAIN, {})
         _LOGGER.info(STARTUP_MESSAGE)
+    async_setup_services(hass)
 
-    sauna_ip = entry.data.get("sauna_ip")
+    sauna_ip = entry.data.get(CONF_SAUNA_IP)
 
     session = async_get_clientsession(hass)
-    client = EosSaunaApiClient(sauna_ip, session)
+    client = EosSaunaApiClient(
+        sauna_ip, session, entry.options.get(CONF_HEDGE_READS, DEFAULT_HEDGE_READS)
+    )
 
     # Coordinator for actual status (/usr/eos/is)
     status_coordinator = DataUpdateCoordinator(
@@ -55,39 +81,163 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await settings_coordinator.async_refresh()
 
     if not status_coordinator.last_update_success or not settings_coordinator.last_update_success:
-        raise UpdateFailed("Initial data fetch failed")
+        # The controller may have a new address; search for it while HA retries
+        hass.async_create_background_task(
+            async_relocate(hass, entry), f"{DOMAIN} relocate {entry.entry_id}"
+        )
+        raise ConfigEntryNotReady(f"Initial data fetch from {sauna_ip} failed")
+
+    # Found at its configured address, so no new address needs confirming
+    async_forget_search(hass, entry)
+
+    fingerprint = controller_fingerprint(status_coordinator.data, settings_coordinator.data)
+    if CONF_FINGERPRINT not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_FINGERPRINT: fingerprint}
+        )
+    elif entry.data[CONF_FINGERPRINT] != fingerprint:
+        # Keep the recorded one, so a search still looks for the original controller
+        _LOGGER.warning(
+            f"The controller at {sauna_ip} does not match the one this sauna was set up with; "
+            "if it is the same sauna after a firmware update, remove and re-add it"
+        )
+
+    # Searches the subnet for the controller if it stays unreachable
+    relocator = EosSaunaRelocator(hass, entry, status_coordinator)
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(relocator.async_handle_update)
+    )
+    entry.async_on_unload(relocator.async_cancel)
+
+    # Session statistics are folded in on every status poll
+    sessions = EosSaunaSessionTracker(
+        hass, entry.entry_id, status_coordinator, settings_coordinator
+    )
+    await sessions.async_load()
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(sessions.async_handle_update)
+    )
+
+    # Temperature/humidity are downsampled into long-term statistics; the open
+    # buckets survive a reload or restart in a Store
+    statistics = EosSaunaStatisticsAggregator(
+        hass, entry.entry_id, sauna_ip, status_coordinator
+    )
+    await statistics.async_load()
+    entry.async_on_unload(statistics.async_unload)
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(statistics.async_handle_update)
+    )
+
+    # Slow faults (failing element, open door, stuck sensor) from the T feed
+    anomaly = EosSaunaAnomalyDetector(
+        hass, entry.entry_id, status_coordinator, settings_coordinator
+    )
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(anomaly.async_handle_update)
+    )
+
+    # Heater-on time and energy from the rated power, persisted across restarts
+    energy = EosSaunaEnergyEstimator(
+        hass,
+        entry.entry_id,
+        status_coordinator,
+        settings_coordinator,
+        entry.options.get(CONF_HEATER_POWER, DEFAULT_HEATER_POWER),
+    )
+    await energy.async_load()
+    entry.async_on_unload(energy.async_unload)
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(energy.async_handle_update)
+    )
+
+    # Typed change events, so automations don't have to diff entity states
+    events = EosSaunaEventEmitter(
+        hass, entry.entry_id, status_coordinator, settings_coordinator
+    )
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(events.async_handle_status_update)
+    )
+    entry.async_on_unload(
+        settings_coordinator.async_add_listener(events.async_handle_settings_update)
+    )
+
+    # Opt-in 1 s capture of /is, polled outside the coordinators
+    capture = EosSaunaBurstCapture(
+        hass,
+        entry,
+        client,
+        status_coordinator,
+        entry.options.get(CONF_AUTO_CAPTURE, DEFAULT_AUTO_CAPTURE),
+    )
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(capture.async_handle_update)
+    )
+    entry.async_on_unload(capture.async_stop)
+
+    # Learns the heating curve per session and schedules preheats from it
+    preheat = EosSaunaPreheatPlanner(
+        hass, entry.entry_id, client, status_coordinator, settings_coordinator
+    )
+    await preheat.async_load()
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(preheat.async_handle_update)
+    )
+    entry.async_on_unload(preheat.async_unload)
+
+    # Commands sent while the controller is unreachable, flushed when it recovers
+    expiry = entry.options.get(CONF_COMMAND_EXPIRY, DEFAULT_COMMAND_EXPIRY)
+    commands = EosSaunaCommandQueue(
+        hass, entry, client, status_coordinator, settings_coordinator, expiry * 60
+    )
+    await commands.async_load()  # With queueing disabled, stored commands expire here
+    if expiry:
+        client.command_queue = commands
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(commands.async_handle_update)
+    )
+    entry.async_on_unload(commands.async_unload)
+    commands.async_handle_update()  # Commands queued before a restart
+
+    # Re-render the cached scrape body only when new data arrives
+    metrics_view = async_get_metrics_view(hass)
+    for coordinator in (status_coordinator, settings_coordinator):
+        entry.async_on_unload(coordinator.async_add_listener(metrics_view.async_invalidate))
+    entry.async_on_unload(metrics_view.async_invalidate)
 
     hass.data[DOMAIN][entry.entry_id] = {
         "client": client,
         "status_coordinator": status_coordinator,
         "settings_coordinator": settings_coordinator,
+        "sessions": sessions,
+        "statistics": statistics,
+        "anomaly": anomaly,
+        "capture": capture,
+        "preheat": preheat,
+        "energy": energy,
+        "commands": commands,
+        DATA_DEVICE_INFO: build_device_info(entry),
     }
 
-    for platform in PLATFORMS:
-        hass.async_create_task(
-            hass.config_entries.async_forward_entry_setup(entry, platform)
-        )
+    # Reload when options such as raw history recording change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
-    unloaded = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(entry, platform)
-                for platform in PLATFORMS
-            ]
-        )
-    )
+    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            async_unload_services(hass)
 
     return unloaded
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
\ No newline at end of file
+    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
@@ -0,0 +1,274 @@
+"""Streaming anomaly detection on the temperature feed for EOS Sauna Appy.
+
+The detector is fed one status poll at a time and keeps a fixed handful of
+floats per sauna: exponentially weighted mean/variance of the temperature
+rate of change, a fast estimate of the heating rate, the learned heating rate
+per 10 °C band and a stuck-reading counter. The heating rate is measured
+between whole-degree steps of the reading rather than per poll, since near
+``Td`` a step can take many polls.
+Each sample costs a few arithmetic operations, so it is safe on the event loop.
+"""
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    LOGGER,
+    API_KEY_CURRENT_TEMP,
+    API_KEY_SAUNA_STATE_ACTUAL,
+    API_KEY_TARGET_TEMP_DESIRED,
+    SAUNA_STATES_HEATING,
+    SCAN_INTERVAL_STATUS,
+    EVENT_ANOMALY,
+    ANOMALY_RATE_ALPHA,
+    ANOMALY_STEP_ALPHA,
+    ANOMALY_BASELINE_ALPHA,
+    ANOMALY_Z_THRESHOLD,
+    ANOMALY_OUTLIER_SAMPLES,
+    ANOMALY_WARMUP_SAMPLES,
+    ANOMALY_DROP_RATE,
+    ANOMALY_HEATING_GAP,
+    ANOMALY_BAND_DEGREES,
+    ANOMALY_SLOW_HEATING_RATIO,
+    ANOMALY_SLOW_HEATING_CLEAR_RATIO,
+    ANOMALY_SLOW_HEATING_SAMPLES,
+    ANOMALY_STUCK_SAMPLES,
+    ANOMALY_OVERTEMP_MARGIN,
+)
+
+ANOMALY_RATE_OUTLIER = "rate_outlier"
+ANOMALY_TEMPERATURE_DROP = "temperature_drop"
+ANOMALY_SLOW_HEATING = "slow_heating"
+ANOMALY_STUCK_SENSOR = "stuck_sensor"
+ANOMALY_OVERTEMPERATURE = "overtemperature"
+
+# A gap in polling longer than this resets the rate estimate
+_MAX_SAMPLE_GAP = 5 * SCAN_INTERVAL_STATUS.total_seconds()
+# Bands of the learned heating curve, the last one open-ended
+_BANDS = 12
+
+
+class EosSaunaAnomalyDetector:
+    """Constant-memory anomaly detector fed by each status poll."""
+
+    __slots__ = (
+        "hass",
+        "_entry_id",
+        "_status_coordinator",
+        "_settings_coordinator",
+        "_listeners",
+        "_last_time",
+        "_last_temperature",
+        "_rate_mean",
+        "_rate_var",
+        "_rate_count",
+        "_outlier_count",
+        "_step_time",
+        "_step_temperature",
+        "_step_rate",
+        "_band_rate",
+        "_band_steps",
+        "_slow_count",
+        "_slow_heating",
+        "_stuck_count",
+        "anomalies",
+        "last_rate",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        status_coordinator: DataUpdateCoordinator,
+        settings_coordinator: DataUpdateCoordinator,
+    ) -> None:
+        """Initialize the detector."""
+        self.hass = hass
+        self._entry_id = entry_id
+        self._status_coordinator = status_coordinator
+        self._settings_coordinator = settings_coordinator
+        self._listeners: list[Callable[[], None]] = []
+        self._last_time: float | None = None
+        self._last_temperature: float | None = None
+        self._rate_mean = 0.0
+        self._rate_var = 0.0
+        self._rate_count = 0
+        self._outlier_count = 0
+        self._step_time: float | None = None
+        self._step_temperature: float | None = None
+        self._step_rate: float | None = None # °C per minute
+        self._band_rate = [0.0] * _BANDS
+        self._band_steps = [0] * _BANDS
+        self._slow_count = 0
+        self._slow_heating = False
+        self._stuck_count = 0
+        self.anomalies: frozenset[str] = frozenset()
+        self.last_rate: float | None = None # °C per minute
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for changes of the active anomaly set."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_handle_update(self) -> None:
+        """Process the latest status poll."""
+        status = self._status_coordinator.data
+        if not self._status_coordinator.last_update_success or not status:
+            return
+        settings = self._settings_coordinator.data or {}
+        try:
+            temperature = float(status[API_KEY_CURRENT_TEMP])
+        except (KeyError, TypeError, ValueError):
+            return
+        try:
+            target = float(settings[API_KEY_TARGET_TEMP_DESIRED])
+        except (KeyError, TypeError, ValueError):
+            target = None
+        heating = status.get(API_KEY_SAUNA_STATE_ACTUAL) in SAUNA_STATES_HEATING
+
+        self._update(time.monotonic(), temperature, target, heating)
+
+    def _update(self, now: float, temperature: float, target: float | None, heating: bool) -> None:
+        """Fold one sample into the detector state and re-evaluate anomalies."""
+        last_time = self._last_time
+        last_temperature = self._last_temperature
+        self._last_time = now
+        self._last_temperature = temperature
+
+        if last_time is None or not 0 < now - last_time <= _MAX_SAMPLE_GAP:
+            self.last_rate = None
+            self._stuck_count = 0
+            self._outlier_count = 0
+            self._step_time = self._step_temperature = None
+            return
+
+        rate = (temperature - last_temperature) * 60.0 / (now - last_time)
+        self.last_rate = rate
+        found: set[str] = set()
+
+        # Rate outlier against the EWMA mean/variance of recent rates. Readings
+        # are whole degrees, so the spread is never taken as less than one
+        # degree per poll; otherwise an idle cabin's variance decays to ~0 and
+        # every step of the next heat-up looks like an outlier.
+        std = max(math.sqrt(self._rate_var), 60.0 / (now - last_time))
+        delta = rate - self._rate_mean
+        limit = ANOMALY_Z_THRESHOLD * std
+        if self._rate_count >= ANOMALY_WARMUP_SAMPLES and abs(delta) > limit:
+            self._outlier_count += 1
+            # Fold outliers in clipped, so a genuine change of regime is learned
+            delta = math.copysign(limit, delta)
+        else:
+            self._outlier_count = 0
+        if self._outlier_count >= ANOMALY_OUTLIER_SAMPLES:
+            found.add(ANOMALY_RATE_OUTLIER)
+        self._rate_mean += ANOMALY_RATE_ALPHA * delta
+        self._rate_var = (1 - ANOMALY_RATE_ALPHA) * (self._rate_var + ANOMALY_RATE_ALPHA * delta * delta)
+        self._rate_count += 1
+
+        # Sustained cooling while heating, e.g. a door left open. The smoothed
+        # rate is used because single readings are quantised to whole degrees.
+        if heating and self._rate_count >= ANOMALY_WARMUP_SAMPLES and self._rate_mean <= ANOMALY_DROP_RATE:
+            found.add(ANOMALY_TEMPERATURE_DROP)
+
+        if target is not None:
+            gap = target - temperature
+            if temperature > target + ANOMALY_OVERTEMP_MARGIN:
+                found.add(ANOMALY_OVERTEMPERATURE)
+
+            if heating and gap > ANOMALY_HEATING_GAP:
+                self._update_heating(now, temperature)
+                self._stuck_count = self._stuck_count + 1 if temperature == last_temperature else 0
+                if self._stuck_count >= ANOMALY_STUCK_SAMPLES:
+                    found.add(ANOMALY_STUCK_SENSOR)
+            else:
+                self._stuck_count = 0
+                self._reset_heatup()
+            if self._slow_heating:
+                found.add(ANOMALY_SLOW_HEATING)
+
+        self._set_anomalies(frozenset(found), temperature, target, rate)
+
+    def _update_heating(self, now: float, temperature: float) -> None:
+        """Track the heating rate and latch slow heating with hysteresis."""
+        if self._step_temperature is None:
+            self._step_temperature = temperature
+            return
+        if temperature != self._step_temperature:
+            step_time, step_temperature = self._step_time, self._step_temperature
+            self._step_time = now
+            self._step_temperature = temperature
+            if step_time is None:
+                # The first step only marks where a whole degree starts
+                return
+            rate = (temperature - step_temperature) * 60.0 / (now - step_time)
+            self._step_rate = rate if self._step_rate is None else self._step_rate + ANOMALY_STEP_ALPHA * (rate - self._step_rate)
+            if not self._slow_heating and not self._slow_count:
+                # Only learn the expected curve from normal-looking steps
+                band = _band(step_temperature)
+                self._band_steps[band] += 1
+                alpha = max(ANOMALY_BASELINE_ALPHA, 1 / self._band_steps[band])
+                self._band_rate[band] += alpha * (rate - self._band_rate[band])
+            rate = self._step_rate
+        elif self._step_rate is None:
+            return
+        else:
+            # No step since the last one, so the cabin is heating at most one
+            # degree per elapsed time; a dead heater is noticed between steps
+            rate = min(self._step_rate, 60.0 / (now - self._step_time))
+        band = _band(temperature)
+        if self._band_steps[band] < ANOMALY_WARMUP_SAMPLES or self._band_rate[band] <= 0:
+            return
+
+        # Once raised, slow heating only clears when the rate has clearly recovered
+        ratio = ANOMALY_SLOW_HEATING_CLEAR_RATIO if self._slow_heating else ANOMALY_SLOW_HEATING_RATIO
+        slow = rate < ratio * self._band_rate[band]
+        if slow != self._slow_heating:
+            self._slow_count += 1
+            if self._slow_count >= ANOMALY_SLOW_HEATING_SAMPLES:
+                self._slow_heating = slow
+                self._slow_count = 0
+        else:
+            self._slow_count = 0
+
+    def _reset_heatup(self) -> None:
+        """Forget the current heat-up once the cabin is no longer heating up."""
+        self._step_time = self._step_temperature = self._step_rate = None
+        self._slow_count = 0
+        self._slow_heating = False
+
+    def _set_anomalies(self, anomalies: frozenset[str], temperature: float, target: float | None, rate: float) -> None:
+        """Fire events for new anomalies and notify listeners of changes."""
+        if anomalies == self.anomalies:
+            return
+        for anomaly in anomalies - self.anomalies:
+            LOGGER.warning(f"Sauna anomaly detected: {anomaly} (T={temperature}, Td={target}, rate={rate:.2f} °C/min)")
+            self.hass.bus.async_fire(
+                EVENT_ANOMALY,
+                {
+                    "config_entry_id": self._entry_id,
+                    "type": anomaly,
+                    "temperature": temperature,
+                    "target_temperature": target,
+                    "rate": round(rate, 2),
+                },
+            )
+        self.anomalies = anomalies
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+def _band(temperature: float) -> int:
+    """Return the band of the learned heating curve a temperature falls in."""
+    return min(max(int(temperature // ANOMALY_BAND_DEGREES), 0), _BANDS - 1)
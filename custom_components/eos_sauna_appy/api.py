@@ -1,6 +1,10 @@
 """EOS Sauna Appy API Client."""
 import asyncio
+import ipaddress
+import math
 import socket
+import time
+from collections import deque
 import aiohttp
 import async_timeout
 
@@ -9,9 +13,24 @@ from .const import (
     API_ENDPOINT_STATUS,
     API_ENDPOINT_SETTINGS,
     API_ENDPOINT_CONTROL,
+    API_KEY_SAUNA_STATE_ACTUAL,
+    SAUNA_STATUS_MAP,
+    SAUNA_STATES_FRAME_ERROR,
+    FRAME_ERROR_RETRIES,
+    FRAME_ERROR_RETRY_DELAY,
+    DNS_CACHE_TTL,
 )
 
-TIMEOUT = 10
+# Deadline budgets (seconds) for a whole call, including frame error retries
+TIMEOUT = 10 # Background polls
+TIMEOUT_INTERACTIVE = 4 # Commands and reads someone is waiting on
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Hedged reads wait for the p95 of the most recent latencies of an endpoint
+LATENCY_WINDOW = 100
+HEDGE_MIN_SAMPLES = 20
 
 
 class EosSaunaApiClientError(Exception):
@@ -26,60 +45,345 @@ class EosSaunaApiAuthError(EosSaunaApiClientError):
     """Exception to indicate an authentication error."""
 
 
+class EosSaunaApiFrameError(EosSaunaApiCommunicationError):
+    """Exception to indicate a persistent controller frame error (S=250-255)."""
+
+    def __init__(self, code: int, message: str) -> None:
+        """Initialize with the reported error code."""
+        super().__init__(message)
+        self.code = code
+
+
+class EosSaunaApiCommandQueued(EosSaunaApiCommunicationError):
+    """Exception to indicate a command was queued until the controller recovers."""
+
+
+def is_ip_address(host: str) -> bool:
+    """Return True if host is an IP address literal rather than a hostname."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+def _frame_error(result: dict) -> int | None:
+    """Return the frame error code a response reports, or None."""
+    if not isinstance(result, dict):
+        return None
+    try:
+        code = int(result.get(API_KEY_SAUNA_STATE_ACTUAL))
+    except (TypeError, ValueError):
+        return None
+    return code if code in SAUNA_STATES_FRAME_ERROR else None
+
+
+class EosSaunaClientMetrics:
+    """Request counters and latency histograms of one API client."""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "frame_errors",
+        "latency_buckets",
+        "latency_sum",
+        "recent_latencies",
+        "hedges",
+        "hedges_won",
+        "hedge_saved",
+        "changes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        # Bumped on every record, so a cached rendering knows it is stale
+        self.changes = 0
+        self.requests: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        # Every frame error response by code, including those a retry recovered
+        self.frame_errors: dict[int, int] = {}
+        # Per endpoint: one count per LATENCY_BUCKETS bound plus +Inf
+        self.latency_buckets: dict[str, list[int]] = {}
+        self.latency_sum: dict[str, float] = {}
+        self.recent_latencies: dict[str, deque[float]] = {}
+        # Per endpoint: hedge requests sent, hedges that answered first, and
+        # seconds by which a winning hedge beat the original request
+        self.hedges: dict[str, int] = {}
+        self.hedges_won: dict[str, int] = {}
+        self.hedge_saved: dict[str, float] = {}
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        """Record a finished request."""
+        self.changes += 1
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        buckets = self.latency_buckets.get(endpoint)
+        if buckets is None:
+            buckets = self.latency_buckets[endpoint] = [0] * (len(LATENCY_BUCKETS) + 1)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                break
+        else:
+            index = len(LATENCY_BUCKETS)
+        buckets[index] += 1
+        self.latency_sum[endpoint] = self.latency_sum.get(endpoint, 0.0) + seconds
+        recent = self.recent_latencies.get(endpoint)
+        if recent is None:
+            recent = self.recent_latencies[endpoint] = deque(maxlen=LATENCY_WINDOW)
+        recent.append(seconds)
+
+    def p95(self, endpoint: str) -> float | None:
+        """Return the p95 of the recent latencies, or None with too few samples."""
+        recent = self.recent_latencies.get(endpoint)
+        if recent is None or len(recent) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(recent)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def hedge(self, endpoint: str) -> None:
+        """Record a hedge request."""
+        self.changes += 1
+        self.hedges[endpoint] = self.hedges.get(endpoint, 0) + 1
+
+    def hedge_won(self, endpoint: str) -> None:
+        """Record a hedge request that answered before the original."""
+        self.changes += 1
+        self.hedges_won[endpoint] = self.hedges_won.get(endpoint, 0) + 1
+
+    def hedge_gain(self, endpoint: str, seconds: float) -> None:
+        """Record how much later the original request of a winning hedge finished."""
+        self.changes += 1
+        self.hedge_saved[endpoint] = self.hedge_saved.get(endpoint, 0.0) + seconds
+
+    def error(self, kind: str) -> None:
+        """Record a failed request."""
+        self.changes += 1
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def frame_error(self, code: int) -> None:
+        """Record a response reporting a controller frame error."""
+        self.changes += 1
+        self.frame_errors[code] = self.frame_errors.get(code, 0) + 1
+
+
 class EosSaunaApiClient:
     """EOS Sauna API Client."""
 
-    def __init__(self, sauna_ip: str, session: aiohttp.ClientSession) -> None:
-        """Initialize API client."""
+    __slots__ = (
+        "_sauna_ip",
+        "_session",
+        "_address",
+        "_resolved_at",
+        "_hedge_reads",
+        "_stragglers",
+        "metrics",
+        "command_queue",
+    )
+
+    def __init__(
+        self, sauna_ip: str, session: aiohttp.ClientSession, hedge_reads: bool = False
+    ) -> None:
+        """Initialize API client for an IP address or a hostname."""
         self._sauna_ip = sauna_ip
         self._session = session
-        self._base_url = f"http://{self._sauna_ip}"
+        # Hostnames are resolved once and reused for DNS_CACHE_TTL
+        self._address: str | None = sauna_ip if is_ip_address(sauna_ip) else None
+        self._resolved_at = 0.0
+        self._hedge_reads = hedge_reads
+        # Originals of won hedges, left to finish so their latency is measured
+        self._stragglers: set[asyncio.Future] = set()
+        self.metrics = EosSaunaClientMetrics()
+        # Set by the integration when unsent commands should be queued
+        self.command_queue = None
+
+    @property
+    def host(self) -> str:
+        """Return the host the client talks to."""
+        return self._sauna_ip
+
+    async def _async_base_url(self) -> str:
+        """Return the base URL, resolving a hostname if the cached address expired."""
+        address = self._address
+        if address is None or (
+            address != self._sauna_ip and time.monotonic() - self._resolved_at > DNS_CACHE_TTL
+        ):
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                self._sauna_ip, 80, type=socket.SOCK_STREAM
+            )
+            address = self._address = infos[0][4][0]
+            self._resolved_at = time.monotonic()
+            LOGGER.debug(f"Resolved {self._sauna_ip} to {address}")
+        if ":" in address:
+            return f"http://[{address}]"
+        return f"http://{address}"
+
+    def _expire_address(self) -> None:
+        """Resolve a hostname again on the next request."""
+        if self._address != self._sauna_ip:
+            self._address = None
 
     async def _api_wrapper(
-        self, method: str, url: str, data: dict | None = None, headers: dict | None = None
+        self,
+        method: str,
+        url: str,
+        data: dict | None = None,
+        headers: dict | None = None,
+        timeout: float = TIMEOUT,
     ) -> any:
         """Wrap API calls."""
+        started = time.monotonic()
         try:
-            async with async_timeout.timeout(TIMEOUT):
+            async with async_timeout.timeout(timeout):
+                base_url = await self._async_base_url()
                 response = await self._session.request(
                     method=method,
-                    url=f"{self._base_url}{url}",
+                    url=f"{base_url}{url}",
                     headers=headers,
                     json=data,
                 )
                 if response.status in (401, 403):
+                    self.metrics.error("auth")
                     raise EosSaunaApiAuthError(
                         f"Invalid credentials for {url}: {response.status}"
                     )
                 response.raise_for_status()
-                return await response.json()
+                result = await response.json()
+                self.metrics.observe(url, time.monotonic() - started)
+                return result
+        except EosSaunaApiClientError:
+            raise
         except asyncio.TimeoutError as exception:
+            self.metrics.error("timeout")
+            self._expire_address()
             raise EosSaunaApiCommunicationError(
                 f"Timeout error fetching data from {url}: {exception}"
             ) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
+            self.metrics.error("communication")
+            self._expire_address()
             raise EosSaunaApiCommunicationError(
                 f"Error fetching data from {url}: {exception}"
             ) from exception
         except Exception as exception:
+            self.metrics.error("unknown")
             LOGGER.error(f"Something really wrong happened! - {exception}")
             raise EosSaunaApiClientError(
                 f"Something really wrong happened! - {exception}"
             ) from exception
 
-    async def async_get_status(self) -> dict:
+    async def _hedged_get(self, url: str, timeout: float, delay: float) -> dict:
+        """GET url, sending a second request if the first is slower than delay."""
+        first = asyncio.ensure_future(self._api_wrapper("get", url, timeout=timeout))
+        second = None
+        try:
+            done, _ = await asyncio.wait((first,), timeout=delay)
+            if done:
+                return first.result()
+
+            self.metrics.hedge(url)
+            second = asyncio.ensure_future(self._api_wrapper("get", url, timeout=timeout - delay))
+            pending = {first, second}
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failed = [task for task in done if task.exception() is not None]
+                if failed:
+                    error = error or failed[0].exception()
+                for task in done:
+                    if task in failed:
+                        continue
+                    if task is second:
+                        self.metrics.hedge_won(url)
+                        if first in pending:
+                            self._track_straggler(first, url, time.monotonic())
+                    return task.result()
+            raise error
+        finally:
+            for task in (first, second):
+                if task is not None and not task.done() and task not in self._stragglers:
+                    task.cancel()
+
+    def _track_straggler(self, task: asyncio.Future, url: str, won_at: float) -> None:
+        """Let the original of a won hedge finish and record how late it was."""
+        self._stragglers.add(task)
+
+        def _finished(task: asyncio.Future) -> None:
+            self._stragglers.discard(task)
+            if not task.cancelled() and task.exception() is None:
+                self.metrics.hedge_gain(url, time.monotonic() - won_at)
+
+        task.add_done_callback(_finished)
+
+    async def _request(self, method: str, url: str, data: dict | None, timeout: float) -> dict:
+        """Send one request, hedging idempotent reads if enabled."""
+        if method == "get" and self._hedge_reads:
+            delay = self.metrics.p95(url)
+            if delay is not None and delay < timeout:
+                return await self._hedged_get(url, timeout, delay)
+        return await self._api_wrapper(method, url, data=data, timeout=timeout)
+
+    async def _frame_checked(
+        self, method: str, url: str, data: dict | None = None, budget: float = TIMEOUT
+    ) -> dict:
+        """Call the API within budget seconds, retrying controller frame errors.
+
+        Frame errors are usually a single garbled exchange between the web
+        module and the heater control, so a few quickly spaced attempts clear
+        them. Only if every attempt fails is the error raised, which leaves the
+        coordinator's last good snapshot in place. Retries share the caller's
+        budget rather than each getting a full timeout.
+        """
+        deadline = time.monotonic() + budget
+        for attempt in range(FRAME_ERROR_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(FRAME_ERROR_RETRY_DELAY)
+                if time.monotonic() >= deadline:
+                    break
+            result = await self._request(method, url, data, deadline - time.monotonic())
+            code = _frame_error(result)
+            if code is None:
+                return result
+            self.metrics.frame_error(code)
+            LOGGER.debug(f"Frame error {code} from {url}, attempt {attempt + 1}")
+        self.metrics.error("frame")
+        raise EosSaunaApiFrameError(
+            code,
+            f"{SAUNA_STATUS_MAP[code]} from {url} after {attempt + 1} attempts",
+        )
+
+    async def async_get_status(self, budget: float = TIMEOUT) -> dict:
         """Get the actual status from the sauna."""
-        return await self._api_wrapper("get", API_ENDPOINT_STATUS)
+        return await self._frame_checked("get", API_ENDPOINT_STATUS, budget=budget)
 
-    async def async_get_settings(self) -> dict:
+    async def async_get_settings(self, budget: float = TIMEOUT) -> dict:
         """Get the desired/device settings from the sauna."""
-        return await self._api_wrapper("get", API_ENDPOINT_SETTINGS)
+        return await self._request("get", API_ENDPOINT_SETTINGS, None, budget)
 
     async def async_set_control_value(self, key: str, value: any) -> dict:
         """Set a control value on the sauna."""
-        payload = {key: value}
+        return await self.async_set_control_values({key: value})
+
+    async def async_set_control_values(
+        self, payload: dict, budget: float = TIMEOUT_INTERACTIVE, queue_on_failure: bool = True
+    ) -> dict:
+        """Set several control values on the sauna in one request.
+
+        If the controller cannot be reached and a command queue is attached,
+        the payload is queued and EosSaunaApiCommandQueued is raised.
+        """
         LOGGER.debug(f"Sending control payload: {payload}")
-        return await self._api_wrapper("post", API_ENDPOINT_CONTROL, data=payload)
+        sent_at = time.time()
+        try:
+            result = await self._frame_checked("post", API_ENDPOINT_CONTROL, data=payload, budget=budget)
+        except EosSaunaApiFrameError:
+            raise  # The controller answered; resending won't help
+        except EosSaunaApiCommunicationError as e:
+            if not queue_on_failure or self.command_queue is None:
+                raise
+            self.command_queue.async_enqueue(payload)
+            raise EosSaunaApiCommandQueued(f"{e}; command queued until the controller recovers") from e
+        if self.command_queue is not None:
+            self.command_queue.async_discard(payload, sent_at)
+        return result
 
     async def async_set_light_onoff(self, is_on: bool) -> dict:
         """Turn the light on or off."""
@@ -0,0 +1,66 @@
+"""Binary sensor platform for EOS Sauna Appy."""
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .anomaly import EosSaunaAnomalyDetector
+from .entity import (
+    SOURCE_ANOMALY,
+    EosSaunaEntityDescription,
+    EosSaunaPushEntity,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class EosSaunaBinarySensorEntityDescription(EosSaunaEntityDescription, BinarySensorEntityDescription):
+    """Describes an EOS Sauna binary sensor."""
+
+
+BINARY_SENSOR_DESCRIPTIONS: tuple[EosSaunaBinarySensorEntityDescription, ...] = (
+    EosSaunaBinarySensorEntityDescription(
+        key="temperature_anomaly",
+        name="Temperature Anomaly",
+        source=SOURCE_ANOMALY,
+        unique_id_suffix="temperature_anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the binary sensor platform."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        EosSaunaAnomalyBinarySensor(data[description.source], entry, description)
+        for description in BINARY_SENSOR_DESCRIPTIONS
+    )
+
+
+class EosSaunaAnomalyBinarySensor(EosSaunaPushEntity, BinarySensorEntity):
+    """Representation of the temperature anomaly problem sensor."""
+
+    entity_description: EosSaunaBinarySensorEntityDescription
+    _source: EosSaunaAnomalyDetector
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if any anomaly is active."""
+        return bool(self._source.anomalies)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the active anomaly types."""
+        return {"anomalies": sorted(self._source.anomalies)}
@@ -0,0 +1,65 @@
+"""Fleet-wide command fan-out for EOS Sauna Appy.
+
+One merged ``setcld`` payload is sent per sauna, with at most
+APPLY_CONCURRENCY saunas in flight at once. Every sauna then confirms its own
+command by polling ``setdev`` until the desired keys match. Confirmed settings
+are pushed into the settings coordinator, so no extra refresh is needed.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from .api import TIMEOUT_INTERACTIVE, EosSaunaApiClientError
+from .const import (
+    LOGGER,
+    CONTROL_TO_DESIRED,
+    APPLY_CONCURRENCY,
+    APPLY_CONFIRM_TIMEOUT,
+    APPLY_CONFIRM_INTERVAL,
+)
+
+
+def _matches(settings: dict, payload: dict[str, int]) -> bool:
+    """Return True if the device settings reflect every value of the payload."""
+    return all(
+        str(settings.get(CONTROL_TO_DESIRED[key])) == str(value)
+        for key, value in payload.items()
+    )
+
+
+async def _async_apply_one(
+    data: dict, payload: dict[str, int], semaphore: asyncio.Semaphore
+) -> dict[str, Any]:
+    """Send and confirm one sauna's payload; return its report."""
+    client = data["client"]
+    report: dict[str, Any] = {"success": False, "confirmed": False}
+    started = time.monotonic()
+    try:
+        async with semaphore:
+            await client.async_set_control_values(payload)
+        report["send_ms"] = round((time.monotonic() - started) * 1000)
+
+        deadline = time.monotonic() + APPLY_CONFIRM_TIMEOUT
+        settings = await client.async_get_settings(TIMEOUT_INTERACTIVE)
+        while not _matches(settings, payload) and time.monotonic() < deadline:
+            await asyncio.sleep(APPLY_CONFIRM_INTERVAL)
+            settings = await client.async_get_settings(TIMEOUT_INTERACTIVE)
+        data["settings_coordinator"].async_set_updated_data(settings)
+        report["confirmed"] = _matches(settings, payload)
+        report["success"] = True
+    except EosSaunaApiClientError as e:
+        LOGGER.error(f"Error applying {payload} to {client.host}: {e}")
+        report["error"] = str(e)
+    report["latency_ms"] = round((time.monotonic() - started) * 1000)
+    return report
+
+
+async def async_apply(entries: dict[str, dict], payload: dict[str, int]) -> dict[str, dict[str, Any]]:
+    """Apply a payload to every entry concurrently and report per entry."""
+    semaphore = asyncio.Semaphore(APPLY_CONCURRENCY)
+    reports = await asyncio.gather(
+        *(_async_apply_one(data, payload, semaphore) for data in entries.values())
+    )
+    return dict(zip(entries, reports))
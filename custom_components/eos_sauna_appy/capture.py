@@ -0,0 +1,218 @@
+"""High-resolution burst capture of /is for EOS Sauna Appy.
+
+A capture polls the status endpoint at a high rate from its own background
+task, independent of the coordinators, so entities and the recorder never see
+the extra samples. Samples go into arrays preallocated for the size cap and
+are written as one gzip-compressed CSV file when the capture stops. The arrays
+only exist while a capture runs, so idle saunas carry no buffers.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import time
+from array import array
+from datetime import timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .api import TIMEOUT_INTERACTIVE, EosSaunaApiClient, EosSaunaApiClientError
+from .const import (
+    DOMAIN,
+    LOGGER,
+    API_KEY_CURRENT_TEMP,
+    API_KEY_CURRENT_HUMIDITY,
+    API_KEY_SAUNA_STATE_ACTUAL,
+    CAPTURE_INTERVAL,
+    CAPTURE_MAX_SAMPLES,
+    CAPTURE_MAX_DURATION,
+    CAPTURE_AUTO_STATES,
+)
+
+_NAN = float("nan")
+
+
+def _as_float(value) -> float:
+    """Return value as float, or NaN if it cannot be parsed."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+class EosSaunaBurstCapture:
+    """Opt-in high-rate sampler of the status endpoint."""
+
+    __slots__ = (
+        "hass",
+        "_entry",
+        "_client",
+        "_status_coordinator",
+        "_auto_start",
+        "_last_state",
+        "_task",
+        "_times",
+        "_temperatures",
+        "_humidities",
+        "_states",
+        "_count",
+        "_errors",
+        "_started",
+        "last_file",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: EosSaunaApiClient,
+        status_coordinator: DataUpdateCoordinator,
+        auto_start: bool,
+    ) -> None:
+        """Initialize the capture and preallocate its buffers."""
+        self.hass = hass
+        self._entry = entry
+        self._client = client
+        self._status_coordinator = status_coordinator
+        self._auto_start = auto_start
+        self._last_state = None
+        self._task: asyncio.Task | None = None
+        # One slot per sample, allocated when a capture starts
+        self._times: array | None = None
+        self._temperatures: array | None = None
+        self._humidities: array | None = None
+        self._states: array | None = None
+        self._count = 0
+        self._errors = 0
+        self._started: float | None = None
+        self.last_file: str | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return True while a capture is in progress."""
+        return self._task is not None and not self._task.done()
+
+    @callback
+    def async_handle_update(self) -> None:
+        """Start a capture automatically when the sauna enters a heating mode."""
+        status = self._status_coordinator.data
+        if not self._status_coordinator.last_update_success or not status:
+            return
+        state = status.get(API_KEY_SAUNA_STATE_ACTUAL)
+        if (
+            self._auto_start
+            and state in CAPTURE_AUTO_STATES
+            and self._last_state not in CAPTURE_AUTO_STATES
+            and not self.running
+        ):
+            self.async_start(stop_on_session_end=True)
+        self._last_state = state
+
+    @callback
+    def async_start(
+        self,
+        interval: timedelta = CAPTURE_INTERVAL,
+        duration: timedelta = CAPTURE_MAX_DURATION,
+        stop_on_session_end: bool = False,
+    ) -> bool:
+        """Start a capture; return False if one is already running."""
+        if self.running:
+            return False
+        interval_seconds = interval.total_seconds()
+        duration_seconds = min(duration, CAPTURE_MAX_DURATION).total_seconds()
+        samples = min(CAPTURE_MAX_SAMPLES, int(duration_seconds / interval_seconds) + 1)
+        self._times = array("f", bytes(4 * samples))
+        self._temperatures = array("f", bytes(4 * samples))
+        self._humidities = array("f", bytes(4 * samples))
+        self._states = array("h", bytes(2 * samples))
+        self._count = 0
+        self._errors = 0
+        self._started = dt_util.utcnow().timestamp()
+        self._task = self._entry.async_create_background_task(
+            self.hass,
+            self._async_run(interval_seconds, duration_seconds, stop_on_session_end),
+            f"{DOMAIN} burst capture {self._entry.entry_id}",
+        )
+        LOGGER.info(f"Burst capture started for {self._entry.title}")
+        return True
+
+    async def async_stop(self) -> str | None:
+        """Stop a running capture and return the written file, if any."""
+        if self._task is None:
+            return None
+        if not self._task.done():
+            self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        return await self._async_flush()
+
+    async def _async_run(self, interval: float, duration: float, stop_on_session_end: bool) -> None:
+        """Sample /is until stopped, the session ends or a cap is reached."""
+        loop_start = time.monotonic()
+        next_sample = loop_start
+        capacity = len(self._times)
+        while self._count < capacity:
+            now = time.monotonic()
+            if now - loop_start >= duration:
+                break
+            try:
+                status = await self._client.async_get_status(TIMEOUT_INTERACTIVE)
+            except EosSaunaApiClientError as e:
+                self._errors += 1
+                LOGGER.debug(f"Burst capture sample failed: {e}")
+            else:
+                state = status.get(API_KEY_SAUNA_STATE_ACTUAL)
+                index = self._count
+                self._times[index] = now - loop_start
+                self._temperatures[index] = _as_float(status.get(API_KEY_CURRENT_TEMP))
+                self._humidities[index] = _as_float(status.get(API_KEY_CURRENT_HUMIDITY))
+                self._states[index] = state if isinstance(state, int) else -1
+                self._count = index + 1
+                if stop_on_session_end and state not in CAPTURE_AUTO_STATES:
+                    break
+            next_sample += interval
+            await asyncio.sleep(max(0.0, next_sample - time.monotonic()))
+
+        # Reached a cap or the session ended: flush without waiting for a stop call
+        self._task = None
+        await self._async_flush()
+
+    async def _async_flush(self) -> str | None:
+        """Write the captured samples to a single compressed file."""
+        count = self._count
+        times, temperatures, humidities, states = self._times, self._temperatures, self._humidities, self._states
+        self._times = self._temperatures = self._humidities = self._states = None
+        if not count:
+            return None
+        self._count = 0
+        started = dt_util.utc_from_timestamp(self._started)
+        path = self.hass.config.path(
+            DOMAIN,
+            "captures",
+            f"{self._entry.entry_id}_{started.strftime('%Y%m%dT%H%M%SZ')}.csv.gz",
+        )
+        # Render the body on the loop from the buffers (cheap), write in one go
+        lines = [f"# start={started.isoformat()} errors={self._errors}", "t,temperature,humidity,state"]
+        lines.extend(
+            f"{times[i]:.3f},{temperatures[i]:g},{humidities[i]:g},{states[i]}"
+            for i in range(count)
+        )
+        body = "\n".join(lines).encode() + b"\n"
+        await self.hass.async_add_executor_job(_write_compressed, path, body)
+        LOGGER.info(f"Burst capture of {count} samples written to {path}")
+        self.last_file = path
+        return path
+
+
+def _write_compressed(path: str, body: bytes) -> None:
+    """Write a gzip-compressed file, creating its directory if needed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with gzip.open(path, "wb") as file:
+        file.write(body)
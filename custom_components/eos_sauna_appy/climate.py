@@ -1,9 +1,10 @@
 """Climate platform for EOS Sauna Appy."""
-import asyncio
+from dataclasses import dataclass
 from typing import Any, List, Optional
 
 from homeassistant.components.climate import (
     ClimateEntity,
+    ClimateEntityDescription,
     ClimateEntityFeature,
     HVACMode,
 )
@@ -11,7 +12,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, ATTR_TEMPERATURE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -20,11 +20,36 @@ from .const import (
     API_KEY_SAUNA_STATE_DESIRED, # Sxd (for HVAC mode)
     API_KEY_CURRENT_TEMP, # T
     API_KEY_TARGET_TEMP_DESIRED, # Td
-    MANUFACTURER,
-    NAME as INTEGRATION_NAME,
     SAUNA_STATUS_MAP,
 )
-from .api import EosSaunaApiClient
+from .api import EosSaunaApiClient, EosSaunaApiCommandQueued
+from .entity import (
+    SOURCE_SETTINGS,
+    SOURCE_STATUS,
+    EosSaunaEntity,
+    EosSaunaEntityDescription,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class EosSaunaClimateEntityDescription(EosSaunaEntityDescription, ClimateEntityDescription):
+    """Describes an EOS Sauna climate entity."""
+
+    status_source: str = SOURCE_STATUS
+    status_keys: tuple[str, ...] = ()
+
+
+CLIMATE_DESCRIPTIONS: tuple[EosSaunaClimateEntityDescription, ...] = (
+    EosSaunaClimateEntityDescription(
+        key="sauna_climate",
+        name="Sauna Climate",
+        source=SOURCE_SETTINGS, # Primary coordinator for desired state
+        data_keys=(API_KEY_SAUNA_STATE_DESIRED, API_KEY_TARGET_TEMP_DESIRED),
+        status_keys=(API_KEY_CURRENT_TEMP, API_KEY_SAUNA_STATE_ACTUAL),
+        unique_id_suffix="climate",
+        icon="mdi:sauna",
+    ),
+)
 
 
 async def async_setup_entry(
@@ -32,25 +57,23 @@ async def async_setup_entry(
 ) -> None:
     """Set up the climate platform."""
     data = hass.data[DOMAIN][entry.entry_id]
-    status_coordinator = data["status_coordinator"] # For current temp and actual state
-    settings_coordinator = data["settings_coordinator"] # For target temp and desired state
-    client = data["client"]
-
-    climates = [
+    async_add_entities(
         EosSaunaClimate(
-            status_coordinator,
-            settings_coordinator,
+            data[description.status_source], # For current temp and actual state
+            data[description.source], # For target temp and desired state
             entry,
-            client,
-            "Sauna Climate",
+            data["client"],
+            description,
         )
-    ]
-    async_add_entities(climates)
+        for description in CLIMATE_DESCRIPTIONS
+    )
 
 
-class EosSaunaClimate(CoordinatorEntity, ClimateEntity):
+class EosSaunaClimate(EosSaunaEntity, ClimateEntity):
     """Representation of an EOS Sauna climate entity."""
 
+    entity_description: EosSaunaClimateEntityDescription
+
     # Use settings_coordinator as the primary for desired states
     # but will need status_coordinator for current temperature and actual hvac_action
     def __init__(
@@ -59,44 +82,30 @@ class EosSaunaClimate(CoordinatorEntity, ClimateEntity):
         settings_coordinator, # For target temperature and hvac_mode (desired state)
         config_entry: ConfigEntry,
         client: EosSaunaApiClient,
-        name_suffix: str,
+        description: EosSaunaClimateEntityDescription,
     ):
         """Initialize the climate entity."""
-        super().__init__(settings_coordinator) # Primary coordinator for desired state
+        super().__init__(settings_coordinator, config_entry, description)
         self.status_coordinator = status_coordinator
-        self._config_entry = config_entry
         self._client = client
 
-        self._attr_name = f"{INTEGRATION_NAME} {self._config_entry.data.get('sauna_ip', '')} {name_suffix}"
-        self._attr_unique_id = f"{config_entry.entry_id}_climate"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": f"{INTEGRATION_NAME} ({config_entry.data.get('sauna_ip', '')})",
-            "manufacturer": MANUFACTURER,
-            "model": "Web API Controlled Sauna",
-        }
-
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT] # Sauna is primarily for heating
         self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
         self._attr_min_temp = 30  # Based on HTML form validation
         self._attr_max_temp = 115 # Based on HTML form validation
         self._attr_target_temperature_step = 1.0
-        self._attr_icon = "mdi:sauna"
 
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
+        status_data = self.status_coordinator.data
         return (
-            super().available # Checks settings_coordinator
+            super().available # Checks settings_coordinator and its keys
             and self.status_coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self.status_coordinator.data is not None
-            and API_KEY_SAUNA_STATE_DESIRED in self.coordinator.data # From settings_coordinator
-            and API_KEY_TARGET_TEMP_DESIRED in self.coordinator.data # From settings_coordinator
-            and API_KEY_CURRENT_TEMP in self.status_coordinator.data # From status_coordinator
-            and API_KEY_SAUNA_STATE_ACTUAL in self.status_coordinator.data # From status_coordinator
+            and status_data is not None
+            and all(key in status_data for key in self.entity_description.status_keys)
         )
 
     @property
@@ -161,9 +170,10 @@ class EosSaunaClimate(CoordinatorEntity, ClimateEntity):
         LOGGER.debug(f"Setting target temperature to {temperature}°C via API call.")
         try:
             await self._client.async_set_target_temperature(int(temperature))
-            # Refresh both coordinators as target temp might affect actual status eventually
+            # Td lives in the settings; the status catches up on its next poll
             await self.coordinator.async_request_refresh()
-            await self.status_coordinator.async_request_refresh()
+        except EosSaunaApiCommandQueued as e:
+            LOGGER.warning(f"Could not set the target temperature now: {e}")
         except Exception as e:
             LOGGER.error(f"Error setting target temperature: {e}")
 
@@ -175,13 +185,12 @@ class EosSaunaClimate(CoordinatorEntity, ClimateEntity):
                 await self._client.async_set_sauna_onoff(True)
             elif hvac_mode == HVACMode.OFF:
                 await self._client.async_set_sauna_onoff(False)
-                # Add a small delay to allow the device to process the command
-                await asyncio.sleep(5) # Wait 5 seconds
             else:
                 LOGGER.warning(f"Unsupported HVAC mode: {hvac_mode}")
                 return
-            # Refresh both coordinators
-            await self.coordinator.async_request_refresh() # This is settings_coordinator
-            await self.status_coordinator.async_request_refresh()
+            # Sxd lives in the settings; the status catches up on its next poll
+            await self.coordinator.async_request_refresh()
+        except EosSaunaApiCommandQueued as e:
+            LOGGER.warning(f"Could not set HVAC mode {hvac_mode} now: {e}")
         except Exception as e:
             LOGGER.error(f"Error setting HVAC mode: {e}")
\ No newline at end of file
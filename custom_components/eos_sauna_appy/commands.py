@@ -0,0 +1,231 @@
+"""Durable outbound command queue for EOS Sauna Appy.
+
+When a ``setcld`` request cannot reach the controller, the client hands the
+payload to this queue instead of dropping it. Only the latest value of each
+control key is kept, every value expires after the configured time and the
+queue is saved to a Store, so e.g. a scheduled switch-on still happens after
+a short Wi-Fi dropout or a restart. As soon as a status poll succeeds again,
+everything still queued is sent as one merged ``setcld`` payload.
+"""
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .api import TIMEOUT, EosSaunaApiClient, EosSaunaApiClientError
+from .const import (
+    DOMAIN,
+    LOGGER,
+    COMMAND_STORAGE_VERSION,
+    COMMAND_SAVE_DELAY,
+    COMMAND_EXPIRED_HISTORY,
+)
+
+
+def _iso(timestamp: float) -> str:
+    """Return a timestamp as an ISO 8601 string."""
+    return dt_util.utc_from_timestamp(timestamp).isoformat()
+
+
+class EosSaunaCommandQueue:
+    """Keep control values for an unreachable controller and send them later."""
+
+    __slots__ = (
+        "hass",
+        "_entry",
+        "_client",
+        "_status_coordinator",
+        "_settings_coordinator",
+        "_store",
+        "_expiry",
+        "_commands",
+        "_expired",
+        "_flushing",
+        "_cancel_expiry",
+        "_listeners",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: EosSaunaApiClient,
+        status_coordinator: DataUpdateCoordinator,
+        settings_coordinator: DataUpdateCoordinator,
+        expiry: float,
+    ) -> None:
+        """Initialize an empty queue; expiry is in seconds."""
+        self.hass = hass
+        self._entry = entry
+        self._client = client
+        self._status_coordinator = status_coordinator
+        self._settings_coordinator = settings_coordinator
+        self._store: Store = Store(
+            hass, COMMAND_STORAGE_VERSION, f"{DOMAIN}.commands.{entry.entry_id}"
+        )
+        self._expiry = expiry
+        # Control key -> (value, queued at timestamp)
+        self._commands: dict[str, tuple[Any, float]] = {}
+        # (key, value, queued at, expired at) of recently expired commands
+        self._expired: deque[tuple[str, Any, float, float]] = deque(maxlen=COMMAND_EXPIRED_HISTORY)
+        self._flushing = False
+        self._cancel_expiry: CALLBACK_TYPE | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    async def async_load(self) -> None:
+        """Load commands queued before a restart."""
+        stored = await self._store.async_load()
+        if stored:
+            self._commands = {key: (value, queued_at) for key, (value, queued_at) in stored["commands"].items()}
+            self._expired.extend(tuple(row) for row in stored["expired"])
+            self._async_expire()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for changes of the queue."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @property
+    def queued(self) -> dict[str, dict[str, Any]]:
+        """Return the queued commands for diagnostics."""
+        return {
+            key: {
+                "value": value,
+                "queued_at": _iso(queued_at),
+                "expires_at": _iso(queued_at + self._expiry),
+            }
+            for key, (value, queued_at) in self._commands.items()
+        }
+
+    @property
+    def expired(self) -> list[dict[str, Any]]:
+        """Return the most recently expired commands for diagnostics."""
+        return [
+            {"key": key, "value": value, "queued_at": _iso(queued_at), "expired_at": _iso(expired_at)}
+            for key, value, queued_at, expired_at in self._expired
+        ]
+
+    def __len__(self) -> int:
+        """Return the number of queued commands."""
+        return len(self._commands)
+
+    @callback
+    def async_enqueue(self, payload: dict[str, Any]) -> None:
+        """Queue a payload that could not be sent, replacing older values of its keys."""
+        now = time.time()
+        for key, value in payload.items():
+            self._commands[key] = (value, now)
+        LOGGER.warning(
+            f"Controller at {self._client.host} unreachable, queued {payload} for up to "
+            f"{self._expiry / 60:.0f} minutes"
+        )
+        self._async_changed()
+
+    @callback
+    def async_discard(self, payload: dict[str, Any], sent_at: float) -> None:
+        """Drop queued values superseded by a payload sent at sent_at.
+
+        Values queued after the payload went out are newer and stay queued.
+        """
+        stale = [
+            key for key in payload
+            if key in self._commands and self._commands[key][1] <= sent_at
+        ]
+        for key in stale:
+            del self._commands[key]
+        if stale:
+            self._async_changed()
+
+    @callback
+    def async_handle_update(self) -> None:
+        """Flush the queue once a status poll succeeds again."""
+        if self._commands and not self._flushing and self._status_coordinator.last_update_success:
+            self._entry.async_create_background_task(
+                self.hass, self.async_flush(), f"{DOMAIN} command flush {self._entry.entry_id}"
+            )
+
+    async def async_flush(self) -> None:
+        """Send every queued command as one merged payload."""
+        self._async_expire()
+        if not self._commands or self._flushing:
+            return
+        payload = {key: value for key, (value, _) in self._commands.items()}
+        self._flushing = True
+        try:
+            # A successful send discards the payload's keys from the queue
+            await self._client.async_set_control_values(payload, TIMEOUT, queue_on_failure=False)
+        except EosSaunaApiClientError as e:
+            LOGGER.warning(f"Sending queued commands {payload} to {self._client.host} failed: {e}")
+            return
+        finally:
+            self._flushing = False
+        LOGGER.info(f"Sent queued commands {payload} to {self._client.host}")
+        await self._settings_coordinator.async_request_refresh()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the expiry timer."""
+        if self._cancel_expiry is not None:
+            self._cancel_expiry()
+            self._cancel_expiry = None
+
+    async def async_unload(self) -> None:
+        """Cancel the expiry timer and write the queue out now."""
+        self.async_shutdown()
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_expire(self, _now=None) -> None:
+        """Move commands past their expiry to the expired history."""
+        self.async_shutdown()
+        now = time.time()
+        stale = [key for key, (_, queued_at) in self._commands.items() if now - queued_at >= self._expiry]
+        for key in stale:
+            value, queued_at = self._commands.pop(key)
+            self._expired.append((key, value, queued_at, now))
+            LOGGER.warning(f"Queued command {key}={value} for {self._client.host} expired unsent")
+        if stale:
+            self._async_changed()
+        else:
+            self._async_schedule_expiry()
+
+    @callback
+    def _async_schedule_expiry(self) -> None:
+        """Wake up when the oldest queued command expires."""
+        self.async_shutdown()
+        if self._commands:
+            oldest = min(queued_at for _, queued_at in self._commands.values())
+            self._cancel_expiry = async_call_later(
+                self.hass, max(0.0, oldest + self._expiry - time.time()), self._async_expire
+            )
+
+    @callback
+    def _async_changed(self) -> None:
+        """Save the queue, re-arm the expiry timer and notify listeners."""
+        self._store.async_delay_save(self._data_to_save, COMMAND_SAVE_DELAY)
+        self._async_schedule_expiry()
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "commands": {key: list(command) for key, command in self._commands.items()},
+            "expired": [list(row) for row in self._expired],
+        }
@@ -1,4 +1,6 @@
 """Config flow for EOS Sauna Appy."""
+import re
+
 import voluptuous as vol
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -6,8 +8,37 @@ from homeassistant.config_entries import ConfigFlow, OptionsFlow, ConfigEntry
 from homeassistant.core import callback
 from homeassistant.const import CONF_HOST
 
-from .api import EosSaunaApiClient, EosSaunaApiCommunicationError, EosSaunaApiAuthError
-from .const import DOMAIN, LOGGER, CONF_SAUNA_IP
+from .api import (
+    EosSaunaApiClient,
+    EosSaunaApiCommunicationError,
+    EosSaunaApiAuthError,
+    is_ip_address,
+)
+from .const import (
+    DOMAIN,
+    LOGGER,
+    CONF_SAUNA_IP,
+    CONF_RAW_HISTORY,
+    CONF_AUTO_CAPTURE,
+    CONF_HEDGE_READS,
+    CONF_HEATER_POWER,
+    CONF_COMMAND_EXPIRY,
+    DEFAULT_RAW_HISTORY,
+    DEFAULT_AUTO_CAPTURE,
+    DEFAULT_HEDGE_READS,
+    DEFAULT_HEATER_POWER,
+    DEFAULT_COMMAND_EXPIRY,
+)
+
+HOSTNAME_RE = re.compile(r"^(?=.{1,253}$)([a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?\.)*[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?$", re.I)
+
+
+def validate_host(value: str) -> str:
+    """Return an IP address or hostname, or raise vol.Invalid."""
+    host = cv.string(value).strip()
+    if not is_ip_address(host) and not HOSTNAME_RE.match(host):
+        raise vol.Invalid(f"Invalid IP address or hostname: {value}")
+    return host
 
 
 class EosSaunaAppyConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -20,20 +51,20 @@ class EosSaunaAppyConfigFlow(ConfigFlow, domain=DOMAIN):
         errors = {}
         if user_input is not None:
             try:
-                # Validate the IP address format (basic check)
-                cv.string(user_input[CONF_SAUNA_IP])
+                # Accept an IP address or a hostname
+                host = validate_host(user_input[CONF_SAUNA_IP])
 
                 # Test connection to the sauna
                 session = async_get_clientsession(self.hass)
-                client = EosSaunaApiClient(user_input[CONF_SAUNA_IP], session)
+                client = EosSaunaApiClient(host, session)
                 await client.async_get_status()  # Try to fetch status to confirm connectivity
 
-                await self.async_set_unique_id(user_input[CONF_SAUNA_IP])
+                await self.async_set_unique_id(host)
                 self._abort_if_unique_id_configured()
 
                 return self.async_create_entry(
-                    title=f"EOS Sauna ({user_input[CONF_SAUNA_IP]})",
-                    data={CONF_SAUNA_IP: user_input[CONF_SAUNA_IP]},
+                    title=f"EOS Sauna ({host})",
+                    data={CONF_SAUNA_IP: host},
                 )
             except EosSaunaApiCommunicationError:
                 errors["base"] = "cannot_connect"
@@ -43,7 +74,7 @@ class EosSaunaAppyConfigFlow(ConfigFlow, domain=DOMAIN):
                 LOGGER.error("Authentication error with sauna API (unexpected)")
             except vol.Invalid:
                 errors[CONF_SAUNA_IP] = "invalid_ip"
-                LOGGER.error(f"Invalid IP address format: {user_input[CONF_SAUNA_IP]}")
+                LOGGER.error(f"Invalid IP address or hostname: {user_input[CONF_SAUNA_IP]}")
             except Exception as e:  # pylint: disable=broad-except
                 LOGGER.exception(f"Unexpected exception: {e}")
                 errors["base"] = "unknown"
@@ -70,6 +101,34 @@ class EosSaunaAppyOptionsFlowHandler(OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
-        # Options flow can be expanded later if needed (e.g., scan interval)
-        # For now, we don't have any configurable options post-setup.
-        return self.async_show_form(step_id="init", data_schema=None)
\ No newline at end of file
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_RAW_HISTORY,
+                        default=options.get(CONF_RAW_HISTORY, DEFAULT_RAW_HISTORY),
+                    ): bool,
+                    vol.Optional(
+                        CONF_AUTO_CAPTURE,
+                        default=options.get(CONF_AUTO_CAPTURE, DEFAULT_AUTO_CAPTURE),
+                    ): bool,
+                    vol.Optional(
+                        CONF_HEDGE_READS,
+                        default=options.get(CONF_HEDGE_READS, DEFAULT_HEDGE_READS),
+                    ): bool,
+                    vol.Optional(
+                        CONF_HEATER_POWER,
+                        default=options.get(CONF_HEATER_POWER, DEFAULT_HEATER_POWER),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=36)),
+                    vol.Optional(
+                        CONF_COMMAND_EXPIRY,
+                        default=options.get(CONF_COMMAND_EXPIRY, DEFAULT_COMMAND_EXPIRY),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
+                }
+            ),
+        )
\ No newline at end of file
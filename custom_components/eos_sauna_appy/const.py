@@ -10,18 +10,141 @@ VERSION = "0.1.0"
 ATTRIBUTION = "Data provided by EOS Sauna HTTP API"
 
 # Platforms
-PLATFORMS = ["sensor", "switch", "light", "number", "climate"]
+PLATFORMS = ["sensor", "binary_sensor", "switch", "light", "number", "climate"]
 
 # Configuration and options
 CONF_SAUNA_IP = "sauna_ip"
+CONF_RAW_HISTORY = "raw_history" # Record every polled T/H value as entity state
+CONF_AUTO_CAPTURE = "auto_capture" # Burst-capture /is when a heating mode starts
+CONF_HEDGE_READS = "hedge_reads" # Re-send reads slower than their p95
+CONF_HEATER_POWER = "heater_power" # Rated heater power in kW, for energy estimation
+CONF_FINGERPRINT = "fingerprint" # Entry data: controller fingerprint used to re-locate it
+CONF_COMMAND_EXPIRY = "command_expiry" # Minutes a command waits for an unreachable controller
 
 # Defaults
 DEFAULT_NAME = DOMAIN
+DEFAULT_RAW_HISTORY = True
+DEFAULT_AUTO_CAPTURE = False
+DEFAULT_HEDGE_READS = False
+DEFAULT_HEATER_POWER = 9.0 # kW
+DEFAULT_COMMAND_EXPIRY = 15 # Minutes; 0 disables queueing
 
 # Intervals
 SCAN_INTERVAL_STATUS = timedelta(seconds=10)
 SCAN_INTERVAL_SETTINGS = timedelta(seconds=30)
 
+# Long-term statistics buckets
+STATISTICS_SHORT_PERIOD = timedelta(minutes=5)
+STATISTICS_LONG_PERIOD = timedelta(hours=1)
+STATISTICS_STORAGE_VERSION = 1
+
+# Burst capture
+CAPTURE_INTERVAL = timedelta(seconds=1)
+CAPTURE_MAX_DURATION = timedelta(hours=1)
+CAPTURE_MAX_SAMPLES = 3600
+CAPTURE_AUTO_STATES = (1, 2) # Finnish, BIO; see SAUNA_STATES_HEATER_ON
+
+# Session history
+SESSION_STORAGE_VERSION = 1
+SESSION_RETENTION = 500 # Finished sessions kept per sauna
+SESSION_SAVE_DELAY = 10 # Seconds
+
+# Energy estimation
+ENERGY_STORAGE_VERSION = 1
+ENERGY_SAVE_DELAY = 60 # Seconds; the accumulator changes on every poll while heating
+ENERGY_THERMOSTAT_BAND = 3.0 # °C below Td where the heater starts cycling
+
+# Anomaly detection
+EVENT_ANOMALY = f"{DOMAIN}_anomaly"
+ANOMALY_RATE_ALPHA = 0.1 # EWMA weight of the latest rate sample
+ANOMALY_STEP_ALPHA = 0.3 # EWMA weight of the latest whole-degree step while heating up
+ANOMALY_BASELINE_ALPHA = 0.05 # EWMA weight of a step in the learned heating curve
+ANOMALY_Z_THRESHOLD = 6.0 # Standard deviations for a rate outlier
+ANOMALY_OUTLIER_SAMPLES = 2 # Consecutive outlying rates before one is reported
+ANOMALY_WARMUP_SAMPLES = 20 # Samples (or heat-up steps) before a baseline is trusted
+ANOMALY_DROP_RATE = -1.5 # °C/min, smoothed, while heating
+ANOMALY_HEATING_GAP = 5.0 # °C below Td to consider the cabin heating up
+ANOMALY_BAND_DEGREES = 10.0 # °C per band of the learned heating curve
+ANOMALY_SLOW_HEATING_RATIO = 0.4 # Fraction of the learned heating rate
+ANOMALY_SLOW_HEATING_CLEAR_RATIO = 0.6 # Fraction it must recover to before slow heating clears
+ANOMALY_SLOW_HEATING_SAMPLES = 30 # Consecutive samples (5 min) to raise or clear slow heating
+ANOMALY_STUCK_SAMPLES = 30 # Unchanged readings while heating up
+ANOMALY_OVERTEMP_MARGIN = 10.0 # °C above Td
+
+# Outbound command queue
+COMMAND_STORAGE_VERSION = 1
+COMMAND_SAVE_DELAY = 1 # Seconds; queued commands should survive a restart
+COMMAND_EXPIRED_HISTORY = 10 # Expired commands kept for diagnostics
+
+# Host resolution and re-location after address changes
+DNS_CACHE_TTL = 300 # Seconds a resolved hostname is reused
+DATA_RELOCATE = f"{DOMAIN}_relocate" # hass.data key, kept out of hass.data[DOMAIN]
+RELOCATE_AFTER = 30 # Seconds of failed status polls before searching
+RELOCATE_COOLDOWN = 600 # Seconds between searches for the same entry
+RELOCATE_PREFIX = 24 # Size of the searched subnet around the last address
+RELOCATE_CONCURRENCY = 32 # Addresses probed at the same time
+RELOCATE_PROBE_TIMEOUT = 1.5 # Seconds per probe
+
+# Semantic change events, computed once per snapshot diff
+EVENT_TARGET_REACHED = f"{DOMAIN}_target_reached"
+EVENT_MODE_CHANGED = f"{DOMAIN}_mode_changed"
+EVENT_SETTING_CHANGED = f"{DOMAIN}_setting_changed"
+
+# OpenMetrics endpoint
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+DATA_METRICS_VIEW = f"{DOMAIN}_metrics_view" # hass.data key, kept out of hass.data[DOMAIN]
+
+# Fleet-wide apply
+APPLY_CONCURRENCY = 8 # Saunas commanded at the same time
+APPLY_CONFIRM_TIMEOUT = 15 # Seconds to wait for /setdev to reflect a command
+APPLY_CONFIRM_INTERVAL = 1 # Seconds between confirmation reads
+
+# Preheat planner
+PREHEAT_STORAGE_VERSION = 1
+PREHEAT_TEMP_BIN = 10 # °C per current-temperature bin
+PREHEAT_TEMP_BINS = 12 # Bins cover 0-120 °C
+PREHEAT_TARGET_BANDS = (70, 90) # Target band edges, °C
+PREHEAT_FULL_POWER_GAP = 2 # Only learn while this far below Td, °C
+PREHEAT_MIN_CELL_SECONDS = 60 # Minimum heating time per cell to learn from
+PREHEAT_LEARNING_ALPHA = 0.3 # Weight of the latest session
+PREHEAT_DEFAULT_RATE = 1.0 # °C/min before anything has been learned
+PREHEAT_SAFETY_FACTOR = 1.15
+PREHEAT_MARGIN = timedelta(minutes=5)
+PREHEAT_AMBIENT_TEMPERATURE = 20.0 # °C a cabin cools down to between sessions
+PREHEAT_MAX_AHEAD = timedelta(days=7) # Latest ready time the preheat service accepts
+
+# Controller frame errors (S=250-255) between the web module and the heater control
+FRAME_ERROR_RETRIES = 3 # Extra attempts before a frame error is surfaced
+FRAME_ERROR_RETRY_DELAY = 0.2 # Seconds between attempts
+
+# Profiling
+DATA_PROFILER = f"{DOMAIN}_profiler" # hass.data key, kept out of hass.data[DOMAIN]
+PROFILE_DEFAULT_DURATION = timedelta(seconds=60)
+PROFILE_MAX_DURATION = timedelta(minutes=30)
+PROFILE_LOOP_SAMPLE_INTERVAL = 0.05 # Seconds between event loop lag samples
+PROFILE_LOOP_BLOCKED_THRESHOLD = 0.1 # Seconds of lag counted as blocked
+
+# Services
+SERVICE_GET_SESSIONS = "get_sessions"
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+SERVICE_APPLY = "apply"
+SERVICE_PREHEAT = "preheat"
+SERVICE_CANCEL_PREHEAT = "cancel_preheat"
+SERVICE_PROFILE = "profile"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_SINCE = "since"
+ATTR_LIMIT = "limit"
+ATTR_INTERVAL = "interval"
+ATTR_DURATION = "duration"
+ATTR_SAUNA_ON = "sauna_on"
+ATTR_TARGET_TEMPERATURE = "target_temperature"
+ATTR_TARGET_HUMIDITY = "target_humidity"
+ATTR_VAPORIZER_ON = "vaporizer_on"
+ATTR_LIGHT_ON = "light_on"
+ATTR_LIGHT_INTENSITY = "light_intensity"
+ATTR_READY_AT = "ready_at"
+
 
 STARTUP_MESSAGE = f"""
 -------------------------------------------------------------------
@@ -43,7 +166,16 @@ API_KEY_SAUNA_STATE_ACTUAL = "S" # 0: Inactive, 1: Finnish, 2: BIO, 3: After bur
 API_KEY_LIGHT_STATE_ACTUAL = "L" # 0: Off, 1: On (seems to be binary from example)
 API_KEY_CURRENT_TEMP = "T"
 API_KEY_CURRENT_HUMIDITY = "H"
-# Other keys from /usr/eos/is: E, R, BT, TNowH, TNowM, TAHM, TAHS, THOnH, THOnM, THOnS
+API_KEY_ERROR_CODE = "E" # Controller error code
+API_KEY_STATUS_R = "R" # Undocumented, exposed raw
+API_KEY_STATUS_BT = "BT" # Undocumented, exposed raw
+API_KEY_CLOCK_HOUR = "TNowH" # Controller clock, hours
+API_KEY_CLOCK_MINUTE = "TNowM" # Controller clock, minutes
+API_KEY_REMAINING_MINUTES = "TAHM" # Remaining heating time, minutes
+API_KEY_REMAINING_SECONDS = "TAHS" # Remaining heating time, seconds
+API_KEY_HEATER_ON_HOURS = "THOnH" # Heater on time, hours
+API_KEY_HEATER_ON_MINUTES = "THOnM" # Heater on time, minutes
+API_KEY_HEATER_ON_SECONDS = "THOnS" # Heater on time, seconds
 
 # API Keys from /usr/eos/setdev (Desired/Device Settings)
 API_KEY_LIGHT_STATE_DESIRED = "Lxd" # 0: Off, 1: On
@@ -52,7 +184,11 @@ API_KEY_VAPOR_STATE_DESIRED = "Vxd" # 0: Off, 1: On
 API_KEY_LIGHT_INTENSITY_DESIRED = "Ld" # Percentage
 API_KEY_TARGET_TEMP_DESIRED = "Td" # Celsius
 API_KEY_TARGET_HUMIDITY_DESIRED = "Hd" # Percentage
-# Other keys from /usr/eos/setdev: Cxd, AHxd, SOnAck, TStHd, TStMd
+API_KEY_COLOR_LIGHT_DESIRED = "Cxd" # 0: Off, 1: On
+API_KEY_AUTO_HEAT_DESIRED = "AHxd" # 0: Off, 1: On
+API_KEY_SAUNA_ON_ACK = "SOnAck" # Acknowledge flag for remote switch-on
+API_KEY_START_HOUR_DESIRED = "TStHd" # Preset start time, hours
+API_KEY_START_MINUTE_DESIRED = "TStMd" # Preset start time, minutes
 
 # API Keys for /usr/eos/setcld (Control)
 API_KEY_CONTROL_LIGHT_ONOFF = "Lxc" # 1 for ON, 0 for OFF
@@ -62,6 +198,16 @@ API_KEY_CONTROL_LIGHT_INTENSITY = "Lc" # Percentage
 API_KEY_CONTROL_TARGET_TEMP = "Tc" # Celsius
 API_KEY_CONTROL_TARGET_HUMIDITY = "Hc" # Percentage
 
+# Control key -> /usr/eos/setdev key that reflects it
+CONTROL_TO_DESIRED = {
+    API_KEY_CONTROL_SAUNA_ONOFF: API_KEY_SAUNA_STATE_DESIRED,
+    API_KEY_CONTROL_TARGET_TEMP: API_KEY_TARGET_TEMP_DESIRED,
+    API_KEY_CONTROL_TARGET_HUMIDITY: API_KEY_TARGET_HUMIDITY_DESIRED,
+    API_KEY_CONTROL_VAPOR_ONOFF: API_KEY_VAPOR_STATE_DESIRED,
+    API_KEY_CONTROL_LIGHT_ONOFF: API_KEY_LIGHT_STATE_DESIRED,
+    API_KEY_CONTROL_LIGHT_INTENSITY: API_KEY_LIGHT_INTENSITY_DESIRED,
+}
+
 # Sauna Status Mapping
 SAUNA_STATUS_MAP = {
     0: "Inactive",
@@ -76,6 +222,10 @@ SAUNA_STATUS_MAP = {
     254: "Error: No Read/Write Frame",
     255: "Error: No Status Info",
 }
+SAUNA_STATES_HEATING = (1, 2, 3) # Finnish, BIO, After burner
+SAUNA_STATES_HEATER_ON = (1, 2) # Finnish, BIO
+SAUNA_STATES_FAULT = (4, 250, 251, 252, 253, 254, 255)
+SAUNA_STATES_FRAME_ERROR = (250, 251, 252, 253, 254, 255) # Transient bus glitches, retried
 
 # Device Info
 MANUFACTURER = "EOS Saunatechnik GmbH"
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""Heater duty-cycle and energy estimation for EOS Sauna Appy.
+
+The controller does not meter energy, so it is estimated from the heater's
+rated power and how long the heater was on. Between two status polls the
+heater counts as on while the sauna reports Finnish or BIO mode and the cabin
+is still well below ``Td``. Near ``Td`` the thermostat cycles the elements, so
+there the heater counts as on only while the temperature rises, or holds
+below ``Td``. The totals are two floats, saved to a Store with a long delay
+and written out when the entry unloads.
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    DOMAIN,
+    API_KEY_CURRENT_TEMP,
+    API_KEY_SAUNA_STATE_ACTUAL,
+    API_KEY_TARGET_TEMP_DESIRED,
+    SAUNA_STATES_HEATER_ON,
+    SCAN_INTERVAL_STATUS,
+    ENERGY_STORAGE_VERSION,
+    ENERGY_SAVE_DELAY,
+    ENERGY_THERMOSTAT_BAND,
+)
+
+# A gap in polling longer than this is not attributed to either state
+_MAX_SAMPLE_GAP = 5 * SCAN_INTERVAL_STATUS.total_seconds()
+
+
+class EosSaunaEnergyEstimator:
+    """Integrate heater-on time and energy from status polls."""
+
+    __slots__ = (
+        "hass",
+        "_status_coordinator",
+        "_settings_coordinator",
+        "_store",
+        "_power_kw",
+        "_listeners",
+        "_last_time",
+        "_last_temperature",
+        "_last_heater_mode",
+        "_run_on",
+        "_run_total",
+        "energy_kwh",
+        "heater_seconds",
+        "duty_cycle",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        status_coordinator: DataUpdateCoordinator,
+        settings_coordinator: DataUpdateCoordinator,
+        power_kw: float,
+    ) -> None:
+        """Initialize the estimator."""
+        self.hass = hass
+        self._status_coordinator = status_coordinator
+        self._settings_coordinator = settings_coordinator
+        self._store: Store = Store(
+            hass, ENERGY_STORAGE_VERSION, f"{DOMAIN}.energy.{entry_id}"
+        )
+        self._power_kw = power_kw
+        self._listeners: list[Callable[[], None]] = []
+        self._last_time: float | None = None
+        self._last_temperature: float | None = None
+        self._last_heater_mode = False
+        # Heater-on and total seconds of the current heating run
+        self._run_on = 0.0
+        self._run_total = 0.0
+        self.energy_kwh = 0.0
+        self.heater_seconds = 0.0
+        self.duty_cycle: float | None = None # % of the current or last heating run
+
+    async def async_load(self) -> None:
+        """Load the stored totals."""
+        stored = await self._store.async_load()
+        if stored:
+            self.energy_kwh = stored.get("energy_kwh", 0.0)
+            self.heater_seconds = stored.get("heater_seconds", 0.0)
+
+    async def async_unload(self) -> None:
+        """Write the totals out, so a reload does not load older ones."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def async_restore_minimum(self, attribute: str, value: float) -> None:
+        """Raise a total to at least the value its sensor last reported.
+
+        A total_increasing sensor that drops counts as a meter reset, so a
+        Store older than the last reported state must not win.
+        """
+        if attribute in ("energy_kwh", "heater_seconds") and value > getattr(self, attribute):
+            setattr(self, attribute, value)
+            self._store.async_delay_save(self._data_to_save, ENERGY_SAVE_DELAY)
+            for update_callback in list(self._listeners):
+                update_callback()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for changes of the totals."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_handle_update(self) -> None:
+        """Attribute the time since the previous status poll."""
+        status = self._status_coordinator.data
+        if not self._status_coordinator.last_update_success or not status:
+            return
+        try:
+            temperature = float(status[API_KEY_CURRENT_TEMP])
+        except (KeyError, TypeError, ValueError):
+            return
+        try:
+            target = float((self._settings_coordinator.data or {})[API_KEY_TARGET_TEMP_DESIRED])
+        except (KeyError, TypeError, ValueError):
+            target = None
+        heater_mode = status.get(API_KEY_SAUNA_STATE_ACTUAL) in SAUNA_STATES_HEATER_ON
+        now = time.monotonic()
+
+        last_time = self._last_time
+        last_temperature = self._last_temperature
+        was_heater_mode = self._last_heater_mode
+        self._last_time = now
+        self._last_temperature = temperature
+        self._last_heater_mode = heater_mode
+
+        if heater_mode and not was_heater_mode:
+            self._run_on = 0.0
+            self._run_total = 0.0
+        if not was_heater_mode or last_time is None:
+            return
+        seconds = now - last_time
+        if not 0 < seconds <= _MAX_SAMPLE_GAP:
+            return
+
+        # The state seen at the previous poll held for the whole interval
+        heater_on = (
+            target is None
+            or last_temperature < target - ENERGY_THERMOSTAT_BAND
+            or temperature > last_temperature
+            or (temperature == last_temperature and last_temperature < target)
+        )
+        self._run_total += seconds
+        if heater_on:
+            self._run_on += seconds
+            self.heater_seconds += seconds
+            self.energy_kwh += self._power_kw * seconds / 3600
+            self._store.async_delay_save(self._data_to_save, ENERGY_SAVE_DELAY)
+        self.duty_cycle = round(self._run_on * 100 / self._run_total, 1)
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {"energy_kwh": self.energy_kwh, "heater_seconds": self.heater_seconds}
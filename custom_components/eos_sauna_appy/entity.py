@@ -0,0 +1,206 @@
+"""Base entity and value extractors for EOS Sauna Appy.
+
+Every platform is generated from a table of entity descriptions. A description
+names the coordinator it reads from, the API keys it needs and a value
+extractor that is built once at import time, so adding a key is one table row.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    CONF_SAUNA_IP,
+    DOMAIN,
+    LOGGER,
+    MANUFACTURER,
+    NAME as INTEGRATION_NAME,
+)
+
+# Keys of hass.data[DOMAIN][entry_id] an entity reads its data from
+SOURCE_STATUS = "status_coordinator"  # /usr/eos/is
+SOURCE_SETTINGS = "settings_coordinator"  # /usr/eos/setdev
+SOURCE_SESSIONS = "sessions"  # Finished session statistics
+SOURCE_STATISTICS = "statistics"  # Downsampled temperature/humidity buckets
+SOURCE_ANOMALY = "anomaly"  # Streaming temperature anomaly detector
+SOURCE_PREHEAT = "preheat"  # Preheat planner
+SOURCE_ENERGY = "energy"  # Heater duty-cycle and energy estimator
+SOURCE_COMMANDS = "commands"  # Outbound command queue
+DATA_DEVICE_INFO = "device_info"  # DeviceInfo shared by the entry's entities
+
+ValueFn = Callable[[Mapping[str, Any]], Any]
+
+
+def raw_value(key: str) -> ValueFn:
+    """Return the value of a key unchanged."""
+    return itemgetter(key)
+
+
+def float_value(key: str) -> ValueFn:
+    """Return the value of a key as a float."""
+
+    def _extract(data: Mapping[str, Any]) -> float:
+        return float(data[key])
+
+    return _extract
+
+
+def onoff_value(key: str) -> ValueFn:
+    """Return True if the key holds the API's "1" (on) flag."""
+
+    def _extract(data: Mapping[str, Any]) -> bool:
+        return str(data[key]) == "1"
+
+    return _extract
+
+
+def mapped_value(key: str, mapping: Mapping[Any, str]) -> ValueFn:
+    """Translate the value of a key through a lookup table."""
+
+    def _extract(data: Mapping[str, Any]) -> str:
+        raw = data[key]
+        return mapping.get(raw, f"Unknown ({raw})")
+
+    return _extract
+
+
+def clock_value(hour_key: str, minute_key: str) -> ValueFn:
+    """Combine an hour and a minute key into an HH:MM string."""
+
+    def _extract(data: Mapping[str, Any]) -> str:
+        return f"{int(data[hour_key]):02d}:{int(data[minute_key]):02d}"
+
+    return _extract
+
+
+def duration_value(*keys_and_seconds: tuple[str, int]) -> ValueFn:
+    """Combine (key, seconds per unit) pairs into a duration in seconds."""
+
+    def _extract(data: Mapping[str, Any]) -> int:
+        return sum(int(data[key]) * unit for key, unit in keys_and_seconds)
+
+    return _extract
+
+
+@dataclass(frozen=True, kw_only=True)
+class EosSaunaEntityDescription(EntityDescription):
+    """Fields shared by every EOS Sauna entity description."""
+
+    source: str = SOURCE_SETTINGS
+    data_keys: tuple[str, ...] = ()
+    value_fn: ValueFn | None = None
+    unique_id_suffix: str = ""
+
+
+def build_device_info(config_entry: ConfigEntry) -> DeviceInfo:
+    """Return the device info of one sauna.
+
+    It is built once per entry, kept in ``hass.data[DOMAIN][entry_id]`` and
+    shared by all of the entry's entities, so it must not be modified.
+    """
+    return DeviceInfo(
+        identifiers={(DOMAIN, config_entry.entry_id)},
+        name=f"{INTEGRATION_NAME} ({config_entry.data.get(CONF_SAUNA_IP, '')})",
+        manufacturer=MANUFACTURER,
+        model="Web API Controlled Sauna",
+    )
+
+
+def set_entity_identity(entity, config_entry: ConfigEntry, description: EosSaunaEntityDescription) -> None:
+    """Set the unique ID and entry of an entity from its description.
+
+    Entities are named by their description and the device name
+    (``has_entity_name``), so no per-entity name string is built.
+    """
+    entity._attr_unique_id = f"{config_entry.entry_id}_{description.unique_id_suffix}"
+    entity._entry_id = config_entry.entry_id
+
+
+class EosSaunaIdentity:
+    """Device info lookup shared by both entity base classes."""
+
+    _entry_id: str
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the entry's shared device info; read once the entity has hass."""
+        return self.hass.data[DOMAIN][self._entry_id][DATA_DEVICE_INFO]
+
+
+class EosSaunaEntity(EosSaunaIdentity, CoordinatorEntity):
+    """Base class for all EOS Sauna entities."""
+
+    entity_description: EosSaunaEntityDescription
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator,
+        config_entry: ConfigEntry,
+        description: EosSaunaEntityDescription,
+    ):
+        """Initialize the entity from its description."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        set_entity_identity(self, config_entry, description)
+
+    @property
+    def available(self) -> bool:
+        """Return True if the coordinator has every key this entity needs."""
+        data = self.coordinator.data
+        return (
+            super().available
+            and data is not None
+            and all(key in data for key in self.entity_description.data_keys)
+        )
+
+    def _extract_value(self) -> Any:
+        """Run the description's value extractor on the coordinator data."""
+        data = self.coordinator.data
+        if not data or self.entity_description.value_fn is None:
+            return None
+        try:
+            return self.entity_description.value_fn(data)
+        except KeyError:
+            return None
+        except (ValueError, TypeError) as e:
+            LOGGER.warning(f"Could not parse value for {self.name}: {e}")
+            return None
+
+
+class EosSaunaPushEntity(EosSaunaIdentity, Entity):
+    """Base class for entities updated by an integration-side listener.
+
+    The source is any runtime object with an ``async_add_listener`` method,
+    e.g. the session tracker; the entity writes its state only when the
+    source notifies it, never on a coordinator poll.
+    """
+
+    entity_description: EosSaunaEntityDescription
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, source, config_entry: ConfigEntry, description: EosSaunaEntityDescription):
+        """Initialize the entity from its description."""
+        self.entity_description = description
+        self._source = source
+        set_entity_identity(self, config_entry, description)
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state whenever the source notifies its listeners."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._source.async_add_listener(self._handle_source_update))
+
+    @callback
+    def _handle_source_update(self) -> None:
+        """Write the state; looked up per call so the profiler can wrap it."""
+        self.async_write_ha_state()
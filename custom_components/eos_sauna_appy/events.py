@@ -0,0 +1,169 @@
+"""Semantic change events for EOS Sauna Appy.
+
+Automations that trigger on ``state_changed`` of several entities wake up on
+every sensor write and need templates to find out what actually changed. The
+emitter diffs each new coordinator snapshot against the previous one once and
+fires a small set of typed events instead:
+
+* ``eos_sauna_appy_mode_changed`` when the reported state ``S`` changes,
+* ``eos_sauna_appy_target_reached`` once per heating run when ``T`` reaches ``Td``,
+* ``eos_sauna_appy_setting_changed`` for each changed desired setting, whether
+  it was changed from Home Assistant or on the panel.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    API_KEY_CURRENT_TEMP,
+    API_KEY_SAUNA_STATE_ACTUAL,
+    API_KEY_SAUNA_STATE_DESIRED,
+    API_KEY_TARGET_TEMP_DESIRED,
+    API_KEY_TARGET_HUMIDITY_DESIRED,
+    API_KEY_VAPOR_STATE_DESIRED,
+    API_KEY_LIGHT_STATE_DESIRED,
+    API_KEY_LIGHT_INTENSITY_DESIRED,
+    API_KEY_COLOR_LIGHT_DESIRED,
+    API_KEY_AUTO_HEAT_DESIRED,
+    API_KEY_START_HOUR_DESIRED,
+    API_KEY_START_MINUTE_DESIRED,
+    SAUNA_STATUS_MAP,
+    SAUNA_STATES_HEATING,
+    EVENT_TARGET_REACHED,
+    EVENT_MODE_CHANGED,
+    EVENT_SETTING_CHANGED,
+)
+
+# Desired settings reported as setting_changed, by the name used in the event
+SETTING_EVENT_KEYS = {
+    API_KEY_SAUNA_STATE_DESIRED: "sauna",
+    API_KEY_TARGET_TEMP_DESIRED: "target_temperature",
+    API_KEY_TARGET_HUMIDITY_DESIRED: "target_humidity",
+    API_KEY_VAPOR_STATE_DESIRED: "vaporizer",
+    API_KEY_LIGHT_STATE_DESIRED: "light",
+    API_KEY_LIGHT_INTENSITY_DESIRED: "light_intensity",
+    API_KEY_COLOR_LIGHT_DESIRED: "color_light",
+    API_KEY_AUTO_HEAT_DESIRED: "auto_heat",
+    API_KEY_START_HOUR_DESIRED: "start_hour",
+    API_KEY_START_MINUTE_DESIRED: "start_minute",
+}
+
+
+def _as_float(value: Any) -> float | None:
+    """Return value as float, or None if it is not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class EosSaunaEventEmitter:
+    """Fire typed events for what changed between two snapshots."""
+
+    __slots__ = (
+        "hass",
+        "_entry_id",
+        "_status_coordinator",
+        "_settings_coordinator",
+        "_state",
+        "_settings",
+        "_target_reached",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        status_coordinator: DataUpdateCoordinator,
+        settings_coordinator: DataUpdateCoordinator,
+    ) -> None:
+        """Initialize the emitter from the current snapshots."""
+        self.hass = hass
+        self._entry_id = entry_id
+        self._status_coordinator = status_coordinator
+        self._settings_coordinator = settings_coordinator
+        status = status_coordinator.data or {}
+        settings = settings_coordinator.data or {}
+        self._state = status.get(API_KEY_SAUNA_STATE_ACTUAL)
+        self._settings = {key: settings.get(key) for key in SETTING_EVENT_KEYS}
+        # Don't report a target that was already reached before startup
+        self._target_reached = self._at_target(status, settings)
+
+    @staticmethod
+    def _at_target(status: dict, settings: dict) -> bool:
+        """Return True if the sauna is heating and has reached Td."""
+        temperature = _as_float(status.get(API_KEY_CURRENT_TEMP))
+        target = _as_float(settings.get(API_KEY_TARGET_TEMP_DESIRED))
+        return (
+            status.get(API_KEY_SAUNA_STATE_ACTUAL) in SAUNA_STATES_HEATING
+            and temperature is not None
+            and target is not None
+            and temperature >= target
+        )
+
+    @callback
+    def async_handle_status_update(self) -> None:
+        """Diff the latest status poll against the previous one."""
+        status = self._status_coordinator.data
+        if not self._status_coordinator.last_update_success or not status:
+            return
+        settings = self._settings_coordinator.data or {}
+        fire = self.hass.bus.async_fire
+
+        state = status.get(API_KEY_SAUNA_STATE_ACTUAL)
+        if state != self._state:
+            fire(
+                EVENT_MODE_CHANGED,
+                {
+                    "config_entry_id": self._entry_id,
+                    "old_state": self._state,
+                    "new_state": state,
+                    "old_mode": SAUNA_STATUS_MAP.get(self._state),
+                    "new_mode": SAUNA_STATUS_MAP.get(state),
+                },
+            )
+            self._state = state
+
+        if state not in SAUNA_STATES_HEATING:
+            self._target_reached = False
+        elif not self._target_reached and self._at_target(status, settings):
+            self._target_reached = True
+            fire(
+                EVENT_TARGET_REACHED,
+                {
+                    "config_entry_id": self._entry_id,
+                    "temperature": _as_float(status.get(API_KEY_CURRENT_TEMP)),
+                    "target_temperature": _as_float(settings.get(API_KEY_TARGET_TEMP_DESIRED)),
+                    "mode": SAUNA_STATUS_MAP.get(state),
+                },
+            )
+
+    @callback
+    def async_handle_settings_update(self) -> None:
+        """Diff the latest settings snapshot against the previous one."""
+        settings = self._settings_coordinator.data
+        if not self._settings_coordinator.last_update_success or not settings:
+            return
+        previous = self._settings
+        for key, setting in SETTING_EVENT_KEYS.items():
+            new = settings.get(key)
+            old = previous[key]
+            if new == old:
+                continue
+            previous[key] = new
+            if key == API_KEY_TARGET_TEMP_DESIRED:
+                # A new target is worth reaching again
+                self._target_reached = False
+            self.hass.bus.async_fire(
+                EVENT_SETTING_CHANGED,
+                {
+                    "config_entry_id": self._entry_id,
+                    "setting": setting,
+                    "key": key,
+                    "old_value": old,
+                    "new_value": new,
+                },
+            )
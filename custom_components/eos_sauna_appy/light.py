@@ -1,26 +1,53 @@
 """Light platform for EOS Sauna Appy."""
-import asyncio
+from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ColorMode,
     LightEntity,
+    LightEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
     LOGGER,
     API_KEY_LIGHT_STATE_DESIRED,  # Lxd
     API_KEY_LIGHT_INTENSITY_DESIRED,  # Ld
-    MANUFACTURER,
-    NAME as INTEGRATION_NAME,
+    API_KEY_CONTROL_LIGHT_ONOFF,  # Lxc
+    API_KEY_CONTROL_LIGHT_INTENSITY,  # Lc
+)
+from .api import EosSaunaApiClient, EosSaunaApiCommandQueued
+from .entity import (
+    SOURCE_SETTINGS,
+    EosSaunaEntity,
+    EosSaunaEntityDescription,
+    onoff_value,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class EosSaunaLightEntityDescription(EosSaunaEntityDescription, LightEntityDescription):
+    """Describes an EOS Sauna light."""
+
+    brightness_key: str
+
+
+LIGHT_DESCRIPTIONS: tuple[EosSaunaLightEntityDescription, ...] = (
+    EosSaunaLightEntityDescription(
+        key="sauna_light",
+        name="Sauna Light",
+        source=SOURCE_SETTINGS,
+        data_keys=(API_KEY_LIGHT_STATE_DESIRED, API_KEY_LIGHT_INTENSITY_DESIRED),
+        value_fn=onoff_value(API_KEY_LIGHT_STATE_DESIRED),
+        brightness_key=API_KEY_LIGHT_INTENSITY_DESIRED,
+        unique_id_suffix="light",
+        icon="mdi:lightbulb",
+    ),
 )
-from .api import EosSaunaApiClient
 
 
 async def async_setup_entry(
@@ -28,25 +55,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up the light platform."""
     data = hass.data[DOMAIN][entry.entry_id]
-    # Lights will use the settings_coordinator to reflect the desired state
+    # Lights use the settings_coordinator to reflect the desired state
     # and the client to send commands.
-    settings_coordinator = data["settings_coordinator"]
-    client = data["client"]
+    async_add_entities(
+        EosSaunaLight(data[description.source], entry, data["client"], description)
+        for description in LIGHT_DESCRIPTIONS
+    )
 
-    lights = [
-        EosSaunaLight(
-            settings_coordinator,
-            entry,
-            client,
-            "Sauna Light",
-        )
-    ]
-    async_add_entities(lights)
 
-
-class EosSaunaLight(CoordinatorEntity, LightEntity):
+class EosSaunaLight(EosSaunaEntity, LightEntity):
     """Representation of an EOS Sauna light."""
 
+    entity_description: EosSaunaLightEntityDescription
+
     _attr_color_mode = ColorMode.BRIGHTNESS # Supports brightness
     _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
 
@@ -55,39 +76,18 @@ class EosSaunaLight(CoordinatorEntity, LightEntity):
         coordinator, # This will be the settings_coordinator
         config_entry: ConfigEntry,
         client: EosSaunaApiClient,
-        name_suffix: str,
+        description: EosSaunaLightEntityDescription,
     ):
         """Initialize the light."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
+        super().__init__(coordinator, config_entry, description)
         self._client = client
 
-        self._attr_name = f"{INTEGRATION_NAME} {self._config_entry.data.get('sauna_ip', '')} {name_suffix}"
-        self._attr_unique_id = f"{config_entry.entry_id}_light"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": f"{INTEGRATION_NAME} ({config_entry.data.get('sauna_ip', '')})",
-            "manufacturer": MANUFACTURER,
-            "model": "Web API Controlled Sauna",
-        }
-        self._attr_icon = "mdi:lightbulb"
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            super().available
-            and self.coordinator.data is not None
-            and API_KEY_LIGHT_STATE_DESIRED in self.coordinator.data
-            and API_KEY_LIGHT_INTENSITY_DESIRED in self.coordinator.data
-        )
-
     @property
     def is_on(self) -> bool | None:
         """Return true if light is on."""
         if self.available:
             # API uses "1" for ON and "0" for OFF for Lxd
-            return str(self.coordinator.data[API_KEY_LIGHT_STATE_DESIRED]) == "1"
+            return self._extract_value()
         return None
 
     @property
@@ -96,7 +96,7 @@ class EosSaunaLight(CoordinatorEntity, LightEntity):
         if self.available:
             # API provides brightness as 0-100 (Ld key)
             # Home Assistant expects 0-255
-            api_brightness = self.coordinator.data[API_KEY_LIGHT_INTENSITY_DESIRED]
+            api_brightness = self.coordinator.data[self.entity_description.brightness_key]
             if api_brightness is not None:
                 return round(int(api_brightness) * 2.55)
         return None
@@ -104,19 +104,16 @@ class EosSaunaLight(CoordinatorEntity, LightEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
         LOGGER.debug(f"Turning ON {self.name} with kwargs: {kwargs}")
+        # Switch on and set the brightness in one request
+        payload = {API_KEY_CONTROL_LIGHT_ONOFF: 1}
+        if ATTR_BRIGHTNESS in kwargs:
+            # HA brightness is 0-255, API is 0-100
+            payload[API_KEY_CONTROL_LIGHT_INTENSITY] = min(100, max(0, round(kwargs[ATTR_BRIGHTNESS] / 2.55)))
         try:
-            if ATTR_BRIGHTNESS in kwargs:
-                # HA brightness is 0-255, API is 0-100
-                ha_brightness = kwargs[ATTR_BRIGHTNESS]
-                api_brightness = round(ha_brightness / 2.55)
-                await self._client.async_set_light_intensity(api_brightness)
-            
-            # Always ensure light is set to ON state if brightness is also set or if no brightness
-            # This handles cases where light might be off but brightness is adjusted
-            if not self.is_on or ATTR_BRIGHTNESS not in kwargs:
-                 await self._client.async_set_light_onoff(True)
-
+            await self._client.async_set_control_values(payload)
             await self.coordinator.async_request_refresh()
+        except EosSaunaApiCommandQueued as e:
+            LOGGER.warning(f"Could not turn ON {self.name} now: {e}")
         except Exception as e:
             LOGGER.error(f"Error turning ON {self.name}: {e}")
 
@@ -125,8 +122,8 @@ class EosSaunaLight(CoordinatorEntity, LightEntity):
         LOGGER.debug(f"Turning OFF {self.name}")
         try:
             await self._client.async_set_light_onoff(False)
-            # Add a small delay to allow the device to process the command
-            await asyncio.sleep(5) # Wait 5 seconds
             await self.coordinator.async_request_refresh()
+        except EosSaunaApiCommandQueued as e:
+            LOGGER.warning(f"Could not turn OFF {self.name} now: {e}")
         except Exception as e:
             LOGGER.error(f"Error turning OFF {self.name}: {e}")
\ No newline at end of file
@@ -0,0 +1,183 @@
+"""OpenMetrics scrape endpoint for EOS Sauna Appy.
+
+The view renders every configured sauna's last coordinator snapshot and the
+API client metrics as OpenMetrics text. The rendered body is cached. It is
+invalidated when a coordinator delivers new data or any client records a
+request, error or hedge, so a scrape between polls returns the same bytes
+without touching the entities or the state machine, while failing polls,
+captures and commands still show up.
+"""
+from __future__ import annotations
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .api import LATENCY_BUCKETS, LATENCY_WINDOW
+from .const import (
+    DOMAIN,
+    DATA_METRICS_VIEW,
+    METRICS_URL,
+    API_KEY_CURRENT_TEMP,
+    API_KEY_CURRENT_HUMIDITY,
+    API_KEY_TARGET_TEMP_DESIRED,
+    API_KEY_TARGET_HUMIDITY_DESIRED,
+    API_KEY_SAUNA_STATE_ACTUAL,
+    API_KEY_SAUNA_STATE_DESIRED,
+    API_KEY_VAPOR_STATE_DESIRED,
+    API_KEY_LIGHT_STATE_DESIRED,
+)
+
+CONTENT_TYPE_OPENMETRICS = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# (metric name, coordinator, API key, help text)
+SNAPSHOT_GAUGES = (
+    ("eos_sauna_temperature_celsius", "status_coordinator", API_KEY_CURRENT_TEMP, "Current cabin temperature (T)."),
+    ("eos_sauna_humidity_percent", "status_coordinator", API_KEY_CURRENT_HUMIDITY, "Current cabin humidity (H)."),
+    ("eos_sauna_state", "status_coordinator", API_KEY_SAUNA_STATE_ACTUAL, "Reported sauna state code (S)."),
+    ("eos_sauna_target_temperature_celsius", "settings_coordinator", API_KEY_TARGET_TEMP_DESIRED, "Target temperature (Td)."),
+    ("eos_sauna_target_humidity_percent", "settings_coordinator", API_KEY_TARGET_HUMIDITY_DESIRED, "Target humidity (Hd)."),
+    ("eos_sauna_power_on", "settings_coordinator", API_KEY_SAUNA_STATE_DESIRED, "Sauna switched on (Sxd)."),
+    ("eos_sauna_vaporizer_on", "settings_coordinator", API_KEY_VAPOR_STATE_DESIRED, "Vaporizer switched on (Vxd)."),
+    ("eos_sauna_light_on", "settings_coordinator", API_KEY_LIGHT_STATE_DESIRED, "Light switched on (Lxd)."),
+)
+
+# (metric name, EosSaunaClientMetrics attribute, help text)
+CLIENT_HEDGE_COUNTERS = (
+    ("eos_sauna_client_hedges", "hedges", "Hedge reads sent because the first read exceeded the p95."),
+    ("eos_sauna_client_hedges_won", "hedges_won", "Hedge reads that answered before the first read."),
+    ("eos_sauna_client_hedge_saved_seconds", "hedge_saved", "Seconds by which winning hedges beat the first read."),
+)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value) -> str | None:
+    """Format a sample value, or None if it is not numeric."""
+    try:
+        return repr(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def render_openmetrics(entries: dict[str, dict]) -> bytes:
+    """Render the snapshot and client metrics of all entries."""
+    lines: list[str] = []
+    labels = {
+        entry_id: f'entry_id="{_escape(entry_id)}",host="{_escape(data["client"].host)}"'
+        for entry_id, data in entries.items()
+    }
+
+    lines.append("# TYPE eos_sauna_up gauge")
+    lines.append("# HELP eos_sauna_up Whether the last status poll succeeded.")
+    for entry_id, data in entries.items():
+        up = 1 if data["status_coordinator"].last_update_success else 0
+        lines.append(f"eos_sauna_up{{{labels[entry_id]}}} {up}")
+
+    for name, source, key, help_text in SNAPSHOT_GAUGES:
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"# HELP {name} {help_text}")
+        for entry_id, data in entries.items():
+            snapshot = data[source].data or {}
+            value = _number(snapshot.get(key))
+            if value is not None:
+                lines.append(f"{name}{{{labels[entry_id]}}} {value}")
+
+    lines.append("# TYPE eos_sauna_client_requests counter")
+    lines.append("# HELP eos_sauna_client_requests Successful API requests.")
+    for entry_id, data in entries.items():
+        for endpoint, count in data["client"].metrics.requests.items():
+            lines.append(
+                f'eos_sauna_client_requests_total{{{labels[entry_id]},endpoint="{_escape(endpoint)}"}} {count}'
+            )
+
+    lines.append("# TYPE eos_sauna_client_request_duration_seconds histogram")
+    lines.append("# HELP eos_sauna_client_request_duration_seconds Latency of successful API requests.")
+    for entry_id, data in entries.items():
+        metrics = data["client"].metrics
+        for endpoint, buckets in metrics.latency_buckets.items():
+            base = f'{labels[entry_id]},endpoint="{_escape(endpoint)}"'
+            cumulative = 0
+            for bound, count in zip((*map(repr, LATENCY_BUCKETS), "+Inf"), buckets):
+                cumulative += count
+                lines.append(f'eos_sauna_client_request_duration_seconds_bucket{{{base},le="{bound}"}} {cumulative}')
+            lines.append(f"eos_sauna_client_request_duration_seconds_count{{{base}}} {cumulative}")
+            lines.append(f"eos_sauna_client_request_duration_seconds_sum{{{base}}} {metrics.latency_sum[endpoint]!r}")
+
+    lines.append("# TYPE eos_sauna_client_request_duration_p95_seconds gauge")
+    lines.append(
+        f"# HELP eos_sauna_client_request_duration_p95_seconds p95 latency of the last {LATENCY_WINDOW} "
+        "successful requests, used as the hedge delay."
+    )
+    for entry_id, data in entries.items():
+        metrics = data["client"].metrics
+        for endpoint in metrics.recent_latencies:
+            p95 = metrics.p95(endpoint)
+            if p95 is not None:
+                lines.append(
+                    f'eos_sauna_client_request_duration_p95_seconds{{{labels[entry_id]},endpoint="{_escape(endpoint)}"}} {p95!r}'
+                )
+
+    for name, attr, help_text in CLIENT_HEDGE_COUNTERS:
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"# HELP {name} {help_text}")
+        for entry_id, data in entries.items():
+            for endpoint, value in getattr(data["client"].metrics, attr).items():
+                lines.append(f'{name}_total{{{labels[entry_id]},endpoint="{_escape(endpoint)}"}} {value!r}')
+
+    lines.append("# TYPE eos_sauna_client_errors counter")
+    lines.append("# HELP eos_sauna_client_errors Failed API requests by error type.")
+    for entry_id, data in entries.items():
+        for kind, count in data["client"].metrics.errors.items():
+            lines.append(f'eos_sauna_client_errors_total{{{labels[entry_id]},type="{_escape(kind)}"}} {count}')
+
+    lines.append("# TYPE eos_sauna_client_frame_errors counter")
+    lines.append("# HELP eos_sauna_client_frame_errors Responses reporting a controller frame error (S=250-255), including retried ones.")
+    for entry_id, data in entries.items():
+        for code, count in data["client"].metrics.frame_errors.items():
+            lines.append(f'eos_sauna_client_frame_errors_total{{{labels[entry_id]},code="{code}"}} {count}')
+
+    lines.append("# EOF")
+    return ("\n".join(lines) + "\n").encode()
+
+
+class EosSaunaMetricsView(HomeAssistantView):
+    """Serve OpenMetrics text for all configured saunas."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with an empty cache."""
+        self.hass = hass
+        self._body: bytes | None = None
+        self._changes = 0 # Sum of the clients' change counters at rendering
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Drop the cached body; the next scrape renders a fresh one."""
+        self._body = None
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the cached OpenMetrics body, rendering it if needed."""
+        entries = self.hass.data.get(DOMAIN, {})
+        # Consecutive failed polls don't notify coordinator listeners
+        changes = sum(data["client"].metrics.changes for data in entries.values())
+        if self._body is None or changes != self._changes:
+            self._body = render_openmetrics(entries)
+            self._changes = changes
+        return web.Response(body=self._body, headers={"Content-Type": CONTENT_TYPE_OPENMETRICS})
+
+
+@callback
+def async_get_metrics_view(hass: HomeAssistant) -> EosSaunaMetricsView:
+    """Return the metrics view, registering it on first use."""
+    view = hass.data.get(DATA_METRICS_VIEW)
+    if view is None:
+        view = hass.data[DATA_METRICS_VIEW] = EosSaunaMetricsView(hass)
+        hass.http.register_view(view)
+    return view
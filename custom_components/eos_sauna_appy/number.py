@@ -1,9 +1,16 @@
 """Number platform for EOS Sauna Appy."""
-from homeassistant.components.number import NumberEntity, NumberDeviceClass, NumberMode
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from homeassistant.components.number import (
+    NumberDeviceClass,
+    NumberEntity,
+    NumberEntityDescription,
+    NumberMode,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import UnitOfTemperature, PERCENTAGE
 
 from .const import (
@@ -11,10 +18,57 @@ from .const import (
     LOGGER,
     API_KEY_TARGET_TEMP_DESIRED,  # Td
     API_KEY_TARGET_HUMIDITY_DESIRED,  # Hd
-    MANUFACTURER,
-    NAME as INTEGRATION_NAME,
 )
-from .api import EosSaunaApiClient
+from .api import EosSaunaApiClient, EosSaunaApiCommandQueued
+from .entity import (
+    SOURCE_SETTINGS,
+    EosSaunaEntity,
+    EosSaunaEntityDescription,
+    float_value,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class EosSaunaNumberEntityDescription(EosSaunaEntityDescription, NumberEntityDescription):
+    """Describes an EOS Sauna number."""
+
+    set_fn: Callable[[EosSaunaApiClient, int], Awaitable[dict]]
+
+
+NUMBER_DESCRIPTIONS: tuple[EosSaunaNumberEntityDescription, ...] = (
+    EosSaunaNumberEntityDescription(
+        key="target_temperature_number",
+        name="Target Temperature",
+        source=SOURCE_SETTINGS,
+        data_keys=(API_KEY_TARGET_TEMP_DESIRED,),
+        value_fn=float_value(API_KEY_TARGET_TEMP_DESIRED),
+        unique_id_suffix=f"{API_KEY_TARGET_TEMP_DESIRED}_number",
+        set_fn=lambda client, value: client.async_set_target_temperature(value),
+        icon="mdi:thermometer-plus",
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        native_min_value=30,  # Based on HTML form validation
+        native_max_value=115, # Based on HTML form validation
+        native_step=1.0,
+        mode=NumberMode.BOX,
+    ),
+    EosSaunaNumberEntityDescription(
+        key="target_humidity_number",
+        name="Target Humidity",
+        source=SOURCE_SETTINGS,
+        data_keys=(API_KEY_TARGET_HUMIDITY_DESIRED,),
+        value_fn=float_value(API_KEY_TARGET_HUMIDITY_DESIRED),
+        unique_id_suffix=f"{API_KEY_TARGET_HUMIDITY_DESIRED}_number",
+        set_fn=lambda client, value: client.async_set_target_humidity(value),
+        icon="mdi:water-percent-alert", # Using alert icon to indicate it's a target
+        device_class=NumberDeviceClass.HUMIDITY,
+        native_unit_of_measurement=PERCENTAGE,
+        native_min_value=0,
+        native_max_value=100,
+        native_step=1.0,
+        mode=NumberMode.BOX,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -22,140 +76,40 @@ async def async_setup_entry(
 ) -> None:
     """Set up the number platform."""
     data = hass.data[DOMAIN][entry.entry_id]
-    settings_coordinator = data["settings_coordinator"]
-    client = data["client"]
-
-    numbers = [
-        EosSaunaTargetTemperatureNumber(
-            settings_coordinator,
-            entry,
-            client,
-            "Target Temperature",
-            API_KEY_TARGET_TEMP_DESIRED,
-        ),
-        EosSaunaTargetHumidityNumber(
-            settings_coordinator,
-            entry,
-            client,
-            "Target Humidity",
-            API_KEY_TARGET_HUMIDITY_DESIRED,
-        ),
-    ]
-    async_add_entities(numbers)
+    async_add_entities(
+        EosSaunaNumber(data[description.source], entry, data["client"], description)
+        for description in NUMBER_DESCRIPTIONS
+    )
 
 
-class EosSaunaBaseNumber(CoordinatorEntity, NumberEntity):
-    """Base class for EOS Sauna number entities."""
+class EosSaunaNumber(EosSaunaEntity, NumberEntity):
+    """Representation of an EOS Sauna number entity."""
 
-    _attr_mode = NumberMode.BOX  # Or NumberMode.SLIDER
+    entity_description: EosSaunaNumberEntityDescription
 
     def __init__(
         self,
         coordinator, # settings_coordinator
         config_entry: ConfigEntry,
         client: EosSaunaApiClient,
-        name_suffix: str,
-        data_key: str,
-        set_value_service_call,
+        description: EosSaunaNumberEntityDescription,
     ):
         """Initialize the number entity."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
+        super().__init__(coordinator, config_entry, description)
         self._client = client
-        self._data_key = data_key # Key from /usr/eos/setdev
-        self._set_value_service_call = set_value_service_call
-
-        self._attr_name = f"{INTEGRATION_NAME} {self._config_entry.data.get('sauna_ip', '')} {name_suffix}"
-        self._attr_unique_id = f"{config_entry.entry_id}_{data_key}_number"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": f"{INTEGRATION_NAME} ({config_entry.data.get('sauna_ip', '')})",
-            "manufacturer": MANUFACTURER,
-            "model": "Web API Controlled Sauna",
-        }
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return super().available and self.coordinator.data is not None and self._data_key in self.coordinator.data
 
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        if self.available:
-            value = self.coordinator.data.get(self._data_key)
-            if value is not None:
-                try:
-                    return float(value)
-                except (ValueError, TypeError):
-                    LOGGER.warning(f"Could not parse number value for {self.name}: {value}")
-                    return None
-        return None
+        return self._extract_value()
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         LOGGER.debug(f"Setting {self.name} to {value} via API call.")
         try:
-            await self._set_value_service_call(int(value)) # API expects int
+            await self.entity_description.set_fn(self._client, int(value)) # API expects int
             await self.coordinator.async_request_refresh()
+        except EosSaunaApiCommandQueued as e:
+            LOGGER.warning(f"Could not set {self.name} to {value} now: {e}")
         except Exception as e:
             LOGGER.error(f"Error setting {self.name} to {value}: {e}")
-
-
-class EosSaunaTargetTemperatureNumber(EosSaunaBaseNumber):
-    """Representation of a Target Temperature number entity."""
-
-    _attr_device_class = NumberDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_native_min_value = 30  # Based on HTML form validation
-    _attr_native_max_value = 115 # Based on HTML form validation
-    _attr_native_step = 1.0
-    _attr_icon = "mdi:thermometer-plus"
-
-
-    def __init__(
-        self,
-        coordinator,
-        config_entry: ConfigEntry,
-        client: EosSaunaApiClient,
-        name_suffix: str,
-        data_key: str,
-    ):
-        """Initialize the target temperature number entity."""
-        super().__init__(
-            coordinator,
-            config_entry,
-            client,
-            name_suffix,
-            data_key,
-            client.async_set_target_temperature,
-        )
-
-
-class EosSaunaTargetHumidityNumber(EosSaunaBaseNumber):
-    """Representation of a Target Humidity number entity."""
-
-    _attr_device_class = NumberDeviceClass.HUMIDITY
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_native_min_value = 0
-    _attr_native_max_value = 100
-    _attr_native_step = 1.0
-    _attr_icon = "mdi:water-percent-alert" # Using alert icon to indicate it's a target
-
-    def __init__(
-        self,
-        coordinator,
-        config_entry: ConfigEntry,
-        client: EosSaunaApiClient,
-        name_suffix: str,
-        data_key: str,
-    ):
-        """Initialize the target humidity number entity."""
-        super().__init__(
-            coordinator,
-            config_entry,
-            client,
-            name_suffix,
-            data_key,
-            client.async_set_target_humidity,
-        )
\ No newline at end of file
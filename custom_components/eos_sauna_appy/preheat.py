@@ -0,0 +1,314 @@
+"""Preheat planning from a learned per-sauna heating-rate model.
+
+The model is a small fixed table of heating rates (°C/min) indexed by
+current-temperature bin, target-temperature band and vaporizer state. While the
+sauna heats, temperature rises are accumulated per cell; when heating stops the
+session's rates are blended into the table and saved to a Store. Planning walks
+at most one cell per temperature bin, so it is a constant-time lookup.
+
+Plans start from the ambient temperature unless the cabin is colder, since a
+cabin that is still warm when the plan is made has cooled down by the time a
+later preheat starts. A scheduled preheat is saved with the model, so it
+survives reloads and restarts.
+"""
+from __future__ import annotations
+
+import math
+import time
+from bisect import bisect_right
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .api import TIMEOUT, EosSaunaApiClient, EosSaunaApiClientError
+from .const import (
+    DOMAIN,
+    LOGGER,
+    API_KEY_CURRENT_TEMP,
+    API_KEY_SAUNA_STATE_ACTUAL,
+    API_KEY_TARGET_TEMP_DESIRED,
+    API_KEY_VAPOR_STATE_DESIRED,
+    API_KEY_CONTROL_SAUNA_ONOFF,
+    API_KEY_CONTROL_TARGET_TEMP,
+    API_KEY_CONTROL_VAPOR_ONOFF,
+    SAUNA_STATES_HEATER_ON,
+    SCAN_INTERVAL_STATUS,
+    PREHEAT_STORAGE_VERSION,
+    PREHEAT_TEMP_BIN,
+    PREHEAT_TEMP_BINS,
+    PREHEAT_TARGET_BANDS,
+    PREHEAT_FULL_POWER_GAP,
+    PREHEAT_MIN_CELL_SECONDS,
+    PREHEAT_LEARNING_ALPHA,
+    PREHEAT_DEFAULT_RATE,
+    PREHEAT_SAFETY_FACTOR,
+    PREHEAT_MARGIN,
+    PREHEAT_AMBIENT_TEMPERATURE,
+)
+
+_BANDS = len(PREHEAT_TARGET_BANDS) + 1
+_CELLS = PREHEAT_TEMP_BINS * _BANDS * 2
+_MAX_SAMPLE_GAP = 5 * SCAN_INTERVAL_STATUS.total_seconds()
+
+
+def _temp_bin(temperature: float) -> int:
+    """Return the temperature bin of a reading."""
+    return min(max(int(temperature // PREHEAT_TEMP_BIN), 0), PREHEAT_TEMP_BINS - 1)
+
+
+def _cell(temp_bin: int, target: float, vapor_on: bool) -> int:
+    """Return the flat table index of a (bin, band, vapor) cell."""
+    band = bisect_right(PREHEAT_TARGET_BANDS, target)
+    return (temp_bin * _BANDS + band) * 2 + int(vapor_on)
+
+
+class HeatingRateModel:
+    """Fixed-size table of learned heating rates in °C per minute."""
+
+    __slots__ = ("rates", "_session")
+
+    def __init__(self, rates: list[float | None] | None = None) -> None:
+        """Initialize the table, optionally from stored rates."""
+        self.rates: list[float | None] = (
+            list(rates) if rates and len(rates) == _CELLS else [None] * _CELLS
+        )
+        # cell -> [temperature rise, seconds] for the session in progress
+        self._session: dict[int, list[float]] = {}
+
+    def add_sample(self, temperature: float, rise: float, seconds: float, target: float, vapor_on: bool) -> None:
+        """Accumulate one heating step that started at the given temperature."""
+        accumulator = self._session.setdefault(_cell(_temp_bin(temperature), target, vapor_on), [0.0, 0.0])
+        accumulator[0] += rise
+        accumulator[1] += seconds
+
+    def finish_session(self) -> bool:
+        """Blend the session's rates into the table; return True if it changed."""
+        changed = False
+        for cell, (rise, seconds) in self._session.items():
+            if seconds < PREHEAT_MIN_CELL_SECONDS or rise <= 0:
+                continue
+            rate = rise * 60.0 / seconds
+            current = self.rates[cell]
+            self.rates[cell] = round(
+                rate if current is None else current + PREHEAT_LEARNING_ALPHA * (rate - current), 3
+            )
+            changed = True
+        self._session = {}
+        return changed
+
+    def _rate(self, temp_bin: int, target: float, vapor_on: bool) -> float:
+        """Return the learned rate of a cell, falling back to its neighbours."""
+        rate = self.rates[_cell(temp_bin, target, vapor_on)]
+        if rate is None:
+            rate = self.rates[_cell(temp_bin, target, not vapor_on)]
+        if rate is None:
+            for offset in range(1, PREHEAT_TEMP_BINS):
+                for other in (temp_bin - offset, temp_bin + offset):
+                    if 0 <= other < PREHEAT_TEMP_BINS:
+                        rate = self.rates[_cell(other, target, vapor_on)]
+                        if rate is not None:
+                            return rate
+            return PREHEAT_DEFAULT_RATE
+        return rate
+
+    def minutes_to_target(self, temperature: float, target: float, vapor_on: bool) -> float:
+        """Return the predicted heating time from temperature to target."""
+        minutes = 0.0
+        current = temperature
+        while current < target:
+            temp_bin = _temp_bin(current)
+            edge = min((temp_bin + 1) * PREHEAT_TEMP_BIN, target)
+            if edge <= current:  # Above the last bin edge
+                edge = target
+            minutes += (edge - current) / self._rate(temp_bin, target, vapor_on)
+            current = edge
+        return minutes
+
+
+class EosSaunaPreheatPlanner:
+    """Learn a sauna's heating curve and schedule preheats from it."""
+
+    __slots__ = (
+        "hass",
+        "_client",
+        "_status_coordinator",
+        "_settings_coordinator",
+        "_store",
+        "model",
+        "_last_time",
+        "_last_temperature",
+        "_heating",
+        "_cancel_scheduled",
+        "scheduled_start",
+        "_scheduled",
+        "_listeners",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        client: EosSaunaApiClient,
+        status_coordinator: DataUpdateCoordinator,
+        settings_coordinator: DataUpdateCoordinator,
+    ) -> None:
+        """Initialize the planner."""
+        self.hass = hass
+        self._client = client
+        self._status_coordinator = status_coordinator
+        self._settings_coordinator = settings_coordinator
+        self._store: Store = Store(
+            hass, PREHEAT_STORAGE_VERSION, f"{DOMAIN}.heating_model.{entry_id}"
+        )
+        self.model = HeatingRateModel()
+        self._last_time: float | None = None
+        self._last_temperature: float | None = None
+        self._heating = False
+        self._cancel_scheduled: CALLBACK_TYPE | None = None
+        self.scheduled_start: datetime | None = None
+        # Start, ready time and payload of the scheduled preheat, as stored
+        self._scheduled: dict[str, Any] | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    async def async_load(self) -> None:
+        """Load the stored heating model and reschedule a pending preheat."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self.model = HeatingRateModel(stored.get("rates"))
+        scheduled = stored.get("scheduled")
+        if scheduled and dt_util.parse_datetime(scheduled["ready_at"]) > dt_util.utcnow():
+            # A start missed while unloaded happens now
+            self._async_schedule(
+                max(dt_util.parse_datetime(scheduled["start"]), dt_util.utcnow()),
+                dt_util.parse_datetime(scheduled["ready_at"]),
+                scheduled["payload"],
+            )
+
+    async def async_unload(self) -> None:
+        """Stop the timer, keeping the scheduled preheat for the next load."""
+        if self._cancel_scheduled is not None:
+            self._cancel_scheduled()
+            self._cancel_scheduled = None
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for changes of the scheduled preheat."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_handle_update(self) -> None:
+        """Learn from the latest status poll."""
+        status = self._status_coordinator.data
+        if not self._status_coordinator.last_update_success or not status:
+            return
+        settings = self._settings_coordinator.data or {}
+        heating = status.get(API_KEY_SAUNA_STATE_ACTUAL) in SAUNA_STATES_HEATER_ON
+        try:
+            temperature = float(status[API_KEY_CURRENT_TEMP])
+            target = float(settings[API_KEY_TARGET_TEMP_DESIRED])
+        except (KeyError, TypeError, ValueError):
+            return
+        now = time.monotonic()
+
+        if heating and self._heating and self._last_time is not None:
+            seconds = now - self._last_time
+            if 0 < seconds <= _MAX_SAMPLE_GAP and self._last_temperature < target - PREHEAT_FULL_POWER_GAP:
+                self.model.add_sample(
+                    self._last_temperature,
+                    temperature - self._last_temperature,
+                    seconds,
+                    target,
+                    str(settings.get(API_KEY_VAPOR_STATE_DESIRED)) == "1",
+                )
+        elif self._heating and not heating and self.model.finish_session():
+            self._store.async_delay_save(self._data_to_save)
+
+        self._heating = heating
+        self._last_time = now
+        self._last_temperature = temperature
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {"rates": self.model.rates, "scheduled": self._scheduled}
+
+    @callback
+    def async_plan(self, ready_at: datetime, target: int, vapor_on: bool | None) -> dict[str, Any]:
+        """Schedule the sauna to be at target by ready_at; return the plan."""
+        status = self._status_coordinator.data or {}
+        settings = self._settings_coordinator.data or {}
+        payload = {API_KEY_CONTROL_TARGET_TEMP: target, API_KEY_CONTROL_SAUNA_ONOFF: 1}
+        if vapor_on is None:
+            vapor_on = str(settings.get(API_KEY_VAPOR_STATE_DESIRED)) == "1"
+        else:
+            payload[API_KEY_CONTROL_VAPOR_ONOFF] = int(vapor_on)
+        try:
+            temperature = float(status[API_KEY_CURRENT_TEMP])
+        except (KeyError, TypeError, ValueError):
+            temperature = None
+        # A warm cabin cools down before a later start; if the start is
+        # earlier than planned for, the cabin only heats up sooner
+        baseline = PREHEAT_AMBIENT_TEMPERATURE if temperature is None else min(temperature, PREHEAT_AMBIENT_TEMPERATURE)
+
+        minutes = self.model.minutes_to_target(baseline, target, vapor_on)
+        lead = timedelta(minutes=math.ceil(minutes * PREHEAT_SAFETY_FACTOR)) + PREHEAT_MARGIN
+        start = max(ready_at - lead, dt_util.utcnow())
+        self.async_cancel()
+        self._async_schedule(start, dt_util.as_utc(ready_at), payload)
+        return {
+            "start_at": start.isoformat(),
+            "ready_at": dt_util.as_utc(ready_at).isoformat(),
+            "predicted_minutes": round(minutes, 1),
+            "current_temperature": temperature,
+            "planned_from_temperature": baseline,
+        }
+
+    @callback
+    def _async_schedule(self, start: datetime, ready_at: datetime, payload: dict[str, int]) -> None:
+        """Send payload to the sauna at start."""
+
+        async def _async_start(_now: datetime) -> None:
+            self._cancel_scheduled = None
+            self._set_scheduled(None)
+            LOGGER.info(f"Starting preheat of {self._client.host} to {payload[API_KEY_CONTROL_TARGET_TEMP]} °C")
+            try:
+                await self._client.async_set_control_values(payload, TIMEOUT)
+                await self._settings_coordinator.async_request_refresh()
+            except EosSaunaApiClientError as e:
+                LOGGER.error(f"Error starting preheat of {self._client.host}: {e}")
+
+        self._cancel_scheduled = async_track_point_in_utc_time(self.hass, _async_start, start)
+        self._set_scheduled(
+            start, {"start": start.isoformat(), "ready_at": ready_at.isoformat(), "payload": payload}
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel a scheduled preheat."""
+        if self._cancel_scheduled is not None:
+            self._cancel_scheduled()
+            self._cancel_scheduled = None
+            self._set_scheduled(None)
+
+    @callback
+    def _set_scheduled(self, start: datetime | None, scheduled: dict[str, Any] | None = None) -> None:
+        """Record the scheduled preheat, save it and notify listeners."""
+        self.scheduled_start = start
+        self._scheduled = scheduled
+        self._store.async_delay_save(self._data_to_save)
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -0,0 +1,281 @@
+"""On-demand profiling of the integration's hot paths.
+
+Nothing is instrumented until a profile is requested: the wrappers are
+installed when the profile starts and the original attributes are put back
+when it ends, so the normal code paths carry no overhead. While running, a
+sampler task measures how late the event loop wakes it up to detect blocking.
+The report ends with the approximate memory held by each entry's runtime
+objects, to see what adding saunas costs.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import math
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+import aiohttp
+
+from homeassistant.components import persistent_notification
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .api import EosSaunaApiClient
+from .const import (
+    DOMAIN,
+    LOGGER,
+    PROFILE_LOOP_SAMPLE_INTERVAL,
+    PROFILE_LOOP_BLOCKED_THRESHOLD,
+)
+from .entity import EosSaunaEntity, EosSaunaPushEntity
+
+NOTIFICATION_ID = f"{DOMAIN}_profile"
+
+
+class _Stat:
+    """Accumulated timings of one instrumented function."""
+
+    __slots__ = ("calls", "wall", "cpu", "max_wall")
+
+    def __init__(self) -> None:
+        """Initialize empty timings."""
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.max_wall = 0.0
+
+    def add(self, wall: float, cpu: float) -> None:
+        """Record one call."""
+        self.calls += 1
+        self.wall += wall
+        self.cpu += cpu
+        if wall > self.max_wall:
+            self.max_wall = wall
+
+
+def _subclasses(cls: type) -> list[type]:
+    """Return all subclasses of a class, recursively."""
+    found = []
+    for subclass in cls.__subclasses__():
+        found.append(subclass)
+        found.extend(_subclasses(subclass))
+    return found
+
+
+# Shared or foreign objects an entry's runtime objects point at but don't own
+_FOOTPRINT_SKIP = (
+    HomeAssistant,
+    ConfigEntry,
+    Store,
+    DataUpdateCoordinator,
+    aiohttp.ClientSession,
+    asyncio.Future,
+    type,
+)
+
+
+def _footprint(obj: Any, seen: set[int]) -> int:
+    """Return the approximate size in bytes of obj and the objects it owns."""
+    if id(obj) in seen or callable(obj) or isinstance(obj, _FOOTPRINT_SKIP):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, array)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        return size + sum(_footprint(key, seen) + _footprint(value, seen) for key, value in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        return size + sum(_footprint(item, seen) for item in obj)
+    for attr in getattr(type(obj), "__slots__", ()):
+        size += _footprint(getattr(obj, attr, None), seen)
+    if hasattr(obj, "__dict__"):
+        size += _footprint(vars(obj), seen)
+    return size
+
+
+def _entry_footprint(data: dict) -> int:
+    """Return the approximate bytes held by one entry's runtime objects."""
+    seen: set[int] = set()
+    size = 0
+    for value in data.values():
+        if isinstance(value, DataUpdateCoordinator):
+            size += _footprint(value.data, seen)  # The last snapshot
+        else:
+            size += _footprint(value, seen)
+    return size
+
+
+class EosSaunaProfiler:
+    """Temporarily instrument the integration and report where time goes."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the profiler."""
+        self.hass = hass
+        self._stats: dict[str, _Stat] = {}
+        self._restore: list[Callable[[], None]] = []
+        self._lags: list[float] = []
+        self.running = False
+
+    def _patch(self, owner: Any, attr: str, label: str) -> None:
+        """Replace owner.attr with a timing wrapper and remember how to undo it."""
+        original = getattr(owner, attr)
+        owned = attr in vars(owner)
+        stat = self._stats.setdefault(label, _Stat())
+
+        if asyncio.iscoroutinefunction(original):
+
+            @functools.wraps(original)
+            async def wrapper(*args, **kwargs):
+                # Coroutines: CPU time includes other tasks that ran during awaits
+                wall, cpu = time.perf_counter(), time.thread_time()
+                try:
+                    return await original(*args, **kwargs)
+                finally:
+                    stat.add(time.perf_counter() - wall, time.thread_time() - cpu)
+
+        else:
+
+            @functools.wraps(original)
+            def wrapper(*args, **kwargs):
+                wall, cpu = time.perf_counter(), time.thread_time()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    stat.add(time.perf_counter() - wall, time.thread_time() - cpu)
+
+        setattr(owner, attr, wrapper)
+
+        def restore() -> None:
+            if owned:
+                setattr(owner, attr, original)
+            else:
+                delattr(owner, attr)
+
+        self._restore.append(restore)
+
+    def _instrument(self) -> None:
+        """Install wrappers on coordinators, the client and entity classes."""
+        self._patch(EosSaunaApiClient, "_api_wrapper", "EosSaunaApiClient._api_wrapper")
+        self._patch(EosSaunaEntity, "_extract_value", "EosSaunaEntity._extract_value")
+        for cls in {*_subclasses(EosSaunaEntity), *_subclasses(EosSaunaPushEntity)}:
+            self._patch(cls, "async_write_ha_state", f"{cls.__name__}.async_write_ha_state")
+        for data in self.hass.data.get(DOMAIN, {}).values():
+            for name in ("status_coordinator", "settings_coordinator"):
+                coordinator = data[name]
+                self._patch(coordinator, "update_method", f"{name}.update_method")
+                self._patch(coordinator, "async_update_listeners", f"{name}.async_update_listeners")
+
+    def _uninstrument(self) -> None:
+        """Put every original attribute back."""
+        while self._restore:
+            self._restore.pop()()
+
+    async def _async_sample_loop(self) -> None:
+        """Record how late the event loop wakes this task up."""
+        interval = PROFILE_LOOP_SAMPLE_INTERVAL
+        while True:
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            self._lags.append(max(0.0, time.perf_counter() - expected))
+
+    @callback
+    def async_start(self, duration: float) -> None:
+        """Start a profile in the background."""
+        self.running = True
+        self.hass.async_create_background_task(
+            self._async_run(duration), f"{DOMAIN} profile"
+        )
+
+    async def _async_run(self, duration: float) -> str:
+        """Profile for duration seconds; write a report and return its path."""
+        self._stats = {}
+        self._lags = []
+        started = dt_util.utcnow()
+        cpu_started = time.process_time()
+        self._instrument()
+        sampler = asyncio.ensure_future(self._async_sample_loop())
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            sampler.cancel()
+            self._uninstrument()
+            self.running = False
+        cpu_total = time.process_time() - cpu_started
+
+        report, summary = self._report(started, duration, cpu_total)
+        path = self.hass.config.path(
+            DOMAIN, "profiles", f"profile_{started.strftime('%Y%m%dT%H%M%SZ')}.txt"
+        )
+        await self.hass.async_add_executor_job(_write_text, path, report)
+        LOGGER.info(f"Profile written to {path}")
+        persistent_notification.async_create(
+            self.hass,
+            f"{summary}\n\nFull report: `{path}`",
+            title="EOS Sauna Appy profile",
+            notification_id=NOTIFICATION_ID,
+        )
+        return path
+
+    def _report(self, started, duration: float, cpu_total: float) -> tuple[str, str]:
+        """Render the full report and a short summary."""
+        rows = sorted(self._stats.items(), key=lambda item: item[1].wall, reverse=True)
+        lines = [
+            f"EOS Sauna Appy profile started {started.isoformat()} for {duration:.0f} s",
+            f"Process CPU time during profile: {cpu_total * 1000:.1f} ms",
+            "",
+            f"{'function':<55} {'calls':>7} {'wall ms':>10} {'mean ms':>9} {'max ms':>9} {'cpu ms':>10}",
+        ]
+        for label, stat in rows:
+            if not stat.calls:
+                continue
+            lines.append(
+                f"{label:<55} {stat.calls:>7} {stat.wall * 1000:>10.2f} "
+                f"{stat.wall * 1000 / stat.calls:>9.3f} {stat.max_wall * 1000:>9.2f} {stat.cpu * 1000:>10.2f}"
+            )
+
+        lags = sorted(self._lags)
+        if lags:
+            p95 = lags[min(len(lags) - 1, math.ceil(0.95 * len(lags)) - 1)]
+            blocked = sum(1 for lag in lags if lag >= PROFILE_LOOP_BLOCKED_THRESHOLD)
+            loop_line = (
+                f"Event loop: {len(lags)} samples, p95 lag {p95 * 1000:.1f} ms, "
+                f"max lag {lags[-1] * 1000:.1f} ms, {blocked} samples blocked "
+                f">= {PROFILE_LOOP_BLOCKED_THRESHOLD * 1000:.0f} ms"
+            )
+        else:
+            loop_line = "Event loop: no samples"
+        lines.extend(["", loop_line])
+
+        entries = self.hass.data.get(DOMAIN, {})
+        if entries:
+            footprints = {entry_id: _entry_footprint(data) for entry_id, data in entries.items()}
+            mean = sum(footprints.values()) / len(footprints)
+            lines.extend(["", f"Runtime objects per entry: {len(footprints)} entries, mean {mean / 1024:.1f} KiB"])
+            lines.extend(
+                f"  {entry_id:<40} {size / 1024:>8.1f} KiB"
+                for entry_id, size in sorted(footprints.items(), key=lambda item: item[1], reverse=True)
+            )
+
+        top = [
+            f"- `{label}`: {stat.wall * 1000:.1f} ms over {stat.calls} calls"
+            for label, stat in rows[:5]
+            if stat.calls
+        ]
+        summary = "\n".join([f"Profiled for {duration:.0f} s. {loop_line}.", "", *top])
+        return "\n".join(lines) + "\n", summary
+
+
+def _write_text(path: str, text: str) -> None:
+    """Write a text file, creating its directory if needed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
@@ -0,0 +1,219 @@
+"""Re-locate a controller after DHCP gave it a new address.
+
+Every controller gets a fingerprint from its responses: a hash of the keys
+reported by ``/is`` and ``/setdev``, which identifies the controller model and
+firmware. When a sauna configured by IP address stops answering, the subnet
+around its last address is probed concurrently, with a bounded number of
+requests in flight. Only IPv4 addresses are searched. Saunas configured by
+hostname are not searched; their client re-resolves the name after a failed
+request.
+
+The fingerprint is the same for every controller of one model and firmware, so
+it only tells controllers apart from other devices, not from each other. The
+controller reports no serial number or MAC address, so a match is never acted
+on by itself: if exactly one address that no other entry uses answers with the
+same fingerprint, a repair issue asks the user to confirm the new address, and
+the entry is only moved once they do. The fingerprint is recorded once and
+never overwritten: a controller that answers at the configured address with
+another fingerprint is reported as a different one.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import ipaddress
+import time
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .api import EosSaunaApiClient, EosSaunaApiClientError, is_ip_address
+from .const import (
+    DOMAIN,
+    LOGGER,
+    CONF_SAUNA_IP,
+    CONF_FINGERPRINT,
+    DATA_RELOCATE,
+    RELOCATE_AFTER,
+    RELOCATE_COOLDOWN,
+    RELOCATE_PREFIX,
+    RELOCATE_CONCURRENCY,
+    RELOCATE_PROBE_TIMEOUT,
+)
+
+
+def _is_ipv4_address(host: str) -> bool:
+    """Return True if host is an IPv4 address literal."""
+    return is_ip_address(host) and ipaddress.ip_address(host).version == 4
+
+
+def _issue_id(entry: ConfigEntry) -> str:
+    """Return the ID of the repair issue confirming an entry's new address."""
+    return f"controller_moved_{entry.entry_id}"
+
+
+def controller_fingerprint(status: dict, settings: dict) -> str:
+    """Return the fingerprint of a controller from its status and settings."""
+    keys = ",".join(sorted(status)) + "|" + ",".join(sorted(settings))
+    return hashlib.sha1(keys.encode()).hexdigest()[:16]
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession, address: str, fingerprint: str, semaphore: asyncio.Semaphore
+) -> bool:
+    """Return True if a controller with the fingerprint answers at address."""
+    async with semaphore:
+        client = EosSaunaApiClient(address, session)
+        try:
+            status = await client.async_get_status(RELOCATE_PROBE_TIMEOUT)
+            settings = await client.async_get_settings(RELOCATE_PROBE_TIMEOUT)
+        except EosSaunaApiClientError:
+            return False
+    return (
+        isinstance(status, dict)
+        and isinstance(settings, dict)
+        and controller_fingerprint(status, settings) == fingerprint
+    )
+
+
+async def async_find_controller(
+    session: aiohttp.ClientSession, host: str, fingerprint: str, exclude: set[str]
+) -> str | None:
+    """Search the subnet around an IPv4 host; return the single matching address, if any."""
+    if not _is_ipv4_address(host):
+        return None  # An IPv6 /24 is far too large to walk
+    network = ipaddress.ip_network(f"{host}/{RELOCATE_PREFIX}", strict=False)
+    candidates = [str(address) for address in network.hosts() if str(address) not in exclude]
+    semaphore = asyncio.Semaphore(RELOCATE_CONCURRENCY)
+    results = await asyncio.gather(
+        *(_async_probe(session, address, fingerprint, semaphore) for address in candidates)
+    )
+    matches = [address for address, found in zip(candidates, results) if found]
+    if len(matches) > 1:
+        LOGGER.warning(
+            f"Several controllers match the sauna last seen at {host} ({', '.join(matches)}); "
+            "reconfigure it by hand"
+        )
+        return None
+    return matches[0] if matches else None
+
+
+async def async_relocate(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Search for an entry's controller and ask the user to confirm its new address."""
+    host = entry.data[CONF_SAUNA_IP]
+    fingerprint = entry.data.get(CONF_FINGERPRINT)
+    if fingerprint is None or not _is_ipv4_address(host):
+        return False
+    searches: dict[str, float] = hass.data.setdefault(DATA_RELOCATE, {})
+    now = time.monotonic()
+    if now - searches.get(entry.entry_id, -RELOCATE_COOLDOWN) < RELOCATE_COOLDOWN:
+        return False
+    searches[entry.entry_id] = now
+
+    LOGGER.info(f"Sauna at {host} is unreachable, searching {host}/{RELOCATE_PREFIX} for it")
+    exclude = {
+        other.data.get(CONF_SAUNA_IP) for other in hass.config_entries.async_entries(DOMAIN)
+    }
+    address = await async_find_controller(
+        async_get_clientsession(hass), host, fingerprint, exclude
+    )
+    if address is None:
+        LOGGER.info(f"No controller matching the sauna at {host} found")
+        return False
+
+    LOGGER.warning(f"A controller like the sauna at {host} answers at {address}; confirm it in Repairs")
+    ir.async_create_issue(
+        hass,
+        DOMAIN,
+        _issue_id(entry),
+        data={"entry_id": entry.entry_id, "address": address},
+        is_fixable=True,
+        severity=ir.IssueSeverity.WARNING,
+        translation_key="controller_moved",
+        translation_placeholders={"title": entry.title, "host": host, "address": address},
+    )
+    return True
+
+
+@callback
+def async_move_entry(hass: HomeAssistant, entry: ConfigEntry, address: str) -> None:
+    """Move an entry to the address the user confirmed."""
+    LOGGER.warning(f"Sauna moved from {entry.data[CONF_SAUNA_IP]} to {address}, updating its configuration")
+    hass.config_entries.async_update_entry(
+        entry,
+        data={**entry.data, CONF_SAUNA_IP: address},
+        title=f"EOS Sauna ({address})",
+        unique_id=address,
+    )
+    if entry.state is not ConfigEntryState.LOADED:
+        # A loaded entry reloads from its update listener; retry a failed setup now
+        hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
+@callback
+def async_forget_search(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop a search and its repair issue once the controller answers again."""
+    if hass.data.get(DATA_RELOCATE, {}).pop(entry.entry_id, None) is not None:
+        ir.async_delete_issue(hass, DOMAIN, _issue_id(entry))
+
+
+class EosSaunaRelocator:
+    """Start a search when the status coordinator keeps failing."""
+
+    __slots__ = ("hass", "_entry", "_status_coordinator", "_cancel_check")
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, status_coordinator: DataUpdateCoordinator
+    ) -> None:
+        """Initialize the relocator."""
+        self.hass = hass
+        self._entry = entry
+        self._status_coordinator = status_coordinator
+        self._cancel_check: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_handle_update(self) -> None:
+        """Arm a check on the first failed poll, disarm it on success.
+
+        Coordinators only notify listeners when a poll fails after a success,
+        so a timer decides whether the controller stayed unreachable.
+        """
+        if self._status_coordinator.last_update_success:
+            self.async_cancel()
+            async_forget_search(self.hass, self._entry)
+        elif self._cancel_check is None:
+            self._schedule(RELOCATE_AFTER)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel a pending check."""
+        if self._cancel_check is not None:
+            self._cancel_check()
+            self._cancel_check = None
+
+    @callback
+    def _schedule(self, delay: float) -> None:
+        """Check again after delay seconds."""
+        self._cancel_check = async_call_later(self.hass, delay, self._async_check)
+
+    @callback
+    def _async_check(self, _now) -> None:
+        """Search if the controller is still unreachable."""
+        self._cancel_check = None
+        if self._status_coordinator.last_update_success:
+            return
+        self._entry.async_create_background_task(
+            self.hass, self._async_search(), f"{DOMAIN} relocate {self._entry.entry_id}"
+        )
+
+    async def _async_search(self) -> None:
+        """Search once and keep checking while the sauna stays lost."""
+        if not await async_relocate(self.hass, self._entry):
+            if not self._status_coordinator.last_update_success and self._cancel_check is None:
+                self._schedule(RELOCATE_COOLDOWN)
@@ -0,0 +1,37 @@
+"""Repairs for EOS Sauna Appy.
+
+A controller found at a new address is only moved to once the user confirms
+it, because every controller of a model and firmware looks the same.
+"""
+from __future__ import annotations
+
+from homeassistant.components.repairs import ConfirmRepairFlow, RepairsFlow
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResult
+
+from .relocate import async_move_entry
+
+
+class EosSaunaControllerMovedFlow(ConfirmRepairFlow):
+    """Move an entry to the address its controller was found at."""
+
+    def __init__(self, entry_id: str, address: str) -> None:
+        """Initialize the flow."""
+        self._entry_id = entry_id
+        self._address = address
+
+    async def async_step_confirm(self, user_input: dict[str, str] | None = None) -> FlowResult:
+        """Move the entry once the user confirms the new address."""
+        if user_input is not None:
+            entry = self.hass.config_entries.async_get_entry(self._entry_id)
+            if entry is None:
+                return self.async_abort(reason="entry_removed")
+            async_move_entry(self.hass, entry, self._address)
+        return await super().async_step_confirm(user_input)
+
+
+async def async_create_fix_flow(
+    hass: HomeAssistant, issue_id: str, data: dict[str, str | int | float | None] | None
+) -> RepairsFlow:
+    """Create the fix flow of an issue."""
+    return EosSaunaControllerMovedFlow(data["entry_id"], data["address"])
@@ -1,26 +1,371 @@
 """Sensor platform for EOS Sauna Appy."""
+from dataclasses import dataclass, replace
+
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.const import UnitOfTemperature, PERCENTAGE
+from homeassistant.const import UnitOfEnergy, UnitOfTemperature, UnitOfTime, PERCENTAGE
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    LOGGER,
+    CONF_RAW_HISTORY,
+    DEFAULT_RAW_HISTORY,
     API_KEY_CURRENT_TEMP,
     API_KEY_TARGET_TEMP_DESIRED,
     API_KEY_CURRENT_HUMIDITY,
     API_KEY_TARGET_HUMIDITY_DESIRED,
     API_KEY_SAUNA_STATE_ACTUAL,
+    API_KEY_ERROR_CODE,
+    API_KEY_STATUS_R,
+    API_KEY_STATUS_BT,
+    API_KEY_CLOCK_HOUR,
+    API_KEY_CLOCK_MINUTE,
+    API_KEY_REMAINING_MINUTES,
+    API_KEY_REMAINING_SECONDS,
+    API_KEY_HEATER_ON_HOURS,
+    API_KEY_HEATER_ON_MINUTES,
+    API_KEY_HEATER_ON_SECONDS,
+    API_KEY_COLOR_LIGHT_DESIRED,
+    API_KEY_AUTO_HEAT_DESIRED,
+    API_KEY_SAUNA_ON_ACK,
+    API_KEY_START_HOUR_DESIRED,
+    API_KEY_START_MINUTE_DESIRED,
     SAUNA_STATUS_MAP,
-    MANUFACTURER,
-    NAME as INTEGRATION_NAME,
+)
+from .commands import EosSaunaCommandQueue
+from .energy import EosSaunaEnergyEstimator
+from .entity import (
+    SOURCE_COMMANDS,
+    SOURCE_ENERGY,
+    SOURCE_PREHEAT,
+    SOURCE_SESSIONS,
+    SOURCE_SETTINGS,
+    SOURCE_STATISTICS,
+    SOURCE_STATUS,
+    EosSaunaEntity,
+    EosSaunaEntityDescription,
+    EosSaunaPushEntity,
+    clock_value,
+    duration_value,
+    mapped_value,
+    raw_value,
+)
+from .preheat import EosSaunaPreheatPlanner
+from .session import EosSaunaSessionTracker
+from .statistics import (
+    STATISTIC_HUMIDITY,
+    STATISTIC_TEMPERATURE,
+    EosSaunaStatisticsAggregator,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class EosSaunaSensorEntityDescription(EosSaunaEntityDescription, SensorEntityDescription):
+    """Describes an EOS Sauna sensor."""
+
+    statistic: str | None = None # Metric aggregated into long-term statistics
+
+
+def _diagnostic(key: str, name: str, source: str, data_key: str) -> EosSaunaSensorEntityDescription:
+    """Describe a disabled-by-default sensor exposing a raw API key."""
+    return EosSaunaSensorEntityDescription(
+        key=key,
+        name=name,
+        source=source,
+        data_keys=(data_key,),
+        value_fn=raw_value(data_key),
+        unique_id_suffix=data_key,
+        icon="mdi:information-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
+
+
+SENSOR_DESCRIPTIONS: tuple[EosSaunaSensorEntityDescription, ...] = (
+    EosSaunaSensorEntityDescription(
+        key="sauna_status",
+        name="Sauna Status",
+        source=SOURCE_STATUS,
+        data_keys=(API_KEY_SAUNA_STATE_ACTUAL,),
+        value_fn=mapped_value(API_KEY_SAUNA_STATE_ACTUAL, SAUNA_STATUS_MAP),
+        unique_id_suffix=API_KEY_SAUNA_STATE_ACTUAL,
+        icon="mdi:sauna",
+        device_class=SensorDeviceClass.ENUM,
+        options=list(SAUNA_STATUS_MAP.values()),
+    ),
+    EosSaunaSensorEntityDescription(
+        key="current_temperature",
+        name="Current Temperature",
+        source=SOURCE_STATUS,
+        data_keys=(API_KEY_CURRENT_TEMP,),
+        value_fn=raw_value(API_KEY_CURRENT_TEMP),
+        unique_id_suffix=API_KEY_CURRENT_TEMP,
+        statistic=STATISTIC_TEMPERATURE,
+        icon="mdi:thermometer",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    EosSaunaSensorEntityDescription(
+        key="target_temperature",
+        name="Target Temperature",
+        source=SOURCE_SETTINGS,
+        data_keys=(API_KEY_TARGET_TEMP_DESIRED,),
+        value_fn=raw_value(API_KEY_TARGET_TEMP_DESIRED),
+        unique_id_suffix=API_KEY_TARGET_TEMP_DESIRED,
+        icon="mdi:thermometer",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    EosSaunaSensorEntityDescription(
+        key="current_humidity",
+        name="Current Humidity",
+        source=SOURCE_STATUS,
+        data_keys=(API_KEY_CURRENT_HUMIDITY,),
+        value_fn=raw_value(API_KEY_CURRENT_HUMIDITY),
+        unique_id_suffix=API_KEY_CURRENT_HUMIDITY,
+        statistic=STATISTIC_HUMIDITY,
+        icon="mdi:water-percent",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    EosSaunaSensorEntityDescription(
+        key="target_humidity",
+        name="Target Humidity",
+        source=SOURCE_SETTINGS,
+        data_keys=(API_KEY_TARGET_HUMIDITY_DESIRED,),
+        value_fn=raw_value(API_KEY_TARGET_HUMIDITY_DESIRED),
+        unique_id_suffix=API_KEY_TARGET_HUMIDITY_DESIRED,
+        icon="mdi:water-percent",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    # Diagnostic keys from /usr/eos/is
+    _diagnostic("error_code", "Error Code", SOURCE_STATUS, API_KEY_ERROR_CODE),
+    _diagnostic("status_r", "Status R", SOURCE_STATUS, API_KEY_STATUS_R),
+    _diagnostic("status_bt", "Status BT", SOURCE_STATUS, API_KEY_STATUS_BT),
+    EosSaunaSensorEntityDescription(
+        key="controller_clock",
+        name="Controller Clock",
+        source=SOURCE_STATUS,
+        data_keys=(API_KEY_CLOCK_HOUR, API_KEY_CLOCK_MINUTE),
+        value_fn=clock_value(API_KEY_CLOCK_HOUR, API_KEY_CLOCK_MINUTE),
+        unique_id_suffix="TNow",
+        icon="mdi:clock-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    EosSaunaSensorEntityDescription(
+        key="remaining_heating_time",
+        name="Remaining Heating Time",
+        source=SOURCE_STATUS,
+        data_keys=(API_KEY_REMAINING_MINUTES, API_KEY_REMAINING_SECONDS),
+        value_fn=duration_value((API_KEY_REMAINING_MINUTES, 60), (API_KEY_REMAINING_SECONDS, 1)),
+        unique_id_suffix="TAH",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    EosSaunaSensorEntityDescription(
+        key="heater_on_time",
+        name="Heater On Time",
+        source=SOURCE_STATUS,
+        data_keys=(API_KEY_HEATER_ON_HOURS, API_KEY_HEATER_ON_MINUTES, API_KEY_HEATER_ON_SECONDS),
+        value_fn=duration_value(
+            (API_KEY_HEATER_ON_HOURS, 3600),
+            (API_KEY_HEATER_ON_MINUTES, 60),
+            (API_KEY_HEATER_ON_SECONDS, 1),
+        ),
+        unique_id_suffix="THOn",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    # Diagnostic keys from /usr/eos/setdev
+    _diagnostic("color_light_setting", "Color Light Setting", SOURCE_SETTINGS, API_KEY_COLOR_LIGHT_DESIRED),
+    _diagnostic("auto_heat_setting", "Auto Heat Setting", SOURCE_SETTINGS, API_KEY_AUTO_HEAT_DESIRED),
+    _diagnostic("sauna_on_ack", "Sauna On Acknowledge", SOURCE_SETTINGS, API_KEY_SAUNA_ON_ACK),
+    EosSaunaSensorEntityDescription(
+        key="preset_start_time",
+        name="Preset Start Time",
+        source=SOURCE_SETTINGS,
+        data_keys=(API_KEY_START_HOUR_DESIRED, API_KEY_START_MINUTE_DESIRED),
+        value_fn=clock_value(API_KEY_START_HOUR_DESIRED, API_KEY_START_MINUTE_DESIRED),
+        unique_id_suffix="TSt",
+        icon="mdi:clock-start",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+
+def _session(key: str, name: str, field: str, **kwargs) -> EosSaunaSensorEntityDescription:
+    """Describe a sensor reading one field of the last finished session."""
+    return EosSaunaSensorEntityDescription(
+        key=key,
+        name=name,
+        source=SOURCE_SESSIONS,
+        data_keys=(field,),
+        value_fn=raw_value(field),
+        unique_id_suffix=f"session_{field}",
+        **kwargs,
+    )
+
+
+SESSION_SENSOR_DESCRIPTIONS: tuple[EosSaunaSensorEntityDescription, ...] = (
+    EosSaunaSensorEntityDescription(
+        key="last_session_start",
+        name="Last Session Start",
+        source=SOURCE_SESSIONS,
+        data_keys=("start",),
+        value_fn=lambda session: dt_util.utc_from_timestamp(session["start"]),
+        unique_id_suffix="session_start",
+        icon="mdi:calendar-clock",
+        device_class=SensorDeviceClass.TIMESTAMP,
+    ),
+    EosSaunaSensorEntityDescription(
+        key="last_session_duration",
+        name="Last Session Duration",
+        source=SOURCE_SESSIONS,
+        data_keys=("start", "end"),
+        value_fn=lambda session: session["end"] - session["start"],
+        unique_id_suffix="session_duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+    ),
+    _session(
+        "last_session_time_to_target",
+        "Last Session Time To Target",
+        "time_to_target",
+        icon="mdi:timer-check-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+    ),
+    _session(
+        "last_session_peak_temperature",
+        "Last Session Peak Temperature",
+        "peak_temperature",
+        icon="mdi:thermometer-high",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    _session(
+        "last_session_mean_temperature",
+        "Last Session Mean Temperature",
+        "mean_temperature",
+        icon="mdi:thermometer",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        entity_registry_enabled_default=False,
+    ),
+    _session(
+        "last_session_mean_humidity",
+        "Last Session Mean Humidity",
+        "mean_humidity",
+        icon="mdi:water-percent",
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+    ),
+    _session(
+        "last_session_vapor_time",
+        "Last Session Vapor Time",
+        "vapor_time",
+        icon="mdi:water-boiler",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        entity_registry_enabled_default=False,
+    ),
+    _session(
+        "last_session_faults",
+        "Last Session Faults",
+        "faults",
+        icon="mdi:alert-circle-outline",
+        entity_registry_enabled_default=False,
+    ),
+)
+
+
+PREHEAT_SENSOR_DESCRIPTIONS: tuple[EosSaunaSensorEntityDescription, ...] = (
+    EosSaunaSensorEntityDescription(
+        key="scheduled_preheat_start",
+        name="Scheduled Preheat Start",
+        source=SOURCE_PREHEAT,
+        unique_id_suffix="preheat_start",
+        icon="mdi:calendar-start",
+        device_class=SensorDeviceClass.TIMESTAMP,
+    ),
+)
+
+
+ENERGY_SENSOR_DESCRIPTIONS: tuple[EosSaunaSensorEntityDescription, ...] = (
+    EosSaunaSensorEntityDescription(
+        key="energy",
+        name="Energy",
+        source=SOURCE_ENERGY,
+        value_fn=lambda energy: round(energy.energy_kwh, 3),
+        unique_id_suffix="energy",
+        icon="mdi:lightning-bolt",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=2,
+    ),
+    EosSaunaSensorEntityDescription(
+        key="heater_duty_cycle",
+        name="Heater Duty Cycle",
+        source=SOURCE_ENERGY,
+        value_fn=lambda energy: energy.duty_cycle,
+        unique_id_suffix="heater_duty_cycle",
+        icon="mdi:percent-circle-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    EosSaunaSensorEntityDescription(
+        key="heater_runtime",
+        name="Heater Runtime",
+        source=SOURCE_ENERGY,
+        value_fn=lambda energy: round(energy.heater_seconds),
+        unique_id_suffix="heater_runtime",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.HOURS,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+
+COMMAND_SENSOR_DESCRIPTIONS: tuple[EosSaunaSensorEntityDescription, ...] = (
+    EosSaunaSensorEntityDescription(
+        key="queued_commands",
+        name="Queued Commands",
+        source=SOURCE_COMMANDS,
+        unique_id_suffix="queued_commands",
+        icon="mdi:tray-full",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
 )
 
 
@@ -29,94 +374,130 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     data = hass.data[DOMAIN][entry.entry_id]
-    status_coordinator = data["status_coordinator"]
-    settings_coordinator = data["settings_coordinator"]
-    client = data["client"] # Though not directly used by sensors, good to have if needed
-
-    sensors = [
-        EosSaunaStatusSensor(status_coordinator, entry, "Sauna Status", API_KEY_SAUNA_STATE_ACTUAL),
-        EosSaunaTemperatureSensor(status_coordinator, entry, "Current Temperature", API_KEY_CURRENT_TEMP, False),
-        EosSaunaTemperatureSensor(settings_coordinator, entry, "Target Temperature", API_KEY_TARGET_TEMP_DESIRED, True),
-        EosSaunaHumiditySensor(status_coordinator, entry, "Current Humidity", API_KEY_CURRENT_HUMIDITY, False),
-        EosSaunaHumiditySensor(settings_coordinator, entry, "Target Humidity", API_KEY_TARGET_HUMIDITY_DESIRED, True),
-    ]
+    raw_history = entry.options.get(CONF_RAW_HISTORY, DEFAULT_RAW_HISTORY)
+    sensors: list[SensorEntity] = []
+    for description in SENSOR_DESCRIPTIONS:
+        if description.statistic and not raw_history:
+            # Report the 5-minute mean instead of every poll; long-term
+            # statistics come from the aggregator, not the recorder compiler.
+            sensors.append(
+                EosSaunaDownsampledSensor(
+                    data[SOURCE_STATISTICS], entry, replace(description, state_class=None)
+                )
+            )
+        else:
+            sensors.append(EosSaunaSensor(data[description.source], entry, description))
+    sensors.extend(
+        EosSaunaSessionSensor(data[description.source], entry, description)
+        for description in SESSION_SENSOR_DESCRIPTIONS
+    )
+    sensors.extend(
+        EosSaunaPreheatSensor(data[description.source], entry, description)
+        for description in PREHEAT_SENSOR_DESCRIPTIONS
+    )
+    sensors.extend(
+        EosSaunaEnergySensor(data[description.source], entry, description)
+        for description in ENERGY_SENSOR_DESCRIPTIONS
+    )
+    sensors.extend(
+        EosSaunaCommandQueueSensor(data[description.source], entry, description)
+        for description in COMMAND_SENSOR_DESCRIPTIONS
+    )
     async_add_entities(sensors)
 
 
-class EosSaunaBaseSensor(CoordinatorEntity, SensorEntity):
-    """Base class for EOS Sauna sensors."""
-
-    def __init__(self, coordinator, config_entry: ConfigEntry, name_suffix: str, data_key: str, is_setting: bool):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._data_key = data_key
-        self._name_suffix = name_suffix
-        self._is_setting = is_setting # Differentiates between actual status and desired setting sensors
+class EosSaunaSensor(EosSaunaEntity, SensorEntity):
+    """Representation of an EOS Sauna sensor."""
 
-        self._attr_name = f"{INTEGRATION_NAME} {self._config_entry.data.get('sauna_ip', '')} {name_suffix}"
-        self._attr_unique_id = f"{config_entry.entry_id}_{data_key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": f"{INTEGRATION_NAME} ({config_entry.data.get('sauna_ip', '')})",
-            "manufacturer": MANUFACTURER,
-            "model": "Web API Controlled Sauna", # Can be improved if model info is available
-        }
+    entity_description: EosSaunaSensorEntityDescription
 
     @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return super().available and self.coordinator.data is not None and self._data_key in self.coordinator.data
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._extract_value()
+
+
+class EosSaunaSessionSensor(EosSaunaPushEntity, SensorEntity):
+    """Representation of a statistic of the last finished sauna session."""
+
+    entity_description: EosSaunaSensorEntityDescription
+    _source: EosSaunaSessionTracker
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if self.coordinator.data and self._data_key in self.coordinator.data:
-            return self.coordinator.data[self._data_key]
-        return None
+        session = self._source.last_session
+        if session is None or any(session.get(key) is None for key in self.entity_description.data_keys):
+            return None
+        return self.entity_description.value_fn(session)
+
+
+class EosSaunaDownsampledSensor(EosSaunaPushEntity, SensorEntity):
+    """Representation of a measurement reported once per 5-minute bucket."""
+
+    entity_description: EosSaunaSensorEntityDescription
+    _source: EosSaunaStatisticsAggregator
 
+    @property
+    def native_value(self):
+        """Return the mean of the last finished 5-minute bucket."""
+        return self._source.last_short_mean(self.entity_description.statistic)
 
-class EosSaunaStatusSensor(EosSaunaBaseSensor):
-    """Representation of the Sauna Status sensor."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry, name_suffix: str, data_key: str):
-        """Initialize the status sensor."""
-        super().__init__(coordinator, config_entry, name_suffix, data_key, False)
-        self._attr_icon = "mdi:sauna"
-        self._attr_device_class = SensorDeviceClass.ENUM
-        self._attr_options = list(SAUNA_STATUS_MAP.values())
+class EosSaunaPreheatSensor(EosSaunaPushEntity, SensorEntity):
+    """Representation of the start time of a scheduled preheat."""
 
+    entity_description: EosSaunaSensorEntityDescription
+    _source: EosSaunaPreheatPlanner
 
     @property
     def native_value(self):
-        """Return the state of the sensor."""
-        raw_status = super().native_value
-        if raw_status is not None:
-            return SAUNA_STATUS_MAP.get(raw_status, f"Unknown ({raw_status})")
-        return "Unknown"
+        """Return when the scheduled preheat switches the sauna on."""
+        return self._source.scheduled_start
 
 
-class EosSaunaTemperatureSensor(EosSaunaBaseSensor):
-    """Representation of a Sauna Temperature sensor."""
+class EosSaunaEnergySensor(EosSaunaPushEntity, RestoreSensor):
+    """Representation of an estimated heater energy or runtime total."""
 
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
+    entity_description: EosSaunaSensorEntityDescription
+    _source: EosSaunaEnergyEstimator
 
-    def __init__(self, coordinator, config_entry: ConfigEntry, name_suffix: str, data_key: str, is_setting: bool):
-        """Initialize the temperature sensor."""
-        super().__init__(coordinator, config_entry, name_suffix, data_key, is_setting)
-        self._attr_icon = "mdi:thermometer"
+    # Description key -> estimator total that must not drop below the last state
+    _RESTORED_TOTALS = {"energy": "energy_kwh", "heater_runtime": "heater_seconds"}
 
+    async def async_added_to_hass(self) -> None:
+        """Keep the estimator's total at least at the last reported value."""
+        await super().async_added_to_hass()
+        attribute = self._RESTORED_TOTALS.get(self.entity_description.key)
+        if attribute is None:
+            return
+        last = await self.async_get_last_sensor_data()
+        if last is None or last.native_value is None:
+            return
+        try:
+            value = float(last.native_value)
+        except (TypeError, ValueError):
+            return
+        self._source.async_restore_minimum(attribute, value)
+
+    @property
+    def native_value(self):
+        """Return the estimate."""
+        return self.entity_description.value_fn(self._source)
 
-class EosSaunaHumiditySensor(EosSaunaBaseSensor):
-    """Representation of a Sauna Humidity sensor."""
 
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.HUMIDITY
-    _attr_state_class = SensorStateClass.MEASUREMENT
+class EosSaunaCommandQueueSensor(EosSaunaPushEntity, SensorEntity):
+    """Representation of the commands waiting for an unreachable controller."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry, name_suffix: str, data_key: str, is_setting: bool):
-        """Initialize the humidity sensor."""
-        super().__init__(coordinator, config_entry, name_suffix, data_key, is_setting)
-        self._attr_icon = "mdi:water-percent"
\ No newline at end of file
+    entity_description: EosSaunaSensorEntityDescription
+    _source: EosSaunaCommandQueue
+
+    @property
+    def native_value(self):
+        """Return the number of queued commands."""
+        return len(self._source)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the queued and recently expired commands."""
+        return {"queued": self._source.queued, "expired": self._source.expired}
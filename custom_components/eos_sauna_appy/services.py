@@ -0,0 +1,333 @@
+"""Services for EOS Sauna Appy."""
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .bulk import async_apply
+from .profiler import EosSaunaProfiler
+from .const import (
+    DOMAIN,
+    SERVICE_APPLY,
+    SERVICE_PREHEAT,
+    SERVICE_CANCEL_PREHEAT,
+    SERVICE_PROFILE,
+    DATA_PROFILER,
+    PROFILE_DEFAULT_DURATION,
+    PROFILE_MAX_DURATION,
+    SERVICE_GET_SESSIONS,
+    SERVICE_START_CAPTURE,
+    SERVICE_STOP_CAPTURE,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_SINCE,
+    ATTR_LIMIT,
+    ATTR_INTERVAL,
+    ATTR_DURATION,
+    ATTR_SAUNA_ON,
+    ATTR_TARGET_TEMPERATURE,
+    ATTR_TARGET_HUMIDITY,
+    ATTR_VAPORIZER_ON,
+    ATTR_LIGHT_ON,
+    ATTR_LIGHT_INTENSITY,
+    ATTR_READY_AT,
+    API_KEY_CONTROL_SAUNA_ONOFF,
+    API_KEY_CONTROL_TARGET_TEMP,
+    API_KEY_CONTROL_TARGET_HUMIDITY,
+    API_KEY_CONTROL_VAPOR_ONOFF,
+    API_KEY_CONTROL_LIGHT_ONOFF,
+    API_KEY_CONTROL_LIGHT_INTENSITY,
+    CAPTURE_INTERVAL,
+    CAPTURE_MAX_DURATION,
+    PREHEAT_MAX_AHEAD,
+)
+
+# Service field -> control key of /usr/eos/setcld
+APPLY_FIELDS = {
+    ATTR_SAUNA_ON: API_KEY_CONTROL_SAUNA_ONOFF,
+    ATTR_TARGET_TEMPERATURE: API_KEY_CONTROL_TARGET_TEMP,
+    ATTR_TARGET_HUMIDITY: API_KEY_CONTROL_TARGET_HUMIDITY,
+    ATTR_VAPORIZER_ON: API_KEY_CONTROL_VAPOR_ONOFF,
+    ATTR_LIGHT_ON: API_KEY_CONTROL_LIGHT_ONOFF,
+    ATTR_LIGHT_INTENSITY: API_KEY_CONTROL_LIGHT_INTENSITY,
+}
+
+GET_SESSIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_SINCE): cv.datetime,
+        vol.Optional(ATTR_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+START_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_INTERVAL, default=CAPTURE_INTERVAL): vol.All(
+            cv.time_period, vol.Range(min=timedelta(milliseconds=200))
+        ),
+        vol.Optional(ATTR_DURATION, default=CAPTURE_MAX_DURATION): vol.All(
+            cv.time_period, vol.Range(max=CAPTURE_MAX_DURATION)
+        ),
+    }
+)
+
+STOP_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+APPLY_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_SAUNA_ON): cv.boolean,
+            vol.Optional(ATTR_TARGET_TEMPERATURE): vol.All(vol.Coerce(int), vol.Range(min=30, max=115)),
+            vol.Optional(ATTR_TARGET_HUMIDITY): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(ATTR_VAPORIZER_ON): cv.boolean,
+            vol.Optional(ATTR_LIGHT_ON): cv.boolean,
+            vol.Optional(ATTR_LIGHT_INTENSITY): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        }
+    ),
+    cv.has_at_least_one_key(*APPLY_FIELDS),
+)
+
+PREHEAT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_READY_AT): vol.Any(cv.time, cv.datetime),
+        vol.Required(ATTR_TARGET_TEMPERATURE): vol.All(vol.Coerce(int), vol.Range(min=30, max=115)),
+        vol.Optional(ATTR_VAPORIZER_ON): cv.boolean,
+    }
+)
+
+CANCEL_PREHEAT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=PROFILE_DEFAULT_DURATION): vol.All(
+            cv.time_period,
+            vol.Range(min=timedelta(seconds=1), max=PROFILE_MAX_DURATION),
+        ),
+    }
+)
+
+
+def _selected_entries(hass: HomeAssistant, call: ServiceCall) -> dict[str, dict]:
+    """Return the runtime data of the config entries a service call targets."""
+    loaded = hass.data.get(DOMAIN, {})
+    entry_ids = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_ids is None:
+        return dict(loaded)
+    unknown = [entry_id for entry_id in entry_ids if entry_id not in loaded]
+    if unknown:
+        raise ServiceValidationError(f"Unknown or unloaded config entries: {', '.join(unknown)}")
+    return {entry_id: loaded[entry_id] for entry_id in entry_ids}
+
+
+def _format_timestamps(session: dict) -> dict:
+    """Render the start/end timestamps of a session as ISO strings."""
+    for key in ("start", "end"):
+        session[key] = dt_util.utc_from_timestamp(session[key]).isoformat()
+    return session
+
+
+async def _async_get_sessions(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return the stored session history of the selected saunas."""
+    since = call.data.get(ATTR_SINCE)
+    if since is not None:
+        since = dt_util.as_utc(since).timestamp()
+    limit = call.data.get(ATTR_LIMIT)
+    return {
+        "sessions": {
+            entry_id: [
+                _format_timestamps(session)
+                for session in data["sessions"].sessions(since, limit)
+            ]
+            for entry_id, data in _selected_entries(hass, call).items()
+        }
+    }
+
+
+async def _async_start_capture(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Start a burst capture on the selected saunas."""
+    for data in _selected_entries(hass, call).values():
+        data["capture"].async_start(call.data[ATTR_INTERVAL], call.data[ATTR_DURATION])
+
+
+async def _async_stop_capture(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Stop burst captures and return the files they were written to."""
+    return {
+        "files": {
+            entry_id: await data["capture"].async_stop()
+            for entry_id, data in _selected_entries(hass, call).items()
+        }
+    }
+
+
+async def _async_apply(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Send one merged control payload to each selected sauna concurrently."""
+    payload = {
+        key: int(call.data[field])
+        for field, key in APPLY_FIELDS.items()
+        if field in call.data
+    }
+    return {"results": await async_apply(_selected_entries(hass, call), payload)}
+
+
+def _ready_at(value: time | datetime) -> datetime:
+    """Resolve a ready time to an aware datetime; bare times mean the next occurrence."""
+    now = dt_util.now()
+    if isinstance(value, time):
+        ready_at = datetime.combine(now.date(), value, tzinfo=now.tzinfo)
+        if ready_at <= now:
+            ready_at += timedelta(days=1)
+        return ready_at
+    ready_at = value if value.tzinfo is not None else value.replace(tzinfo=now.tzinfo)
+    if ready_at <= now:
+        raise ServiceValidationError(f"Ready time {ready_at.isoformat()} has already passed")
+    if ready_at - now > PREHEAT_MAX_AHEAD:
+        raise ServiceValidationError(
+            f"Ready time {ready_at.isoformat()} is more than {PREHEAT_MAX_AHEAD.days} days ahead"
+        )
+    return ready_at
+
+
+async def _async_preheat(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Schedule the selected saunas to reach a temperature by a given time."""
+    ready_at = _ready_at(call.data[ATTR_READY_AT])
+    return {
+        "plans": {
+            entry_id: data["preheat"].async_plan(
+                ready_at,
+                call.data[ATTR_TARGET_TEMPERATURE],
+                call.data.get(ATTR_VAPORIZER_ON),
+            )
+            for entry_id, data in _selected_entries(hass, call).items()
+        }
+    }
+
+
+async def _async_cancel_preheat(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Cancel scheduled preheats of the selected saunas."""
+    for data in _selected_entries(hass, call).values():
+        data["preheat"].async_cancel()
+
+
+async def _async_profile(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Profile the integration in the background for the requested duration."""
+    profiler = hass.data.get(DATA_PROFILER)
+    if profiler is None:
+        profiler = hass.data[DATA_PROFILER] = EosSaunaProfiler(hass)
+    if profiler.running:
+        raise ServiceValidationError("A profile is already running")
+    profiler.async_start(call.data[ATTR_DURATION].total_seconds())
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+    if hass.services.has_service(DOMAIN, SERVICE_GET_SESSIONS):
+        return
+
+    async def get_sessions(call: ServiceCall) -> ServiceResponse:
+        return await _async_get_sessions(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SESSIONS,
+        get_sessions,
+        schema=GET_SESSIONS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def start_capture(call: ServiceCall) -> None:
+        await _async_start_capture(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_CAPTURE,
+        start_capture,
+        schema=START_CAPTURE_SCHEMA,
+    )
+
+    async def stop_capture(call: ServiceCall) -> ServiceResponse:
+        return await _async_stop_capture(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_CAPTURE,
+        stop_capture,
+        schema=STOP_CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def apply(call: ServiceCall) -> ServiceResponse:
+        return await _async_apply(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY,
+        apply,
+        schema=APPLY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def preheat(call: ServiceCall) -> ServiceResponse:
+        return await _async_preheat(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PREHEAT,
+        preheat,
+        schema=PREHEAT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def cancel_preheat(call: ServiceCall) -> None:
+        await _async_cancel_preheat(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CANCEL_PREHEAT,
+        cancel_preheat,
+        schema=CANCEL_PREHEAT_SCHEMA,
+    )
+
+    async def profile(call: ServiceCall) -> None:
+        await _async_profile(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        profile,
+        schema=PROFILE_SCHEMA,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration's services."""
+    for service in (
+        SERVICE_GET_SESSIONS,
+        SERVICE_START_CAPTURE,
+        SERVICE_STOP_CAPTURE,
+        SERVICE_APPLY,
+        SERVICE_PREHEAT,
+        SERVICE_CANCEL_PREHEAT,
+        SERVICE_PROFILE,
+    ):
+        hass.services.async_remove(DOMAIN, service)
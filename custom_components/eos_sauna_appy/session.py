@@ -0,0 +1,267 @@
+"""Incremental sauna session tracking for EOS Sauna Appy.
+
+A session starts when the sauna is switched on (``Sxd``) or reports a heating
+mode (``S``) and ends when both drop back to inactive. Statistics are folded in
+sample by sample on every status poll, so a finished session is a single
+compact row in a Store rather than a recorder query over raw history.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    API_KEY_SAUNA_STATE_ACTUAL,
+    API_KEY_SAUNA_STATE_DESIRED,
+    API_KEY_VAPOR_STATE_DESIRED,
+    API_KEY_CURRENT_TEMP,
+    API_KEY_CURRENT_HUMIDITY,
+    API_KEY_TARGET_TEMP_DESIRED,
+    SAUNA_STATES_HEATING,
+    SAUNA_STATES_FAULT,
+    SESSION_RETENTION,
+    SESSION_STORAGE_VERSION,
+    SESSION_SAVE_DELAY,
+)
+
+# Column order of a stored session row
+SESSION_FIELDS = (
+    "start",
+    "end",
+    "target",
+    "time_to_target",
+    "peak_temperature",
+    "mean_temperature",
+    "peak_humidity",
+    "mean_humidity",
+    "vapor_time",
+    "faults",
+)
+
+
+def _as_float(value: Any) -> float | None:
+    """Return value as float, or None if it cannot be parsed."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _ActiveSession:
+    """Running statistics of the session in progress."""
+
+    __slots__ = (
+        "start",
+        "last",
+        "target",
+        "time_to_target",
+        "peak_temperature",
+        "temperature_sum",
+        "temperature_count",
+        "peak_humidity",
+        "humidity_sum",
+        "humidity_count",
+        "vapor_time",
+        "faults",
+        "in_fault",
+    )
+
+    def __init__(self, now: float) -> None:
+        """Start a session at the given timestamp."""
+        self.start = now
+        self.last = now
+        self.target: float | None = None
+        self.time_to_target: float | None = None
+        self.peak_temperature: float | None = None
+        self.temperature_sum = 0.0
+        self.temperature_count = 0
+        self.peak_humidity: float | None = None
+        self.humidity_sum = 0.0
+        self.humidity_count = 0
+        self.vapor_time = 0.0
+        self.faults = 0
+        self.in_fault = False
+
+    def add_sample(
+        self,
+        now: float,
+        temperature: float | None,
+        humidity: float | None,
+        target: float | None,
+        vapor_on: bool,
+        fault: bool,
+    ) -> None:
+        """Fold one status sample into the running statistics."""
+        elapsed = now - self.last
+        self.last = now
+        if vapor_on:
+            self.vapor_time += elapsed
+        if fault and not self.in_fault:
+            self.faults += 1
+        self.in_fault = fault
+
+        if target is not None:
+            self.target = target
+        if temperature is not None:
+            self.temperature_sum += temperature
+            self.temperature_count += 1
+            if self.peak_temperature is None or temperature > self.peak_temperature:
+                self.peak_temperature = temperature
+            if (
+                self.time_to_target is None
+                and self.target is not None
+                and temperature >= self.target
+            ):
+                self.time_to_target = now - self.start
+        if humidity is not None:
+            self.humidity_sum += humidity
+            self.humidity_count += 1
+            if self.peak_humidity is None or humidity > self.peak_humidity:
+                self.peak_humidity = humidity
+
+    def to_row(self) -> list:
+        """Return the finished session as a compact storage row."""
+        return [
+            round(self.start),
+            round(self.last),
+            self.target,
+            None if self.time_to_target is None else round(self.time_to_target),
+            self.peak_temperature,
+            None
+            if not self.temperature_count
+            else round(self.temperature_sum / self.temperature_count, 1),
+            self.peak_humidity,
+            None
+            if not self.humidity_count
+            else round(self.humidity_sum / self.humidity_count, 1),
+            round(self.vapor_time),
+            self.faults,
+        ]
+
+
+def row_to_dict(row: list) -> dict[str, Any]:
+    """Expand a stored session row into a dict keyed by SESSION_FIELDS."""
+    return dict(zip(SESSION_FIELDS, row))
+
+
+class EosSaunaSessionTracker:
+    """Detect sauna sessions and keep a bounded history of their statistics."""
+
+    __slots__ = (
+        "_status_coordinator",
+        "_settings_coordinator",
+        "_store",
+        "_sessions",
+        "_active",
+        "_listeners",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        status_coordinator: DataUpdateCoordinator,
+        settings_coordinator: DataUpdateCoordinator,
+    ) -> None:
+        """Initialize the tracker."""
+        self._status_coordinator = status_coordinator
+        self._settings_coordinator = settings_coordinator
+        self._store: Store = Store(
+            hass, SESSION_STORAGE_VERSION, f"{DOMAIN}.sessions.{entry_id}"
+        )
+        self._sessions: list[list] = []
+        self._active: _ActiveSession | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    async def async_load(self) -> None:
+        """Load the stored session history."""
+        stored = await self._store.async_load()
+        if stored:
+            self._sessions = stored.get("sessions", [])
+
+    @property
+    def active(self) -> bool:
+        """Return True while a session is in progress."""
+        return self._active is not None
+
+    @property
+    def last_session(self) -> dict[str, Any] | None:
+        """Return the most recent finished session."""
+        if not self._sessions:
+            return None
+        return row_to_dict(self._sessions[-1])
+
+    def sessions(self, since: float | None = None, limit: int | None = None) -> list[dict[str, Any]]:
+        """Return finished sessions, newest last."""
+        rows = self._sessions
+        if since is not None:
+            rows = [row for row in rows if row[0] >= since]
+        if limit is not None:
+            rows = rows[-limit:] if limit else []
+        return [row_to_dict(row) for row in rows]
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for finished sessions."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_handle_update(self) -> None:
+        """Process the latest status poll."""
+        status = self._status_coordinator.data
+        if not self._status_coordinator.last_update_success or not status:
+            return
+        settings = self._settings_coordinator.data or {}
+
+        state = status.get(API_KEY_SAUNA_STATE_ACTUAL)
+        switched_on = str(settings.get(API_KEY_SAUNA_STATE_DESIRED)) == "1"
+        running = switched_on or state in SAUNA_STATES_HEATING
+        now = dt_util.utcnow().timestamp()
+
+        if self._active is None:
+            if not running:
+                return
+            self._active = _ActiveSession(now)
+            LOGGER.debug("Sauna session started")
+
+        self._active.add_sample(
+            now,
+            _as_float(status.get(API_KEY_CURRENT_TEMP)),
+            _as_float(status.get(API_KEY_CURRENT_HUMIDITY)),
+            _as_float(settings.get(API_KEY_TARGET_TEMP_DESIRED)),
+            str(settings.get(API_KEY_VAPOR_STATE_DESIRED)) == "1",
+            state in SAUNA_STATES_FAULT,
+        )
+
+        if not running:
+            self._finish_session()
+
+    @callback
+    def _finish_session(self) -> None:
+        """Append the active session to the history and persist it."""
+        row = self._active.to_row()
+        self._active = None
+        self._sessions.append(row)
+        del self._sessions[:-SESSION_RETENTION]
+        LOGGER.debug(f"Sauna session finished: {row_to_dict(row)}")
+        self._store.async_delay_save(self._data_to_save, SESSION_SAVE_DELAY)
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {"sessions": self._sessions}
@@ -0,0 +1,272 @@
+"""Downsampled long-term statistics for EOS Sauna Appy.
+
+Polled temperature and humidity samples are folded into 5-minute buckets in
+memory, the 5-minute buckets are rolled up into hourly buckets, and finished
+hours are imported into the recorder as external statistics in one bulk call
+per metric. Home Assistant only accepts hourly rows for external statistics,
+so the 5-minute buckets are what the downsampled sensors report instead.
+
+The open buckets are saved to a Store when the entry unloads and when Home
+Assistant stops, and restored on setup, so a restart or reload in the middle of
+an hour does not lose the samples of that hour.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    NAME as INTEGRATION_NAME,
+    API_KEY_CURRENT_TEMP,
+    API_KEY_CURRENT_HUMIDITY,
+    STATISTICS_SHORT_PERIOD,
+    STATISTICS_LONG_PERIOD,
+    STATISTICS_STORAGE_VERSION,
+)
+
+STATISTIC_TEMPERATURE = "temperature"
+STATISTIC_HUMIDITY = "humidity"
+
+# metric -> (API key, unit)
+STATISTIC_METRICS = {
+    STATISTIC_TEMPERATURE: (API_KEY_CURRENT_TEMP, UnitOfTemperature.CELSIUS),
+    STATISTIC_HUMIDITY: (API_KEY_CURRENT_HUMIDITY, PERCENTAGE),
+}
+
+
+def _period_start(now: datetime, period: timedelta) -> datetime:
+    """Return the start of the period containing now."""
+    seconds = int(period.total_seconds())
+    timestamp = int(now.timestamp())
+    return dt_util.utc_from_timestamp(timestamp - timestamp % seconds)
+
+
+class _Bucket:
+    """Mean/min/max accumulator for one period."""
+
+    __slots__ = ("start", "count", "total", "min", "max")
+
+    def __init__(self, start: datetime) -> None:
+        """Open an empty bucket."""
+        self.start = start
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, value: float) -> None:
+        """Add a single sample."""
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: _Bucket) -> None:
+        """Fold a finer bucket into this one."""
+        self.count += other.count
+        self.total += other.total
+        if other.min < self.min:
+            self.min = other.min
+        if other.max > self.max:
+            self.max = other.max
+
+    @property
+    def mean(self) -> float:
+        """Return the sample-weighted mean."""
+        return self.total / self.count
+
+    def as_list(self) -> list:
+        """Return the bucket in its stored form."""
+        return [self.start.isoformat(), self.count, self.total, self.min, self.max]
+
+    @classmethod
+    def from_list(cls, stored: list) -> _Bucket:
+        """Return a bucket from its stored form."""
+        bucket = cls(dt_util.parse_datetime(stored[0]))
+        bucket.count, bucket.total, bucket.min, bucket.max = stored[1:]
+        return bucket
+
+
+class EosSaunaStatisticsAggregator:
+    """Aggregate polled samples and import them as long-term statistics."""
+
+    __slots__ = (
+        "hass",
+        "_status_coordinator",
+        "_sauna_name",
+        "_object_id",
+        "_store",
+        "_short",
+        "_long",
+        "_pending",
+        "_last_short",
+        "_listeners",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        sauna_name: str,
+        status_coordinator: DataUpdateCoordinator,
+    ) -> None:
+        """Initialize the aggregator."""
+        self.hass = hass
+        self._status_coordinator = status_coordinator
+        self._sauna_name = sauna_name
+        self._object_id = entry_id.lower()
+        self._store: Store = Store(
+            hass, STATISTICS_STORAGE_VERSION, f"{DOMAIN}.statistics.{entry_id}"
+        )
+        self._short: dict[str, _Bucket] = {}
+        self._long: dict[str, _Bucket] = {}
+        self._pending: dict[str, list[_Bucket]] = {metric: [] for metric in STATISTIC_METRICS}
+        self._last_short: dict[str, _Bucket] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    async def async_load(self) -> None:
+        """Restore the buckets that were open when the entry last unloaded."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        for buckets, key in ((self._short, "short"), (self._long, "long")):
+            for metric, bucket in stored.get(key, {}).items():
+                if metric in STATISTIC_METRICS:
+                    buckets[metric] = _Bucket.from_list(bucket)
+
+    async def async_unload(self) -> None:
+        """Write the open buckets out; the next poll closes any that have ended."""
+        await self._store.async_save(self._data_to_save())
+
+    def statistic_id(self, metric: str) -> str:
+        """Return the external statistic ID of a metric."""
+        return f"{DOMAIN}:{self._object_id}_{metric}"
+
+    def last_short_mean(self, metric: str) -> float | None:
+        """Return the mean of the most recently finished 5-minute bucket."""
+        bucket = self._last_short.get(metric)
+        return None if bucket is None else round(bucket.mean, 1)
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for finished 5-minute buckets."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_handle_update(self) -> None:
+        """Fold the latest status poll into the open buckets."""
+        status = self._status_coordinator.data
+        if not self._status_coordinator.last_update_success or not status:
+            return
+        now = dt_util.utcnow()
+        short_start = _period_start(now, STATISTICS_SHORT_PERIOD)
+        long_start = _period_start(now, STATISTICS_LONG_PERIOD)
+        short_closed = False
+
+        for metric, (key, _unit) in STATISTIC_METRICS.items():
+            try:
+                value = float(status[key])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            short = self._short.get(metric)
+            if short is not None and short.start != short_start:
+                self._close_short(metric, short)
+                short_closed = True
+                short = None
+            if short is None:
+                short = self._short[metric] = _Bucket(short_start)
+            short.add(value)
+
+            long = self._long.get(metric)
+            if long is not None and long.start != long_start:
+                self._pending[metric].append(long)
+                del self._long[metric]
+
+        if short_closed:
+            # Saved at the latest one period later, so a save is almost always
+            # pending and the Store's final write on shutdown covers it
+            self._store.async_delay_save(
+                self._data_to_save, STATISTICS_SHORT_PERIOD.total_seconds()
+            )
+            for update_callback in list(self._listeners):
+                update_callback()
+        if any(self._pending.values()):
+            self._import_pending()
+
+    def _close_short(self, metric: str, short: _Bucket) -> None:
+        """Roll a finished 5-minute bucket up into its hourly bucket."""
+        self._last_short[metric] = short
+        long_start = _period_start(short.start, STATISTICS_LONG_PERIOD)
+        long = self._long.get(metric)
+        if long is not None and long.start != long_start:
+            self._pending[metric].append(long)
+            long = None
+        if long is None:
+            long = self._long[metric] = _Bucket(long_start)
+        long.merge(short)
+
+    @callback
+    def _import_pending(self) -> None:
+        """Import all finished hourly buckets in one call per metric."""
+        if "recorder" not in self.hass.config.components:
+            for buckets in self._pending.values():
+                buckets.clear()
+            return
+        # Imported lazily so the integration still loads without the recorder
+        from homeassistant.components.recorder.models import (
+            StatisticData,
+            StatisticMetaData,
+        )
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        for metric, buckets in self._pending.items():
+            if not buckets:
+                continue
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{INTEGRATION_NAME} {self._sauna_name} {metric.capitalize()}",
+                source=DOMAIN,
+                statistic_id=self.statistic_id(metric),
+                unit_of_measurement=STATISTIC_METRICS[metric][1],
+            )
+            statistics = [
+                StatisticData(
+                    start=bucket.start,
+                    mean=bucket.mean,
+                    min=bucket.min,
+                    max=bucket.max,
+                )
+                for bucket in buckets
+            ]
+            LOGGER.debug(f"Importing {len(statistics)} hourly {metric} statistics for {self._sauna_name}")
+            async_add_external_statistics(self.hass, metadata, statistics)
+            buckets.clear()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the open buckets to persist."""
+        return {
+            "short": {metric: bucket.as_list() for metric, bucket in self._short.items()},
+            "long": {metric: bucket.as_list() for metric, bucket in self._long.items()},
+        }
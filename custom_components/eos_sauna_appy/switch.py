@@ -1,20 +1,62 @@
 """Switch platform for EOS Sauna Appy."""
-import asyncio
-from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from homeassistant.components.switch import (
+    SwitchDeviceClass,
+    SwitchEntity,
+    SwitchEntityDescription,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
     LOGGER,
     API_KEY_SAUNA_STATE_DESIRED, # Sxd
     API_KEY_VAPOR_STATE_DESIRED, # Vxd
-    MANUFACTURER,
-    NAME as INTEGRATION_NAME,
 )
-from .api import EosSaunaApiClient
+from .api import EosSaunaApiClient, EosSaunaApiCommandQueued
+from .entity import (
+    SOURCE_SETTINGS,
+    EosSaunaEntity,
+    EosSaunaEntityDescription,
+    onoff_value,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class EosSaunaSwitchEntityDescription(EosSaunaEntityDescription, SwitchEntityDescription):
+    """Describes an EOS Sauna switch."""
+
+    set_fn: Callable[[EosSaunaApiClient, bool], Awaitable[dict]]
+
+
+SWITCH_DESCRIPTIONS: tuple[EosSaunaSwitchEntityDescription, ...] = (
+    EosSaunaSwitchEntityDescription(
+        key="sauna_power",
+        name="Sauna Power",
+        source=SOURCE_SETTINGS,
+        data_keys=(API_KEY_SAUNA_STATE_DESIRED,),
+        value_fn=onoff_value(API_KEY_SAUNA_STATE_DESIRED),
+        unique_id_suffix=f"{API_KEY_SAUNA_STATE_DESIRED}_switch",
+        set_fn=lambda client, is_on: client.async_set_sauna_onoff(is_on),
+        icon="mdi:radiator", # Using radiator icon as a generic heater
+        device_class=SwitchDeviceClass.SWITCH,
+    ),
+    EosSaunaSwitchEntityDescription(
+        key="vaporizer_power",
+        name="Vaporizer Power",
+        source=SOURCE_SETTINGS,
+        data_keys=(API_KEY_VAPOR_STATE_DESIRED,),
+        value_fn=onoff_value(API_KEY_VAPOR_STATE_DESIRED),
+        unique_id_suffix=f"{API_KEY_VAPOR_STATE_DESIRED}_switch",
+        set_fn=lambda client, is_on: client.async_set_vapor_onoff(is_on),
+        icon="mdi:water-boiler", # Using water-boiler for vaporizer
+        device_class=SwitchDeviceClass.SWITCH,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -22,86 +64,44 @@ async def async_setup_entry(
 ) -> None:
     """Set up the switch platform."""
     data = hass.data[DOMAIN][entry.entry_id]
-    # Switches will use the settings_coordinator to reflect the desired state
+    # Switches use the settings_coordinator to reflect the desired state
     # and the client to send commands.
-    settings_coordinator = data["settings_coordinator"]
-    client = data["client"]
-
-    switches = [
-        EosSaunaControlSwitch(
-            settings_coordinator,
-            entry,
-            client,
-            "Sauna Power",
-            API_KEY_SAUNA_STATE_DESIRED,
-            client.async_set_sauna_onoff,
-            "mdi:radiator" # Using radiator icon as a generic heater
-        ),
-        EosSaunaControlSwitch(
-            settings_coordinator,
-            entry,
-            client,
-            "Vaporizer Power",
-            API_KEY_VAPOR_STATE_DESIRED,
-            client.async_set_vapor_onoff,
-            "mdi:water-boiler" # Using water-boiler for vaporizer
-        ),
-    ]
-    async_add_entities(switches)
-
-
-class EosSaunaControlSwitch(CoordinatorEntity, SwitchEntity):
+    async_add_entities(
+        EosSaunaControlSwitch(data[description.source], entry, data["client"], description)
+        for description in SWITCH_DESCRIPTIONS
+    )
+
+
+class EosSaunaControlSwitch(EosSaunaEntity, SwitchEntity):
     """Representation of an EOS Sauna control switch."""
 
-    _attr_device_class = SwitchDeviceClass.SWITCH
+    entity_description: EosSaunaSwitchEntityDescription
 
     def __init__(
         self,
         coordinator,
         config_entry: ConfigEntry,
         client: EosSaunaApiClient,
-        name_suffix: str,
-        data_key: str,
-        turn_on_off_service_call, # e.g., client.async_set_sauna_onoff
-        icon: str = "mdi:toggle-switch"
+        description: EosSaunaSwitchEntityDescription,
     ):
         """Initialize the switch."""
-        super().__init__(coordinator) # Using settings_coordinator
-        self._config_entry = config_entry
+        super().__init__(coordinator, config_entry, description)
         self._client = client
-        self._data_key = data_key # This key comes from /usr/eos/setdev
-        self._turn_on_off_service_call = turn_on_off_service_call
-        self._attr_icon = icon
-
-        self._attr_name = f"{INTEGRATION_NAME} {self._config_entry.data.get('sauna_ip', '')} {name_suffix}"
-        self._attr_unique_id = f"{config_entry.entry_id}_{data_key}_switch"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": f"{INTEGRATION_NAME} ({config_entry.data.get('sauna_ip', '')})",
-            "manufacturer": MANUFACTURER,
-            "model": "Web API Controlled Sauna",
-        }
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return super().available and self.coordinator.data is not None and self._data_key in self.coordinator.data
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        if self.coordinator.data and self._data_key in self.coordinator.data:
-            # API uses "1" for ON and "0" for OFF for these desired states
-            return str(self.coordinator.data[self._data_key]) == "1"
-        return None
+        return self._extract_value()
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the entity on."""
         LOGGER.debug(f"Turning ON {self.name} via API call.")
         try:
-            await self._turn_on_off_service_call(True)
+            await self.entity_description.set_fn(self._client, True)
             # After sending command, refresh the coordinator that holds the desired state
             await self.coordinator.async_request_refresh()
+        except EosSaunaApiCommandQueued as e:
+            LOGGER.warning(f"Could not turn ON {self.name} now: {e}")
         except Exception as e:
             LOGGER.error(f"Error turning ON {self.name}: {e}")
 
@@ -109,10 +109,9 @@ class EosSaunaControlSwitch(CoordinatorEntity, SwitchEntity):
         """Turn the entity off."""
         LOGGER.debug(f"Turning OFF {self.name} via API call.")
         try:
-            await self._turn_on_off_service_call(False)
-            # Add a small delay to allow the device to process the command
-            # before refreshing its state.
-            await asyncio.sleep(5) # Wait 5 seconds
+            await self.entity_description.set_fn(self._client, False)
             await self.coordinator.async_request_refresh()
+        except EosSaunaApiCommandQueued as e:
+            LOGGER.warning(f"Could not turn OFF {self.name} now: {e}")
         except Exception as e:
-            LOGGER.error(f"Error turning OFF {self.name}: {e}")
\ No newline at end of file
+            LOGGER.error(f"Error turning OFF {self.name}: {e}")
@@ -0,0 +1 @@
+"""Tests for the EOS Sauna Appy integration."""
@@ -0,0 +1,47 @@
+"""Cost budgets for every user action and poll cycle.
+
+Each budget is the most HTTP requests, entity state writes and wall time an
+action may cost against the zero-latency fake controller. A change that needs
+more fails the tests; raise a budget only together with the change that
+justifies it.
+"""
+from typing import NamedTuple
+
+
+class Budget(NamedTuple):
+    """Maximum cost of one action."""
+
+    requests: int
+    state_writes: int
+    seconds: float
+
+
+# Entities enabled by default that are written on every poll of a coordinator
+SETTINGS_ENTITIES = 8  # 2 target sensors, 2 switches, light, 2 numbers, climate
+STATUS_ENTITIES = 3  # Sauna status, current temperature and humidity
+
+# One setcld POST, then one setdev GET to read the desired state back; measured
+# 2 requests, 8 writes and at most 5 ms
+COMMAND = Budget(requests=2, state_writes=SETTINGS_ENTITIES, seconds=0.05)
+
+BUDGETS: dict[str, Budget] = {
+    "switch_on": COMMAND,
+    "switch_off": COMMAND,
+    "light_on_brightness": COMMAND,
+    "light_off": COMMAND,
+    "set_temperature": COMMAND,
+    "set_humidity": COMMAND,
+    "hvac_mode_heat": COMMAND,
+    "hvac_mode_off": COMMAND,
+    # One /is and one /setdev poll; measured 2 requests, 11 writes and at most 2.3 ms
+    "idle_poll": Budget(requests=2, state_writes=SETTINGS_ENTITIES + STATUS_ENTITIES, seconds=0.025),
+}
+
+# Per-entry budgets of the scale test, with SCALE_ENTRIES saunas set up at once.
+# Measured 297-298 KiB, 211-244 ms setup and 3.2-5.0 ms per poll cycle; setup runs
+# under tracemalloc and the test harness's asyncio debug mode and is mostly
+# HA's entity platform setup.
+SCALE_ENTRIES = 200
+ENTRY_MEMORY_BYTES = 384 * 1024  # Everything allocated for an entry, HA's registries included
+ENTRY_SETUP_SECONDS = 0.3
+ENTRY_POLL_SECONDS = 0.01  # Event loop time of one status and one settings poll
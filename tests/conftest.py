@@ -0,0 +1,57 @@
+"""Fixtures for the EOS Sauna Appy tests."""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Generator
+from unittest.mock import patch
+
+import pytest
+
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from .fake_controller import FakeController, async_setup_sauna
+
+HOST = "192.0.2.10"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from custom_components."""
+    yield
+
+
+@pytest.fixture
+def expected_lingering_timers() -> bool:
+    """Allow refresh debouncer and delayed Store timers to outlive a test."""
+    return True
+
+
+@pytest.fixture
+def controller(aioclient_mock: AiohttpClientMocker) -> FakeController:
+    """Return a fake controller at HOST."""
+    return FakeController(aioclient_mock, HOST)
+
+
+@pytest.fixture
+async def sauna(hass: HomeAssistant, controller: FakeController) -> AsyncGenerator:
+    """Set up a sauna against the fake controller and unload it afterwards."""
+    entry = await async_setup_sauna(hass, HOST)
+    yield entry
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.fixture
+def state_writes() -> Generator[list[str], None, None]:
+    """Record the entity ID of every entity state write."""
+    writes: list[str] = []
+    original = Entity.async_write_ha_state
+
+    def _async_write_ha_state(self: Entity) -> None:
+        writes.append(self.entity_id)
+        original(self)
+
+    with patch.object(Entity, "async_write_ha_state", _async_write_ha_state):
+        yield writes
@@ -0,0 +1,111 @@
+"""Counting fake EOS controller for the tests.
+
+The controller answers ``/is``, ``/setdev`` and ``setcld`` through Home
+Assistant's aiohttp client mock, applies control values to its settings the
+way the real web module does and counts every request per endpoint.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.eos_sauna_appy.const import (
+    DOMAIN,
+    CONF_SAUNA_IP,
+    API_ENDPOINT_STATUS,
+    API_ENDPOINT_SETTINGS,
+    API_ENDPOINT_CONTROL,
+    CONTROL_TO_DESIRED,
+)
+
+# An idle sauna at room temperature
+STATUS = {
+    "S": 0,
+    "L": 0,
+    "T": 21,
+    "H": 40,
+    "E": 0,
+    "R": 0,
+    "BT": 0,
+    "TNowH": 18,
+    "TNowM": 30,
+    "TAHM": 0,
+    "TAHS": 0,
+    "THOnH": 0,
+    "THOnM": 0,
+    "THOnS": 0,
+}
+SETTINGS = {
+    "Sxd": 0,
+    "Lxd": 0,
+    "Vxd": 0,
+    "Ld": 50,
+    "Td": 80,
+    "Hd": 40,
+    "Cxd": 0,
+    "AHxd": 0,
+    "SOnAck": 0,
+    "TStHd": 0,
+    "TStMd": 0,
+}
+
+
+class FakeController:
+    """A controller reachable at one IP address."""
+
+    def __init__(self, aioclient_mock: AiohttpClientMocker, host: str) -> None:
+        """Register the controller's endpoints with the client mock."""
+        self.host = host
+        self.status: dict[str, Any] = dict(STATUS)
+        self.settings: dict[str, Any] = dict(SETTINGS)
+        self.requests: Counter[str] = Counter()
+        base_url = f"http://{host}"
+        aioclient_mock.get(f"{base_url}{API_ENDPOINT_STATUS}", side_effect=self._async_status)
+        aioclient_mock.get(f"{base_url}{API_ENDPOINT_SETTINGS}", side_effect=self._async_settings)
+        aioclient_mock.post(f"{base_url}{API_ENDPOINT_CONTROL}", side_effect=self._async_control)
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests since the last reset."""
+        return sum(self.requests.values())
+
+    def reset(self) -> None:
+        """Forget the requests counted so far."""
+        self.requests.clear()
+
+    async def _async_status(self, method, url, data) -> AiohttpClientMockResponse:
+        self.requests[API_ENDPOINT_STATUS] += 1
+        return AiohttpClientMockResponse(method, url, json=dict(self.status))
+
+    async def _async_settings(self, method, url, data) -> AiohttpClientMockResponse:
+        self.requests[API_ENDPOINT_SETTINGS] += 1
+        return AiohttpClientMockResponse(method, url, json=dict(self.settings))
+
+    async def _async_control(self, method, url, data) -> AiohttpClientMockResponse:
+        self.requests[API_ENDPOINT_CONTROL] += 1
+        for key, value in data.items():
+            self.settings[CONTROL_TO_DESIRED[key]] = value
+        return AiohttpClientMockResponse(method, url, json=dict(self.settings))
+
+
+async def async_setup_sauna(hass: HomeAssistant, host: str, **options: Any) -> MockConfigEntry:
+    """Add and set up a config entry for the sauna at host."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=f"EOS Sauna ({host})",
+        data={CONF_SAUNA_IP: host},
+        options=options,
+        unique_id=host,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
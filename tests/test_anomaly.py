@@ -0,0 +1,89 @@
+"""Slow-heating detection of the anomaly detector on simulated heat-ups."""
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.eos_sauna_appy.anomaly import ANOMALY_SLOW_HEATING, EosSaunaAnomalyDetector
+from custom_components.eos_sauna_appy.const import EVENT_ANOMALY
+
+TARGET = 80.0
+EQUILIBRIUM = 120.0  # Where the heater would level off without the thermostat
+HEATING_COEFFICIENT = 0.016  # Per minute, of the remaining gap to EQUILIBRIUM
+POLL_SECONDS = 10.0
+
+
+class Cabin:
+    """A cabin heating up to TARGET, read in whole degrees every poll."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cabin and a detector fed by it."""
+        self.detector = EosSaunaAnomalyDetector(hass, "entry", MagicMock(), MagicMock())
+        self.now = 0.0
+
+    def heat_up(self, output: Callable[[int], float]) -> list[bool]:
+        """Heat up from 20 °C with output(poll) of the normal heater power.
+
+        Returns whether slow heating was flagged after each poll, then lets the
+        heater switch off and pauses long enough to start the next heat-up cold.
+        """
+        temperature = 20.0
+        flagged = []
+        for poll in itertools.count():
+            temperature += output(poll) * HEATING_COEFFICIENT * (EQUILIBRIUM - temperature) * POLL_SECONDS / 60
+            self._poll(temperature, heating=True)
+            if TARGET - round(temperature) <= 5:
+                break
+            flagged.append(ANOMALY_SLOW_HEATING in self.detector.anomalies)
+        # Hold at the target until the heater goes off
+        for _ in range(30):
+            self._poll(temperature, heating=True)
+        self._poll(temperature, heating=False)
+        self.now += 3600
+        return flagged
+
+    def _poll(self, temperature: float, heating: bool) -> None:
+        self.now += POLL_SECONDS
+        self.detector._update(self.now, float(round(temperature)), TARGET, heating)
+
+
+async def test_slowly_degrading_heater_is_reported_once(hass: HomeAssistant) -> None:
+    """A heater fading during a heat-up raises slow heating once and keeps it."""
+    events = async_capture_events(hass, EVENT_ANOMALY)
+    cabin = Cabin(hass)
+    for _ in range(3):
+        assert not any(cabin.heat_up(lambda poll: 1.0))
+
+    # Output fades to a quarter over the first hour of the heat-up
+    flagged = cabin.heat_up(lambda poll: max(0.25, 1 - poll / 400))
+    await hass.async_block_till_done()
+
+    raised = flagged.index(True)
+    assert all(flagged[raised:])
+    assert [event.data["type"] for event in events if event.data["type"] == ANOMALY_SLOW_HEATING] == [
+        ANOMALY_SLOW_HEATING
+    ]
+    assert ANOMALY_SLOW_HEATING not in cabin.detector.anomalies
+
+    # The faded heat-up did not lower the learned baseline
+    assert not any(cabin.heat_up(lambda poll: 1.0))
+
+
+async def test_slow_heating_clears_when_the_heater_recovers(hass: HomeAssistant) -> None:
+    """Slow heating is latched while the heater is weak and clears once it recovers."""
+    cabin = Cabin(hass)
+    for _ in range(3):
+        cabin.heat_up(lambda poll: 1.0)
+
+    flagged = cabin.heat_up(lambda poll: 0.3 if 100 <= poll < 400 else 1.0)
+
+    raised = flagged.index(True)
+    cleared = flagged.index(False, raised)
+    assert 100 < raised < 400 < cleared
+    assert all(flagged[raised:cleared])
+    assert not any(flagged[cleared:])
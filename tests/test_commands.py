@@ -0,0 +1,22 @@
+"""Persistence of the outbound command queue."""
+from __future__ import annotations
+
+from typing import Any
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.eos_sauna_appy.const import API_KEY_CONTROL_TARGET_TEMP, DOMAIN
+
+
+async def test_queue_is_written_on_unload(
+    hass: HomeAssistant, sauna: MockConfigEntry, hass_storage: dict[str, Any]
+) -> None:
+    """A command queued just before an unload is stored without waiting for the save delay."""
+    commands = hass.data[DOMAIN][sauna.entry_id]["commands"]
+    commands.async_enqueue({API_KEY_CONTROL_TARGET_TEMP: 85})
+
+    assert await hass.config_entries.async_unload(sauna.entry_id)
+    stored = hass_storage[f"{DOMAIN}.commands.{sauna.entry_id}"]["data"]
+    assert stored["commands"][API_KEY_CONTROL_TARGET_TEMP][0] == 85
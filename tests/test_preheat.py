@@ -0,0 +1,56 @@
+"""Validation and scheduling of the preheat service."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.util.dt as dt_util
+
+from custom_components.eos_sauna_appy.const import (
+    DOMAIN,
+    ATTR_READY_AT,
+    ATTR_TARGET_TEMPERATURE,
+    PREHEAT_MAX_AHEAD,
+    SERVICE_PREHEAT,
+    SERVICE_CANCEL_PREHEAT,
+)
+
+
+async def _async_preheat(hass: HomeAssistant, ready_at) -> dict:
+    """Call the preheat service and return its response."""
+    return await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PREHEAT,
+        {ATTR_READY_AT: ready_at.isoformat(), ATTR_TARGET_TEMPERATURE: 80},
+        blocking=True,
+        return_response=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "ahead", [timedelta(minutes=-1), PREHEAT_MAX_AHEAD + timedelta(hours=1)], ids=["past", "too_far"]
+)
+async def test_preheat_rejects_ready_times_it_cannot_keep(
+    hass: HomeAssistant, sauna, ahead: timedelta
+) -> None:
+    """A ready time in the past or beyond PREHEAT_MAX_AHEAD schedules nothing."""
+    with pytest.raises(ServiceValidationError):
+        await _async_preheat(hass, dt_util.now() + ahead)
+    assert hass.data[DOMAIN][sauna.entry_id]["preheat"].scheduled_start is None
+
+
+async def test_preheat_schedules_a_start(hass: HomeAssistant, sauna) -> None:
+    """A valid ready time schedules a start ahead of it."""
+    ready_at = dt_util.now() + timedelta(hours=3)
+    response = await _async_preheat(hass, ready_at)
+
+    plan = response["plans"][sauna.entry_id]
+    start = dt_util.parse_datetime(plan["start_at"])
+    assert dt_util.utcnow() < start < ready_at
+    assert hass.data[DOMAIN][sauna.entry_id]["preheat"].scheduled_start == start
+
+    await hass.services.async_call(DOMAIN, SERVICE_CANCEL_PREHEAT, {}, blocking=True)
+    assert hass.data[DOMAIN][sauna.entry_id]["preheat"].scheduled_start is None
@@ -0,0 +1,61 @@
+"""Re-locating a controller that DHCP gave a new address."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from homeassistant.components.repairs import repairs_flow_manager
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.setup import async_setup_component
+
+from custom_components.eos_sauna_appy.const import DOMAIN, CONF_SAUNA_IP, CONF_FINGERPRINT
+from custom_components.eos_sauna_appy.relocate import async_relocate, controller_fingerprint
+
+from .conftest import HOST
+from .fake_controller import SETTINGS, STATUS, FakeController
+
+NEW_HOST = "192.0.2.9"
+
+
+async def test_new_address_is_only_used_once_confirmed(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A matching controller raises a repair issue; the entry moves once it is confirmed."""
+    assert await async_setup_component(hass, "repairs", {})
+    assert await async_setup_component(hass, DOMAIN, {})
+    FakeController(aioclient_mock, NEW_HOST)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=f"EOS Sauna ({HOST})",
+        data={CONF_SAUNA_IP: HOST, CONF_FINGERPRINT: controller_fingerprint(STATUS, SETTINGS)},
+        unique_id=HOST,
+    )
+    entry.add_to_hass(hass)
+
+    # Search HOST/30, which holds only HOST and NEW_HOST
+    with patch("custom_components.eos_sauna_appy.relocate.RELOCATE_PREFIX", 30):
+        assert await async_relocate(hass, entry)
+    issue_id = f"controller_moved_{entry.entry_id}"
+    issue = ir.async_get(hass).async_get_issue(DOMAIN, issue_id)
+    assert issue is not None
+    assert issue.translation_placeholders["address"] == NEW_HOST
+    assert entry.data[CONF_SAUNA_IP] == HOST
+
+    flow_manager = repairs_flow_manager(hass)
+    result = await flow_manager.async_init(DOMAIN, data={"issue_id": issue_id})
+    assert result["step_id"] == "confirm"
+    result = await flow_manager.async_configure(result["flow_id"], {})
+    assert result["type"] == "create_entry"
+    await hass.async_block_till_done()
+
+    assert entry.data[CONF_SAUNA_IP] == NEW_HOST
+    assert entry.unique_id == NEW_HOST
+    assert entry.state is ConfigEntryState.LOADED
+    assert ir.async_get(hass).async_get_issue(DOMAIN, issue_id) is None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
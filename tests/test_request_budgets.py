@@ -0,0 +1,95 @@
+"""Request, state-write and wall-time budgets of user actions and polls."""
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.eos_sauna_appy.const import DOMAIN
+
+from .budgets import BUDGETS
+from .fake_controller import FakeController
+
+
+def _entity_id(hass: HomeAssistant, entry, platform: str, suffix: str) -> str:
+    """Return the entity ID of one of the entry's entities."""
+    entity_id = er.async_get(hass).async_get_entity_id(platform, DOMAIN, f"{entry.entry_id}_{suffix}")
+    assert entity_id is not None
+    return entity_id
+
+
+def _service(platform: str, service: str, suffix: str, **data) -> Callable:
+    """Return an action calling an entity service on one of the sauna's entities."""
+
+    async def _async_call(hass: HomeAssistant, entry) -> None:
+        await hass.services.async_call(
+            platform,
+            service,
+            {"entity_id": _entity_id(hass, entry, platform, suffix), **data},
+            blocking=True,
+        )
+
+    return _async_call
+
+
+async def _async_idle_poll(hass: HomeAssistant, entry) -> None:
+    """Run one poll of each coordinator."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    await data["status_coordinator"].async_refresh()
+    await data["settings_coordinator"].async_refresh()
+
+
+ACTIONS: dict[str, Callable[[HomeAssistant, object], Awaitable[None]]] = {
+    "switch_on": _service("switch", "turn_on", "Sxd_switch"),
+    "switch_off": _service("switch", "turn_off", "Sxd_switch"),
+    "light_on_brightness": _service("light", "turn_on", "light", brightness=204),
+    "light_off": _service("light", "turn_off", "light"),
+    "set_temperature": _service("climate", "set_temperature", "climate", temperature=85),
+    "set_humidity": _service("number", "set_value", "Hd_number", value=60),
+    "hvac_mode_heat": _service("climate", "set_hvac_mode", "climate", hvac_mode="heat"),
+    "hvac_mode_off": _service("climate", "set_hvac_mode", "climate", hvac_mode="off"),
+    "idle_poll": _async_idle_poll,
+}
+
+
+def test_every_action_has_a_budget() -> None:
+    """Budgets and actions stay in step."""
+    assert ACTIONS.keys() == BUDGETS.keys()
+
+
+@pytest.mark.parametrize("action", ACTIONS)
+async def test_action_within_budget(
+    hass: HomeAssistant,
+    sauna,
+    controller: FakeController,
+    state_writes: list[str],
+    action: str,
+) -> None:
+    """An action costs no more requests, state writes or time than budgeted."""
+    budget = BUDGETS[action]
+    controller.reset()
+    state_writes.clear()
+
+    started = time.perf_counter()
+    await ACTIONS[action](hass, sauna)
+    await hass.async_block_till_done()
+    elapsed = time.perf_counter() - started
+
+    assert controller.total_requests <= budget.requests, dict(controller.requests)
+    assert len(state_writes) <= budget.state_writes, state_writes
+    assert elapsed <= budget.seconds
+
+
+async def test_commands_reach_the_controller(
+    hass: HomeAssistant, sauna, controller: FakeController
+) -> None:
+    """The budgeted actions do send their values."""
+    await ACTIONS["light_on_brightness"](hass, sauna)
+    await ACTIONS["set_temperature"](hass, sauna)
+    assert controller.settings["Lxd"] == 1
+    assert controller.settings["Ld"] == 80
+    assert controller.settings["Td"] == 85
@@ -0,0 +1,72 @@
+"""Scale harness: many saunas against fake controllers.
+
+Sets up SCALE_ENTRIES entries, then reports and checks memory and setup time
+per entry and event loop time per poll cycle against tests/budgets.py. Run
+``pytest tests/test_scale.py -s`` to see the measurements.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+import tracemalloc
+
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.eos_sauna_appy.const import DOMAIN
+
+from .budgets import (
+    SCALE_ENTRIES,
+    ENTRY_MEMORY_BYTES,
+    ENTRY_SETUP_SECONDS,
+    ENTRY_POLL_SECONDS,
+)
+from .fake_controller import FakeController, async_setup_sauna
+
+
+def _host(index: int) -> str:
+    """Return the address of the index-th fake controller."""
+    return f"10.0.{index // 250}.{index % 250 + 1}"
+
+
+async def test_many_entries_within_budget(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Memory, setup time and poll time per entry stay within budget."""
+    controllers = [FakeController(aioclient_mock, _host(index)) for index in range(SCALE_ENTRIES)]
+
+    tracemalloc.start()
+    try:
+        memory_before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        entries = [await async_setup_sauna(hass, controller.host) for controller in controllers]
+        setup_seconds = (time.perf_counter() - started) / SCALE_ENTRIES
+        memory_per_entry = (tracemalloc.get_traced_memory()[0] - memory_before) / SCALE_ENTRIES
+    finally:
+        tracemalloc.stop()
+
+    coordinators = [
+        data[name]
+        for data in hass.data[DOMAIN].values()
+        for name in ("status_coordinator", "settings_coordinator")
+    ]
+    for controller in controllers:
+        controller.reset()
+    started = time.perf_counter()
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+    await hass.async_block_till_done()
+    poll_seconds = (time.perf_counter() - started) / SCALE_ENTRIES
+
+    print(
+        f"\n{SCALE_ENTRIES} entries: {memory_per_entry / 1024:.1f} KiB, "
+        f"setup {setup_seconds * 1000:.1f} ms and poll cycle {poll_seconds * 1000:.2f} ms per entry"
+    )
+    assert all(controller.total_requests == 2 for controller in controllers)
+    assert memory_per_entry <= ENTRY_MEMORY_BYTES
+    assert setup_seconds <= ENTRY_SETUP_SECONDS
+    assert poll_seconds <= ENTRY_POLL_SECONDS
+
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,49 @@
+"""Downsampling of temperature and humidity into long-term statistics."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.eos_sauna_appy.const import DOMAIN
+
+from .conftest import HOST
+from .fake_controller import FakeController, async_setup_sauna
+
+
+async def test_open_hour_survives_a_reload(
+    hass: HomeAssistant,
+    controller: FakeController,
+    freezer: FrozenDateTimeFactory,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Samples of the open hour are saved on unload and rolled up after setup."""
+    freezer.move_to(datetime(2024, 3, 1, 12, 1, tzinfo=timezone.utc))
+    entry: MockConfigEntry = await async_setup_sauna(hass, HOST)
+    status_coordinator = hass.data[DOMAIN][entry.entry_id]["status_coordinator"]
+    await status_coordinator.async_refresh()
+    await status_coordinator.async_refresh()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    stored = hass_storage[f"{DOMAIN}.statistics.{entry.entry_id}"]["data"]
+    assert stored["short"]["temperature"][:2] == ["2024-03-01T12:00:00+00:00", 2]
+    assert stored["long"] == {}
+
+    # The first poll in the next 5 minutes rolls the restored bucket into the hour
+    freezer.move_to(datetime(2024, 3, 1, 12, 7, tzinfo=timezone.utc))
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    status_coordinator = hass.data[DOMAIN][entry.entry_id]["status_coordinator"]
+    await status_coordinator.async_refresh()
+    statistics = hass.data[DOMAIN][entry.entry_id]["statistics"]
+    assert statistics.last_short_mean("temperature") is not None
+    assert statistics._long["temperature"].count == 2
+    assert statistics._short["temperature"].count == 1
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()